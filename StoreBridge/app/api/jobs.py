@@ -1,15 +1,29 @@
 """Job API routes."""
 
+import base64
+import json
+import logging
+import math
 import uuid
-from typing import Any, Dict, Optional
+from datetime import datetime
+from typing import Any, Dict, Literal, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import get_db
 from app.models import Job, JobStatus, JobType
+from app.redis_client import get_redis
+from app.services.job_counters import JobCounters
+from app.services.job_events import JobEventPublisher, JobProgress, channel, stream_job_events
+from app.services.outbox import relay_outbox, stage_task
+from app.services.quota_ledger import QuotaLedger, estimate_job_calls
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
@@ -21,7 +35,14 @@ class JobConfig(BaseModel):
     filter: Optional[Dict[str, Any]] = Field(None, description="Filter criteria")
     limit: Optional[int] = Field(None, description="Max items to import")
     auto_register: bool = Field(True, description="Auto-register without manual review")
-    priority: str = Field("normal", description="Job priority (normal, high, urgent)")
+    priority: Literal["normal", "high", "urgent"] = Field(
+        "normal", description="Job priority (normal, high, urgent)"
+    )
+    ingest: Literal["upsert", "copy"] = Field(
+        "upsert",
+        description="How imports write products: 'copy' streams them through COPY "
+        "into a staging table (initial onboarding of a large catalog)",
+    )
 
 
 class CreateJobRequest(BaseModel):
@@ -66,12 +87,18 @@ async def create_job(
                 "type": "IMPORT",
                 "status": "PENDING",
                 "total_count": 0,
-                "estimated_duration_minutes": 15
+                "estimated_duration_minutes": 15,
+                "quota_estimate": {"domeggook": 1, "naver": 200},
+                "scheduled_for": None  # or when the next quota window starts
             }
         }
+
+    Raises:
+        HTTPException: 429 if the job fits neither today's nor tomorrow's quota
     """
     # Create job record
     job = Job(
+        id=uuid.uuid4(),
         type=request.type,
         status=JobStatus.PENDING,
         config=request.config.model_dump(),
@@ -80,13 +107,31 @@ async def create_job(
         failed_count=0,
     )
 
+    # Stage the Celery task with the job, so a committed job always runs
+    task_name = (
+        "app.workers.tasks.import_products_task"
+        if job.type == JobType.IMPORT
+        else "app.workers.tasks.sync_products_task"
+    )
+    ledger = QuotaLedger(redis_client=get_redis())
+    estimate = estimate_job_calls(job.type, job.config)
+    not_before = await _admit(ledger, str(job.id), estimate)
+
     db.add(job)
-    await db.commit()
+    stage_task(db, task_name, [str(job.id)], not_before=not_before)
+    try:
+        await db.commit()
+    except Exception:
+        await ledger.release(str(job.id))
+        raise
     await db.refresh(job)
 
-    # Enqueue Celery task to process job
-    from app.workers.tasks import import_products_task
-    import_products_task.delay(str(job.id))
+    # Publish it now; the periodic relay retries if the broker is unavailable
+    try:
+        await relay_outbox(db)
+    except Exception as e:
+        logger.warning(f"Outbox relay failed for job {job.id}: {e}")
+        await db.rollback()
 
     return {
         "success": True,
@@ -95,11 +140,92 @@ async def create_job(
             "type": job.type.value,
             "status": job.status.value,
             "total_count": job.total_count,
-            "estimated_duration_minutes": 15,  # TODO: Calculate based on config
+            "estimated_duration_minutes": _estimated_duration_minutes(request.config),
+            "quota_estimate": estimate,
+            "scheduled_for": not_before.isoformat() if not_before else None,
         },
     }
 
 
+async def _admit(ledger: QuotaLedger, job_id: str, estimate: Dict[str, int]) -> Optional[datetime]:
+    """
+    Reserve a job's estimated API calls in today's quota window, else tomorrow's.
+
+    Args:
+        ledger: Quota ledger
+        job_id: Job UUID string
+        estimate: Provider -> calls
+
+    Returns:
+        None to start now, or when the next window starts
+
+    Raises:
+        HTTPException: 429 if neither window has room
+    """
+    if not settings.quota_admission_enabled:
+        return None
+
+    today = ledger.window()
+    tomorrow = ledger.next_window(today)
+    try:
+        if await ledger.admit(job_id, estimate, today) is None:
+            return None
+        provider = await ledger.admit(job_id, estimate, tomorrow)
+        if provider is None:
+            return ledger.window_start(tomorrow)
+        quota = (await ledger.status(today))[provider]
+    except Exception as e:
+        # Quota tracking must not take job creation down with Redis
+        logger.warning(f"Quota admission skipped for job {job_id}: {e}")
+        return None
+
+    raise HTTPException(
+        status_code=429,
+        detail=(
+            f"Job needs {estimate[provider]} {provider} calls but only "
+            f"{quota.remaining} of {quota.limit} are left today and tomorrow's "
+            f"quota is also committed; lower config.limit or retry later"
+        ),
+    )
+
+
+def _estimated_duration_minutes(config: JobConfig) -> Optional[int]:
+    """
+    Lower bound from the Naver rate limit (one call per item).
+
+    Returns:
+        Minutes, or None when the job has no limit (size unknown until crawled)
+    """
+    if config.limit is None:
+        return None
+    return max(1, math.ceil(config.limit / settings.naver_max_tps / 60))
+
+
+async def _job_progress(job: Job) -> JobProgress:
+    """
+    Current progress of a job.
+
+    Imports with auto_register finish per registration, so their counts come
+    from the job's Redis counters (fresher than the periodically flushed job
+    row); other jobs keep their counts on the job row.
+    """
+    progress = JobProgress(
+        status=job.status.value,
+        total_count=job.total_count,
+        success_count=job.success_count,
+        failed_count=job.failed_count,
+        error_summary=dict(job.error_summary or {}),
+        started_at=job.started_at,
+    )
+    if job.type != JobType.IMPORT or not (job.config or {}).get("auto_register", True):
+        return progress
+
+    state_counts = await JobCounters(redis_client=get_redis()).get(job.id)
+    if state_counts:
+        progress.set_counters(state_counts)
+    return progress
+
+
 @router.get("/{job_id}")
 async def get_job(
     job_id: uuid.UUID,
@@ -144,11 +270,7 @@ async def get_job(
     if job is None:
         raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
 
-    # Calculate progress
-    progress_percent = 0.0
-    if job.total_count > 0:
-        completed = job.success_count + job.failed_count
-        progress_percent = (completed / job.total_count) * 100
+    progress = await _job_progress(job)
 
     # Calculate duration
     duration_seconds = None
@@ -168,10 +290,10 @@ async def get_job(
             "type": job.type.value,
             "status": job.status.value,
             "statistics": {
-                "total_count": job.total_count,
-                "success_count": job.success_count,
-                "failed_count": job.failed_count,
-                "progress_percent": round(progress_percent, 2),
+                "total_count": progress.total_count,
+                "success_count": progress.success_count,
+                "failed_count": progress.failed_count,
+                "progress_percent": progress.progress_percent,
             },
             "error_summary": job.error_summary or {},
             "timeline": {
@@ -179,28 +301,109 @@ async def get_job(
                 "started_at": job.started_at.isoformat() if job.started_at else None,
                 "completed_at": job.completed_at.isoformat() if job.completed_at else None,
                 "duration_seconds": duration_seconds,
+                "estimated_remaining_seconds": progress.estimated_remaining_seconds(),
             },
             "config": job.config,
         },
     }
 
 
+@router.get("/{job_id}/events")
+async def stream_job(
+    job_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Stream job progress as Server-Sent Events.
+
+    The first event is a snapshot of the job's progress; each following event
+    carries the delta published by a worker together with the updated
+    statistics, error summary and estimated_remaining_seconds. The stream
+    ends when the job finishes.
+
+    Args:
+        job_id: Job UUID
+        db: Database session
+
+    Returns:
+        text/event-stream response, e.g.
+            event: progress
+            data: {"delta": {"success": 48, "failed": 2, ...}, "status": "RUNNING", ...}
+    """
+    result = await db.execute(select(Job).where(Job.id == job_id))
+    job = result.scalar_one_or_none()
+
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    # Subscribe before the snapshot so no event falls between the two
+    pubsub = get_redis().pubsub()
+    await pubsub.subscribe(channel(str(job_id)))
+    try:
+        progress = await _job_progress(job)
+    except Exception:
+        await pubsub.close()
+        raise
+
+    return StreamingResponse(
+        stream_job_events(pubsub, progress),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def encode_cursor(created_at: datetime, job_id: uuid.UUID) -> str:
+    """Opaque cursor pointing after the given (created_at, id) position."""
+    raw = json.dumps([created_at.isoformat(), str(job_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, job_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), uuid.UUID(job_id)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}") from e
+
+
+async def _approximate_job_count(db: AsyncSession) -> Optional[int]:
+    """Row estimate of the jobs table from planner statistics (None if never analyzed)."""
+    result = await db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'jobs'::regclass")
+    )
+    estimate = result.scalar()
+    return estimate if estimate is not None and estimate >= 0 else None
+
+
 @router.get("")
 async def list_jobs(
     type: Optional[JobType] = Query(None, description="Filter by job type"),
     status: Optional[JobStatus] = Query(None, description="Filter by status"),
-    page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    include_total: bool = Query(False, description="Include an approximate total"),
     db: AsyncSession = Depends(get_db),
 ) -> Dict[str, Any]:
     """
-    List jobs with pagination and filtering.
+    List jobs, newest first, with keyset pagination.
+
+    Pages are addressed by cursor on (created_at, id) instead of OFFSET, so
+    every page costs one index range scan regardless of its depth, and only
+    the listed columns are read (no config/error_summary JSONB).
 
     Args:
         type: Filter by job type
         status: Filter by status
-        page: Page number (1-indexed)
+        cursor: Cursor from the previous page (omit for the first page)
         page_size: Items per page (max 100)
+        include_total: Add total_estimate from table statistics (whole table, unfiltered)
         db: Database session
 
     Returns:
@@ -209,53 +412,65 @@ async def list_jobs(
             "data": {
                 "items": [...],
                 "pagination": {
-                    "page": 1,
                     "page_size": 20,
-                    "total": 100
+                    "next_cursor": "opaque" | None,
+                    "has_more": True,
+                    "total_estimate": 12000  # only with include_total
                 }
             }
         }
     """
-    stmt = select(Job)
+    stmt = select(
+        Job.id,
+        Job.type,
+        Job.status,
+        Job.total_count,
+        Job.success_count,
+        Job.failed_count,
+        Job.created_at,
+    )
 
     if type:
         stmt = stmt.where(Job.type == type)
     if status:
         stmt = stmt.where(Job.status == status)
+    if cursor:
+        created_at, job_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(Job.created_at, Job.id) < tuple_(created_at, job_id))
 
-    # Count total
-    from sqlalchemy import func
-
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await db.execute(count_stmt)
-    total = total_result.scalar()
+    # One extra row tells whether another page exists
+    stmt = stmt.order_by(Job.created_at.desc(), Job.id.desc()).limit(page_size + 1)
+    result = await db.execute(stmt)
+    rows = result.all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    stmt = stmt.offset(offset).limit(page_size).order_by(Job.created_at.desc())
+    items = [
+        {
+            "job_id": str(row.id),
+            "type": row.type.value,
+            "status": row.status.value,
+            "total_count": row.total_count,
+            "success_count": row.success_count,
+            "failed_count": row.failed_count,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+        }
+        for row in rows
+    ]
 
-    result = await db.execute(stmt)
-    jobs = result.scalars().all()
-
-    items = []
-    for job in jobs:
-        items.append(
-            {
-                "job_id": str(job.id),
-                "type": job.type.value,
-                "status": job.status.value,
-                "total_count": job.total_count,
-                "success_count": job.success_count,
-                "failed_count": job.failed_count,
-                "created_at": job.created_at.isoformat() if job.created_at else None,
-            }
-        )
+    pagination: Dict[str, Any] = {
+        "page_size": page_size,
+        "next_cursor": encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None,
+        "has_more": has_more,
+    }
+    if include_total:
+        pagination["total_estimate"] = await _approximate_job_count(db)
 
     return {
         "success": True,
         "data": {
             "items": items,
-            "pagination": {"page": page, "page_size": page_size, "total": total},
+            "pagination": pagination,
         },
     }
 
@@ -289,6 +504,8 @@ async def cancel_job(
 
     job.status = JobStatus.CANCELLED
     await db.commit()
+    await JobEventPublisher(redis_client=get_redis()).status(job.id, JobStatus.CANCELLED)
+    await QuotaLedger(redis_client=get_redis()).release(str(job.id))
 
     # Revoke Celery tasks
     from app.workers.celery_app import celery_app
@@ -0,0 +1,55 @@
+"""Quota API routes."""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter
+
+from app.redis_client import get_redis
+from app.services.quota_ledger import QuotaLedger
+
+router = APIRouter(prefix="/quota", tags=["quota"])
+
+
+@router.get("")
+async def get_quota() -> Dict[str, Any]:
+    """
+    Today's API call budget per provider.
+
+    Returns:
+        {
+            "success": True,
+            "data": {
+                "window": "2025-10-16",
+                "resets_at": "2025-10-17T00:00:00+09:00",
+                "providers": {
+                    "domeggook": {
+                        "limit": 15000,
+                        "used": 1200,
+                        "reserved": 300,
+                        "remaining": 13500
+                    },
+                    "naver": {...}
+                }
+            }
+        }
+    """
+    ledger = QuotaLedger(redis_client=get_redis())
+    window = ledger.window()
+    status = await ledger.status(window)
+
+    return {
+        "success": True,
+        "data": {
+            "window": window,
+            "resets_at": ledger.window_start(ledger.next_window(window)).isoformat(),
+            "providers": {
+                provider: {
+                    "limit": quota.limit,
+                    "used": quota.used,
+                    "reserved": quota.reserved,
+                    "remaining": quota.remaining,
+                }
+                for provider, quota in status.items()
+            },
+        },
+    }
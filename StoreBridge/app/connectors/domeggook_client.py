@@ -1,14 +1,38 @@
 """Domeggook OpenAPI client."""
 
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from collections.abc import Awaitable, Callable
+from types import ModuleType
+from typing import Any
 
 import httpx
 
 from app.config import settings
+from app.services.domeggook_cache import CachedResponse, DomeggookResponseCache
+from app.services.metrics import RESPONSE_CACHE_LOOKUPS, track_external_call
+from app.services.quota_ledger import QuotaUsage
+
+# Installed with the "speedups" extra
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Codec for responses that declare no charset and are not UTF-8
+# (CP949 is the Windows superset of EUC-KR that Korean servers actually emit)
+LEGACY_CHARSET = "cp949"
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class DomeggookClient:
     """
@@ -18,13 +42,18 @@ class DomeggookClient:
     - Rate limit: 180 calls/minute, 15,000/day
     - Encoding: EUC-KR
     - Response format: JSON
+
+    With a response cache, fresh responses are served without a call and
+    stale ones are revalidated with ETag/Last-Modified when the API sent them.
     """
 
     def __init__(
         self,
-        api_key: Optional[str] = None,
-        api_url: Optional[str] = None,
+        api_key: str | None = None,
+        api_url: str | None = None,
         timeout: float = 30.0,
+        cache: DomeggookResponseCache | None = None,
+        quota: QuotaUsage | None = None,
     ) -> None:
         """
         Initialize Domeggook API client.
@@ -33,11 +62,17 @@ class DomeggookClient:
             api_key: API key (default: from settings)
             api_url: API base URL (default: from settings)
             timeout: Request timeout in seconds (default: 30.0)
+            cache: Shared response cache (default: no caching)
+            quota: Daily quota ledger binding that counts every call (default: none)
         """
         self.api_key = api_key or settings.domeggook_api_key
         self.api_url = api_url or settings.domeggook_api_url
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        self.cache = cache
+        self.quota = quota
+        self._client: httpx.AsyncClient | None = None
+        # Charset of responses without one in Content-Type, sniffed once
+        self._charset: str | None = None
 
     def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -55,11 +90,12 @@ class DomeggookClient:
         self,
         page: int = 1,
         page_size: int = 100,
-        category: Optional[str] = None,
-        keyword: Optional[str] = None,
-        price_min: Optional[int] = None,
-        price_max: Optional[int] = None,
-    ) -> Dict[str, Any]:
+        category: str | None = None,
+        keyword: str | None = None,
+        price_min: int | None = None,
+        price_max: int | None = None,
+        before_request: Callable[[], Awaitable[None]] | None = None,
+    ) -> dict[str, Any]:
         """
         Get product list from Domeggook.
 
@@ -70,6 +106,8 @@ class DomeggookClient:
             keyword: Search keyword
             price_min: Minimum price filter
             price_max: Maximum price filter
+            before_request: Awaited only when the call goes out over HTTP (not
+                for fresh cached responses), e.g. to pace and count it
 
         Returns:
             {
@@ -90,10 +128,7 @@ class DomeggookClient:
             httpx.HTTPStatusError: If API returns error status
             httpx.TimeoutException: If request times out
         """
-        client = self._get_client()
-
-        params = {
-            "key": self.api_key,
+        params: dict[str, Any] = {
             "page": page,
             "page_size": page_size,
         }
@@ -108,11 +143,12 @@ class DomeggookClient:
             params["price_max"] = price_max
 
         try:
-            response = await client.get("/getItemList", params=params)
-            response.raise_for_status()
-
-            # Handle EUC-KR encoding
-            data = self._decode_response(response)
+            data = await self._get(
+                "/getItemList",
+                params,
+                settings.domeggook_cache_item_list_ttl,
+                before_request=before_request,
+            )
 
             return {
                 "success": True,
@@ -130,7 +166,7 @@ class DomeggookClient:
             logger.error(f"Domeggook API timeout: {e}")
             raise
 
-    async def get_item_view(self, item_id: str) -> Dict[str, Any]:
+    async def get_item_view(self, item_id: str) -> dict[str, Any]:
         """
         Get product detail from Domeggook.
 
@@ -151,19 +187,17 @@ class DomeggookClient:
                     "stock_quantity": 100
                 }
             }
-        """
-        client = self._get_client()
-
-        params = {
-            "key": self.api_key,
-            "item_id": item_id,
-        }
 
+        Raises:
+            httpx.HTTPStatusError: If the item does not exist (404, also when cached)
+        """
         try:
-            response = await client.get("/getItemView", params=params)
-            response.raise_for_status()
-
-            data = self._decode_response(response)
+            data = await self._get(
+                "/getItemView",
+                {"item_id": item_id},
+                settings.domeggook_cache_item_view_ttl,
+                missing=lambda body: not body.get("item"),
+            )
 
             return {
                 "success": True,
@@ -176,7 +210,7 @@ class DomeggookClient:
             logger.error(f"Failed to get item detail: {e}")
             raise
 
-    async def get_category_list(self) -> Dict[str, Any]:
+    async def get_category_list(self) -> dict[str, Any]:
         """
         Get category list from Domeggook.
 
@@ -189,15 +223,8 @@ class DomeggookClient:
                 ]
             }
         """
-        client = self._get_client()
-
-        params = {"key": self.api_key}
-
         try:
-            response = await client.get("/getCategoryList", params=params)
-            response.raise_for_status()
-
-            data = self._decode_response(response)
+            data = await self._get("/getCategoryList", {}, settings.domeggook_cache_category_ttl)
 
             return {
                 "success": True,
@@ -208,29 +235,139 @@ class DomeggookClient:
             logger.error(f"Failed to get categories: {e}")
             raise
 
-    def _decode_response(self, response: httpx.Response) -> Dict[str, Any]:
+    async def _get(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        ttl: int,
+        missing: Callable[[dict[str, Any]], bool] | None = None,
+        before_request: Callable[[], Awaitable[None]] | None = None,
+    ) -> dict[str, Any]:
         """
-        Decode response with EUC-KR encoding handling.
+        GET an endpoint through the response cache.
+
+        Not-found answers (404, or a body `missing` flags) are cached for
+        domeggook_cache_missing_ttl so lookups of deleted items do not spend
+        quota either.
+
+        Args:
+            endpoint: Request path
+            params: Query parameters without the API key
+            ttl: Freshness lifetime of the response in seconds (0 = not cached)
+            missing: Whether a decoded body means "not found"
+            before_request: Awaited right before an HTTP request is sent
+
+        Returns:
+            Decoded JSON data
+
+        Raises:
+            httpx.HTTPStatusError: If API returns error status
+        """
+        client = self._get_client()
+        cache = self.cache if ttl > 0 else None
+        cached = await cache.get(endpoint, params) if cache is not None else None
+        if cached is not None and cached.is_fresh:
+            if cached.is_missing:
+                request = httpx.Request("GET", f"{self.api_url}{endpoint}", params=params)
+                httpx.Response(404, request=request).raise_for_status()
+            return cached.data
+
+        headers = cached.conditional_headers() if cached is not None else {}
+        if before_request is not None:
+            await before_request()
+        if self.quota is not None:
+            await self.quota.record()
+        try:
+            with track_external_call("domeggook", "GET", endpoint):
+                response = await client.get(
+                    endpoint, params={"key": self.api_key, **params}, headers=headers
+                )
+                if not (response.status_code == 304 and cached is not None):
+                    response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404 and cache is not None:
+                await cache.set(
+                    endpoint,
+                    params,
+                    CachedResponse(data={}, status=404),
+                    settings.domeggook_cache_missing_ttl,
+                )
+            raise
+
+        if cache is not None and cached is not None and response.status_code == 304:
+            # Unchanged: the stale body is fresh again
+            RESPONSE_CACHE_LOOKUPS.labels(endpoint, "revalidated").inc()
+            await cache.set(endpoint, params, cached, ttl)
+            return cached.data
+
+        data = self._decode_response(response)
+        if cache is not None:
+            is_missing = missing is not None and missing(data)
+            await cache.set(
+                endpoint,
+                params,
+                CachedResponse(
+                    data=data,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                ),
+                settings.domeggook_cache_missing_ttl if is_missing else ttl,
+            )
+        return data
+
+    def _decode_response(self, response: httpx.Response) -> dict[str, Any]:
+        """
+        Decode a JSON response in one pass.
+
+        The charset comes from Content-Type when the server sends one;
+        otherwise it is sniffed on the first response (UTF-8 if the body
+        decodes as UTF-8, else EUC-KR/CP949) and reused for the client's
+        later responses. UTF-8 bodies go to the parser as bytes without an
+        intermediate str.
 
         Args:
             response: HTTP response
 
         Returns:
             Decoded JSON data
+
+        Raises:
+            ValueError: If the body is not valid JSON in its charset
         """
+        content = response.content
+        charset = response.charset_encoding or self._charset
+        if charset is None:
+            charset = self._charset = self._sniff_charset(content)
+
+        try:
+            return self._parse(content, charset)
+        except ValueError as e:
+            if response.charset_encoding is None:
+                sniffed = self._sniff_charset(content)
+                if sniffed != charset:
+                    # The server switched charsets: remember it and retry once
+                    self._charset = sniffed
+                    return self._parse(content, sniffed)
+            logger.error(f"Failed to decode response: {e}")
+            raise
+
+    @staticmethod
+    def _parse(content: bytes, charset: str) -> dict[str, Any]:
+        """Parse a body in the given charset."""
+        if charset.replace("-", "").lower() == "utf8":
+            data: dict[str, Any] = loads(content)
+        else:
+            data = loads(content.decode(charset))
+        return data
+
+    @staticmethod
+    def _sniff_charset(content: bytes) -> str:
+        """UTF-8 if content decodes as UTF-8, else the legacy Korean charset."""
         try:
-            # Try UTF-8 first (modern APIs)
-            return response.json()
-        except Exception:
-            # Fallback to EUC-KR
-            try:
-                content = response.content.decode("euc-kr")
-                import json
-
-                return json.loads(content)
-            except Exception as e:
-                logger.error(f"Failed to decode response: {e}")
-                raise
+            content.decode("utf-8")
+            return "utf-8"
+        except UnicodeDecodeError:
+            return LEGACY_CHARSET
 
     async def close(self) -> None:
         """Close HTTP client."""
@@ -242,6 +379,6 @@ class DomeggookClient:
         """Async context manager enter."""
         return self
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
         await self.close()
@@ -1,15 +1,33 @@
 """Naver Commerce API client."""
 
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
 
 from app.config import settings
-from app.services.rate_limiter import NaverRateLimiter
+from app.services.metrics import track_external_call
+from app.services.quota_ledger import QuotaUsage
+from app.services.rate_limiter import (
+    AdaptiveRateController,
+    RateLimiter,
+    create_rate_controller,
+    create_rate_limiter,
+)
+from app.services.token_cache import NaverTokenCache
 
 logger = logging.getLogger(__name__)
 
+# Naver OAuth tokens are valid for 3 hours when expires_in is not reported
+DEFAULT_TOKEN_LIFETIME = 10800
+
+
+class NaverRateLimitError(Exception):
+    """Naver returned 429, or no rate limit slot was available in time."""
+
+    status_code = 429
+
 
 class NaverClient:
     """
@@ -26,8 +44,12 @@ class NaverClient:
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
         api_url: Optional[str] = None,
-        rate_limiter: Optional[NaverRateLimiter] = None,
+        rate_limiter: Optional[RateLimiter] = None,
         timeout: float = 30.0,
+        http2: bool = settings.naver_http2,
+        token_cache: Optional[NaverTokenCache] = None,
+        rate_controller: Optional[AdaptiveRateController] = None,
+        quota: Optional[QuotaUsage] = None,
     ) -> None:
         """
         Initialize Naver Commerce API client.
@@ -36,16 +58,26 @@ class NaverClient:
             client_id: OAuth client ID (default: from settings)
             client_secret: OAuth client secret (default: from settings)
             api_url: API base URL (default: from settings)
-            rate_limiter: Rate limiter instance (default: create new)
+            rate_limiter: Rate limiter instance (default: per settings.naver_rate_limiter)
             timeout: Request timeout in seconds (default: 30.0)
+            http2: Use HTTP/2 (one multiplexed connection, default: from settings)
+            token_cache: Shared Redis token cache (default: token kept per instance)
+            rate_controller: Adaptive rate controller fed with 429s and latencies
+                (default: per settings.naver_adaptive_rate_enabled)
+            quota: Daily quota ledger binding that counts every call (default: none)
         """
         self.client_id = client_id or settings.naver_client_id
         self.client_secret = client_secret or settings.naver_client_secret
         self.api_url = api_url or settings.naver_api_url
-        self.rate_limiter = rate_limiter or NaverRateLimiter()
+        self.rate_limiter = rate_limiter or create_rate_limiter()
+        self.rate_controller = rate_controller or create_rate_controller(self.rate_limiter)
         self.timeout = timeout
+        self.http2 = http2
+        self.token_cache = token_cache
+        self.quota = quota
         self._client: Optional[httpx.AsyncClient] = None
         self._access_token: Optional[str] = None
+        self._token_refresh_at: Optional[float] = None
 
     def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -53,6 +85,8 @@ class NaverClient:
             self._client = httpx.AsyncClient(
                 base_url=self.api_url,
                 timeout=self.timeout,
+                http2=self.http2,
+                limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=300),
                 headers={
                     "User-Agent": "StoreBridge/1.0",
                     "Content-Type": "application/json",
@@ -61,28 +95,67 @@ class NaverClient:
         return self._client
 
     async def _ensure_authenticated(self) -> None:
-        """Ensure OAuth access token is valid."""
-        if self._access_token is None:
+        """Ensure OAuth access token is valid (refreshing it before it expires)."""
+        if self._access_token is None or self.token_refresh_in() == 0:
             await self._refresh_token()
 
-    async def _refresh_token(self) -> None:
-        """Refresh OAuth access token."""
+    def token_refresh_in(self) -> Optional[float]:
+        """
+        Seconds until the access token should be refreshed.
+
+        Returns:
+            Seconds (0 = due now), or None if the token lifetime is unknown
+        """
+        if self._token_refresh_at is None:
+            return None
+        return max(0.0, self._token_refresh_at - time.monotonic())
+
+    async def _refresh_token(self, rejected: Optional[str] = None) -> None:
+        """
+        Refresh OAuth access token.
+
+        With a token cache, the token is shared by all workers and only one of
+        them actually calls the token endpoint.
+
+        Args:
+            rejected: Token the API just rejected with 401
+        """
+        if self.token_cache is not None:
+            token = await self.token_cache.get_token(self._fetch_token, rejected=rejected)
+            self._access_token = token.access_token
+            self._token_refresh_at = time.monotonic() + (token.refresh_at - time.time())
+            return
+
+        self._access_token, expires_in = await self._fetch_token()
+
+        # Schedule proactive refresh at a fraction of the token lifetime
+        lifetime = expires_in * settings.naver_token_refresh_fraction
+        self._token_refresh_at = time.monotonic() + lifetime
+
+    async def _fetch_token(self) -> Tuple[str, float]:
+        """
+        Request a new OAuth access token.
+
+        Returns:
+            (access_token, expires_in_seconds)
+        """
         client = self._get_client()
 
         try:
-            response = await client.post(
-                "/oauth2.0/token",
-                data={
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "grant_type": "client_credentials",
-                },
-            )
-            response.raise_for_status()
+            with track_external_call("naver", "POST", "/oauth2.0/token"):
+                response = await client.post(
+                    "/oauth2.0/token",
+                    data={
+                        "client_id": self.client_id,
+                        "client_secret": self.client_secret,
+                        "grant_type": "client_credentials",
+                    },
+                )
+                response.raise_for_status()
 
             data = response.json()
-            self._access_token = data["access_token"]
             logger.info("OAuth token refreshed successfully")
+            return data["access_token"], float(data.get("expires_in") or DEFAULT_TOKEN_LIFETIME)
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Failed to refresh OAuth token: {e}")
@@ -94,6 +167,8 @@ class NaverClient:
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        rate_limit: bool = True,
+        _auth_retried: bool = False,
     ) -> Dict[str, Any]:
         """
         Make authenticated API request with rate limiting.
@@ -103,59 +178,76 @@ class NaverClient:
             endpoint: API endpoint
             data: Request body (for POST/PUT)
             params: Query parameters
+            rate_limit: Acquire a rate limit token first (False when the
+                caller already holds one, e.g. the dispatcher)
 
         Returns:
             Response JSON data
 
         Raises:
-            Exception: If rate limit exceeded or API error
+            NaverRateLimitError: If rate limit exceeded
+            Exception: If API error
         """
         # Ensure authenticated
         await self._ensure_authenticated()
 
         # Acquire rate limit token
-        if not await self.rate_limiter.acquire_with_wait(max_retries=5, backoff=0.5):
-            raise Exception("Rate limit exceeded after retries")
+        if rate_limit and not await self.rate_limiter.acquire_with_wait(
+            max_retries=5, backoff=0.5
+        ):
+            raise NaverRateLimitError("Rate limit exceeded after retries")
 
         client = self._get_client()
         headers = {"Authorization": f"Bearer {self._access_token}"}
 
         try:
-            if method.upper() == "GET":
-                response = await client.get(endpoint, params=params, headers=headers)
-            elif method.upper() == "POST":
-                response = await client.post(endpoint, json=data, headers=headers)
-            elif method.upper() == "PUT":
-                response = await client.put(endpoint, json=data, headers=headers)
-            elif method.upper() == "DELETE":
-                response = await client.delete(endpoint, headers=headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            response.raise_for_status()
+            await self._record_call()
+            started = time.monotonic()
+            with track_external_call("naver", method, endpoint):
+                if method.upper() == "GET":
+                    response = await client.get(endpoint, params=params, headers=headers)
+                elif method.upper() == "POST":
+                    response = await client.post(endpoint, json=data, headers=headers)
+                elif method.upper() == "PUT":
+                    response = await client.put(endpoint, json=data, headers=headers)
+                elif method.upper() == "DELETE":
+                    response = await client.delete(endpoint, headers=headers)
+                else:
+                    raise ValueError(f"Unsupported HTTP method: {method}")
+
+                response.raise_for_status()
+            await self._report_response(time.monotonic() - started)
             return response.json()
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:
                 logger.error("Naver API rate limit exceeded (2 TPS)")
-                raise Exception("Rate limit exceeded") from e
-            elif e.response.status_code == 401:
+                await self._report_throttled()
+                raise NaverRateLimitError("Rate limit exceeded") from e
+            elif e.response.status_code == 401 and not _auth_retried:
                 # Token expired, refresh and retry once
                 logger.warning("OAuth token expired, refreshing...")
-                await self._refresh_token()
-                # Retry once (recursive call)
-                return await self._make_request(method, endpoint, data, params)
+                rejected = self._access_token
+                if self.token_cache is not None and rejected is not None:
+                    await self.token_cache.invalidate(rejected)
+                await self._refresh_token(rejected=rejected)
+                return await self._make_request(
+                    method, endpoint, data, params, rate_limit, _auth_retried=True
+                )
             else:
                 logger.error(f"Naver API error: {e.response.text}")
                 raise
 
-    async def upload_image(self, image_data: bytes, filename: str = "image.jpg") -> Dict[str, Any]:
+    async def upload_image(
+        self, image_data: bytes, filename: str = "image.jpg", rate_limit: bool = True
+    ) -> Dict[str, Any]:
         """
         Upload image to Naver CDN.
 
         Args:
             image_data: Image binary data
             filename: Image filename
+            rate_limit: Acquire a rate limit token first
 
         Returns:
             {
@@ -166,26 +258,48 @@ class NaverClient:
         await self._ensure_authenticated()
 
         # Acquire rate limit token
-        if not await self.rate_limiter.acquire_with_wait():
-            raise Exception("Rate limit exceeded")
+        if rate_limit and not await self.rate_limiter.acquire_with_wait():
+            raise NaverRateLimitError("Rate limit exceeded")
 
         client = self._get_client()
         headers = {"Authorization": f"Bearer {self._access_token}"}
 
         try:
             files = {"image": (filename, image_data, "image/jpeg")}
-            response = await client.post(
-                "/v1/product-images/upload", files=files, headers=headers
-            )
-            response.raise_for_status()
+            await self._record_call()
+            started = time.monotonic()
+            with track_external_call("naver", "POST", "/v1/product-images/upload"):
+                response = await client.post(
+                    "/v1/product-images/upload", files=files, headers=headers
+                )
+                response.raise_for_status()
+            await self._report_response(time.monotonic() - started)
 
             data = response.json()
             return {"success": True, "image_url": data["imageUrl"]}
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Failed to upload image: {e}")
+            if e.response.status_code == 429:
+                await self._report_throttled()
+                raise NaverRateLimitError("Rate limit exceeded") from e
             raise
 
+    async def _record_call(self) -> None:
+        """Count a call against the daily Naver budget."""
+        if self.quota is not None:
+            await self.quota.record()
+
+    async def _report_response(self, latency: float) -> None:
+        """Feed a successful call's latency to the adaptive rate controller."""
+        if self.rate_controller is not None:
+            await self.rate_controller.on_response(latency)
+
+    async def _report_throttled(self) -> None:
+        """Report a 429 to the adaptive rate controller."""
+        if self.rate_controller is not None:
+            await self.rate_controller.on_throttled()
+
     async def register_product(self, product_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Register product to Naver Smart Store.
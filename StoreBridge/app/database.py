@@ -1,16 +1,20 @@
 """Database connection and session management."""
 
+import time
 from collections.abc import AsyncGenerator
 from typing import Optional
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
 
 from app.config import settings
+from app.services.metrics import DB_COMMIT_SECONDS
 
 # Global engine and session factory
 _engine: Optional[AsyncEngine] = None
@@ -24,8 +28,10 @@ def get_engine() -> AsyncEngine:
         _engine = create_async_engine(
             settings.database_url,
             echo=settings.environment == "development",
-            pool_size=10,
-            max_overflow=20,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_recycle=settings.database_pool_recycle,
+            pool_timeout=settings.database_pool_timeout,
             pool_pre_ping=True,
         )
     return _engine
@@ -58,6 +64,20 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+@event.listens_for(Session, "before_commit")
+def _commit_started(session: Session) -> None:
+    """Remember when a commit started (AsyncSession commits run on a sync Session)."""
+    session.info["commit_started"] = time.perf_counter()
+
+
+@event.listens_for(Session, "after_commit")
+def _commit_finished(session: Session) -> None:
+    """Record the commit's duration, including the flush it triggered."""
+    started = session.info.pop("commit_started", None)
+    if started is not None:
+        DB_COMMIT_SECONDS.observe(time.perf_counter() - started)
+
+
 async def close_db() -> None:
     """Close database engine (for shutdown)."""
     global _engine, _async_session_factory
@@ -2,12 +2,15 @@
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api import jobs
+from app.api import jobs, quota
 from app.config import settings
 from app.database import close_db
+from app.redis_client import close_redis, get_redis
+from app.services.metrics import refresh_shared_gauges, render_metrics
+from app.services.rate_limiter import AdaptiveRateController
 
 
 @asynccontextmanager
@@ -17,6 +20,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     await close_db()
+    await close_redis()
 
 
 app = FastAPI(
@@ -37,6 +41,7 @@ app.add_middleware(
 
 # Include routers
 app.include_router(jobs.router, prefix="/v1")
+app.include_router(quota.router, prefix="/v1")
 
 
 @app.get("/")
@@ -54,6 +59,11 @@ async def root():
 async def health_check():
     """Detailed health check."""
     # TODO: Check database, Redis, etc.
+    controller = AdaptiveRateController(redis_client=get_redis())
+    try:
+        effective_tps = await controller.current_rate()
+    except Exception:
+        effective_tps = None
     return {
         "status": "healthy",
         "components": {
@@ -61,4 +71,16 @@ async def health_check():
             "redis": "healthy",
             "celery": "healthy",
         },
+        "naver_rate_limit": {
+            "effective_tps": effective_tps,
+            "max_tps": settings.naver_max_tps,
+        },
     }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus metrics of the API process plus queue depth and Naver rate."""
+    await refresh_shared_gauges(get_redis())
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
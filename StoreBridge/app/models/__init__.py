@@ -3,9 +3,12 @@
 from app.models.base import Base
 from app.models.product import (
     CategoryMapping,
+    ForbiddenWord,
+    ImageAsset,
     Job,
     JobStatus,
     JobType,
+    OutboxMessage,
     Product,
     ProductRegistration,
     State,
@@ -19,5 +22,8 @@ __all__ = [
     "JobStatus",
     "JobType",
     "CategoryMapping",
+    "ForbiddenWord",
+    "ImageAsset",
+    "OutboxMessage",
     "State",
 ]
@@ -6,6 +6,8 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy import (
+    BigInteger,
+    Boolean,
     CheckConstraint,
     DateTime,
     Enum,
@@ -174,7 +176,13 @@ class Job(Base):
     __table_args__ = (
         Index("idx_jobs_type", "type"),
         Index("idx_jobs_status", "status"),
-        Index("idx_jobs_created_at", "created_at"),
+        # Keyset pagination of GET /jobs: (created_at, id) order, listed columns included
+        Index(
+            "idx_jobs_created_at_id",
+            "created_at",
+            "id",
+            postgresql_include=["type", "status", "total_count", "success_count", "failed_count"],
+        ),
     )
 
 
@@ -203,3 +211,59 @@ class CategoryMapping(Base):
         Index("idx_category_mappings_domeggook", "domeggook_category"),
         Index("idx_category_mappings_active", "is_active", "domeggook_category"),
     )
+
+
+class ImageAsset(Base):
+    """Source image uploaded to the Naver CDN, keyed by content hash."""
+
+    __tablename__ = "image_assets"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    source_url: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    naver_url: Mapped[str] = mapped_column(Text, nullable=False)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    __table_args__ = (Index("idx_image_assets_content_hash", "content_hash"),)
+
+
+class ForbiddenWord(Base):
+    """Word that must not appear in a product name or description."""
+
+    __tablename__ = "forbidden_words"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    word: Mapped[str] = mapped_column(String(200), unique=True, nullable=False)
+    reason: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class OutboxMessage(Base):
+    """Celery task staged in the transaction of the state change that needs it."""
+
+    __tablename__ = "task_outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    task_name: Mapped[str] = mapped_column(String(200), nullable=False)
+    args: Mapped[List[Any]] = mapped_column(JSONB, nullable=False, default=list)
+    queue: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    countdown: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # Not relayed before this time (tasks scheduled hours ahead stay here,
+    # not in the broker as ETA messages)
+    available_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -0,0 +1,26 @@
+"""Shared Redis connection for the API process."""
+
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from app.config import settings
+
+# Global client
+_redis: Optional["aioredis.Redis[str]"] = None
+
+
+def get_redis() -> "aioredis.Redis[str]":
+    """Get or create the Redis client."""
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(settings.redis_url, decode_responses=True)
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the Redis client."""
+    global _redis
+    if _redis is not None:
+        await _redis.close()
+        _redis = None
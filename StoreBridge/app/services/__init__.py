@@ -1,5 +1,5 @@
 """Services layer."""
 
-from app.services.rate_limiter import NaverRateLimiter
+from app.services.rate_limiter import GCRARateLimiter, NaverRateLimiter, create_rate_limiter
 
-__all__ = ["NaverRateLimiter"]
+__all__ = ["GCRARateLimiter", "NaverRateLimiter", "create_rate_limiter"]
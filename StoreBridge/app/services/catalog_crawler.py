@@ -0,0 +1,292 @@
+"""Paginated Domeggook catalog crawler."""
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+import redis.asyncio as aioredis
+
+from app.config import settings
+from app.connectors.domeggook_client import DomeggookClient
+from app.services.rate_limiter import GCRARateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CatalogPage:
+    """A single page of Domeggook catalog items."""
+
+    page: int
+    total_count: int
+    items: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class CallBudgetExceeded(Exception):
+    """A crawl's max_calls budget is spent."""
+
+
+class RequestPacer:
+    """
+    In-process request pacer.
+
+    Spaces request start times evenly (60 / max_rpm seconds apart), so several
+    in-flight requests never add up to more than max_rpm calls per minute.
+    """
+
+    def __init__(self, max_rpm: int = settings.domeggook_max_rpm) -> None:
+        """
+        Initialize pacer.
+
+        Args:
+            max_rpm: Maximum requests per minute (default: 180)
+        """
+        self.interval = 60.0 / max_rpm
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Wait until the next request slot is available."""
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class SharedRequestPacer:
+    """
+    Request pacer shared by every worker process through Redis.
+
+    Request starts are spaced by the GCRA limiter on a Domeggook key, so
+    concurrent crawls in any number of processes add up to at most max_rpm
+    calls per minute. If Redis is unavailable, requests are paced within
+    this process instead.
+    """
+
+    RESOURCE_ID = "domeggook_api"
+
+    def __init__(
+        self,
+        redis_client: Optional["aioredis.Redis[str]"] = None,
+        max_rpm: int = settings.domeggook_max_rpm,
+        max_wait: float = 600.0,
+    ) -> None:
+        """
+        Initialize pacer.
+
+        Args:
+            redis_client: Redis client (if None, creates new one)
+            max_rpm: Maximum requests per minute across all processes (default: 180)
+            max_wait: Longest slot reservation in seconds; callers queue again after it
+        """
+        self.limiter = GCRARateLimiter(
+            redis_client=redis_client, max_tps=max_rpm / 60, burst=1, max_wait=max_wait
+        )
+        self._local = RequestPacer(max_rpm=max_rpm)
+
+    async def wait(self) -> None:
+        """Wait until the next shared request slot is available."""
+        while True:
+            try:
+                code, wait = await self.limiter.reserve(self.RESOURCE_ID)
+            except ConnectionError as e:
+                logger.warning(f"Shared Domeggook pacing unavailable, pacing locally: {e}")
+                await self._local.wait()
+                return
+
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if code > 0:
+                return
+
+
+class DomeggookCatalogCrawler:
+    """
+    Stream a Domeggook catalog page by page.
+
+    The first page is fetched alone to learn total_count, then the remaining
+    pages are fetched with at most `concurrency` requests in flight. Pages are
+    yielded as soon as they arrive (not necessarily in page order), so callers
+    can persist each page without buffering the whole catalog.
+
+    Budget:
+    - Request starts are paced to domeggook_max_rpm (180/min; shared by all
+      workers when the pacer is a SharedRequestPacer)
+    - At most max_calls requests are made per crawl (15,000/day), retries
+      included; pages served from the response cache take neither a pacer
+      slot nor a call
+    """
+
+    def __init__(
+        self,
+        client: DomeggookClient,
+        concurrency: int = settings.domeggook_crawl_concurrency,
+        page_size: int = settings.domeggook_page_size,
+        max_calls: int = settings.domeggook_max_daily,
+        pacer: Optional[Union[RequestPacer, SharedRequestPacer]] = None,
+        max_retries: int = 3,
+        retry_backoff: float = 2.0,
+    ) -> None:
+        """
+        Initialize crawler.
+
+        Args:
+            client: Domeggook API client
+            concurrency: Maximum in-flight page requests (default: 4)
+            page_size: Items per page (max 100)
+            max_calls: Maximum API calls for this crawl (default: daily budget)
+            pacer: Request pacer (default: in-process at domeggook_max_rpm; workers
+                pass a SharedRequestPacer)
+            max_retries: Attempts per page before giving up (default: 3)
+            retry_backoff: Initial retry backoff in seconds (default: 2.0)
+        """
+        self.client = client
+        self.concurrency = max(1, concurrency)
+        self.page_size = max(1, min(page_size, 100))
+        self.max_calls = max_calls
+        self.pacer = pacer or RequestPacer()
+        self.max_retries = max(1, max_retries)
+        self.retry_backoff = retry_backoff
+        self.calls_made = 0
+        self.truncated = False
+
+    async def iter_pages(
+        self,
+        limit: Optional[int] = None,
+        category: Optional[str] = None,
+        keyword: Optional[str] = None,
+        price_min: Optional[int] = None,
+        price_max: Optional[int] = None,
+    ) -> AsyncIterator[CatalogPage]:
+        """
+        Crawl the catalog and yield pages as they arrive.
+
+        Args:
+            limit: Maximum number of items to yield (None = whole catalog)
+            category: Category filter
+            keyword: Search keyword
+            price_min: Minimum price filter
+            price_max: Maximum price filter
+
+        Yields:
+            CatalogPage with items trimmed to `limit`
+        """
+        filters = {
+            "category": category,
+            "keyword": keyword,
+            "price_min": price_min,
+            "price_max": price_max,
+        }
+        page_size = min(self.page_size, limit) if limit else self.page_size
+
+        first = await self._fetch_page(1, page_size, filters)
+        if first is None:
+            return
+        yield self._trim(first, page_size, limit)
+
+        wanted = first.total_count if limit is None else min(first.total_count, limit)
+        last_page = math.ceil(wanted / page_size)
+
+        pages = iter(range(2, last_page + 1))
+        pending: set[asyncio.Task[Optional[CatalogPage]]] = set()
+
+        def schedule_next() -> None:
+            # Once the budget is spent no page is started
+            page = None if self.truncated else next(pages, None)
+            if page is not None:
+                pending.add(asyncio.create_task(self._fetch_page(page, page_size, filters)))
+
+        try:
+            for _ in range(self.concurrency):
+                schedule_next()
+
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.discard(task)
+                    page_result = task.result()
+                    schedule_next()
+                    if page_result is not None:
+                        yield self._trim(page_result, page_size, limit)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _before_request(self) -> None:
+        """
+        Charge one call to the budget, then wait for a request slot.
+
+        Raises:
+            CallBudgetExceeded: If max_calls requests were already made
+        """
+        if self.calls_made >= self.max_calls:
+            raise CallBudgetExceeded(f"Call budget of {self.max_calls} spent")
+        self.calls_made += 1
+        await self.pacer.wait()
+
+    async def _fetch_page(
+        self, page: int, page_size: int, filters: Dict[str, Any]
+    ) -> Optional[CatalogPage]:
+        """
+        Fetch a single page with pacing and retry.
+
+        Args:
+            page: Page number (1-indexed)
+            page_size: Items per page
+            filters: get_item_list filter arguments
+
+        Returns:
+            CatalogPage, or None if the call budget ran out first (the crawl
+            is marked truncated)
+
+        Raises:
+            Exception: If the page still fails after max_retries attempts
+        """
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.get_item_list(
+                    page=page, page_size=page_size, before_request=self._before_request, **filters
+                )
+                return CatalogPage(
+                    page=page,
+                    total_count=response.get("total_count", 0),
+                    items=response.get("items", []),
+                )
+            except CallBudgetExceeded:
+                if not self.truncated:
+                    logger.warning(
+                        f"Crawl truncated at page {page} (call budget: {self.max_calls})"
+                    )
+                self.truncated = True
+                return None
+            except Exception as e:
+                attempt += 1
+                if attempt >= self.max_retries:
+                    logger.error(f"Failed to fetch catalog page {page}: {e}")
+                    raise
+                wait_time = self.retry_backoff * (2 ** (attempt - 1))
+                logger.warning(
+                    f"Catalog page {page} failed ({e}), retrying in {wait_time:.1f}s"
+                )
+                await asyncio.sleep(wait_time)
+
+    @staticmethod
+    def _trim(page: CatalogPage, page_size: int, limit: Optional[int]) -> CatalogPage:
+        """Drop items beyond `limit` (counted across all pages)."""
+        if limit is None:
+            return page
+        remaining = limit - (page.page - 1) * page_size
+        if remaining < len(page.items):
+            page.items = page.items[: max(remaining, 0)]
+        return page
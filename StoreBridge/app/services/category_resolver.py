@@ -0,0 +1,300 @@
+"""Domeggook → Naver category resolution with two-level caching."""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar, Union
+
+import redis.asyncio as aioredis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.connectors.naver_client import NaverClient
+from app.models import CategoryMapping
+from app.services.naver_dispatcher import NaverDispatchClient
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+MAPPING_KEY = "category:mapping:{category}"
+ATTRIBUTES_KEY = "category:attributes:{category_id}"
+
+
+class TTLCache(Generic[K, V]):
+    """Small in-process LRU cache whose entries expire after ttl seconds."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Entry lifetime in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> Tuple[bool, Optional[V]]:
+        """
+        Look up a key.
+
+        Returns:
+            (hit, value) - value may be None for a cached negative result
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return False, None
+        self._data.move_to_end(key)
+        return True, value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
+
+
+@dataclass
+class ResolvedCategory:
+    """
+    Naver leaf category for a Domeggook category.
+
+    required_attributes has the shape of a get_category_attributes response
+    ({"requiredAttributes": [{"name": ...}, ...]}); None means not known yet.
+    """
+
+    naver_category_id: str
+    required_attributes: Optional[Dict[str, Any]] = None
+    default_attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def missing_attributes(self) -> List[str]:
+        """Required attribute names that default_attributes does not provide."""
+        required = (self.required_attributes or {}).get("requiredAttributes", [])
+        return [
+            attribute["name"]
+            for attribute in required
+            if attribute.get("name") and attribute["name"] not in self.default_attributes
+        ]
+
+
+class CategoryResolver:
+    """
+    Resolve Domeggook categories to Naver leaf categories.
+
+    Lookups go through a per-process LRU (with TTL), then Redis, then the
+    category_mappings table; unmapped categories are cached too so they do
+    not hit the database again. Naver category attributes are cached the same
+    way, so a rate-limited get_category_attributes call is made at most once
+    per category while it stays in Redis.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional["aioredis.Redis[str]"] = None,
+        naver_client: Optional[Union[NaverClient, NaverDispatchClient]] = None,
+        local_ttl: float = settings.category_cache_ttl,
+        redis_ttl: int = settings.category_cache_redis_ttl,
+        maxsize: int = settings.category_cache_maxsize,
+    ) -> None:
+        """
+        Initialize resolver.
+
+        Args:
+            redis_client: Redis client (if None, creates new one)
+            naver_client: Naver client for category attributes (default: create new)
+            local_ttl: In-process cache lifetime in seconds (default: 600)
+            redis_ttl: Redis cache lifetime in seconds (default: 86400)
+            maxsize: In-process cache entries per kind (default: 4096)
+        """
+        self.redis = redis_client or aioredis.from_url(settings.redis_url, decode_responses=True)
+        self.naver_client = naver_client
+        self.local_ttl = local_ttl
+        self.redis_ttl = redis_ttl
+        self._mappings: TTLCache[str, Optional[ResolvedCategory]] = TTLCache(maxsize, local_ttl)
+        self._attributes: TTLCache[str, Dict[str, Any]] = TTLCache(maxsize, local_ttl)
+        self._attribute_fetches: Dict[str, asyncio.Future[Dict[str, Any]]] = {}
+
+    async def resolve(
+        self, db: AsyncSession, domeggook_category: Optional[str]
+    ) -> Optional[ResolvedCategory]:
+        """
+        Resolve one Domeggook category.
+
+        Args:
+            db: Database session
+            domeggook_category: Domeggook category name
+
+        Returns:
+            ResolvedCategory, or None if the category is not mapped
+        """
+        if not domeggook_category:
+            return None
+        resolved = await self.preload(db, [domeggook_category])
+        return resolved[domeggook_category]
+
+    async def preload(
+        self, db: AsyncSession, categories: Iterable[Optional[str]]
+    ) -> Dict[str, Optional[ResolvedCategory]]:
+        """
+        Resolve many categories with at most one Redis and one database round trip.
+
+        Args:
+            db: Database session
+            categories: Domeggook category names (duplicates and None ignored)
+
+        Returns:
+            Category name -> ResolvedCategory (None if not mapped)
+        """
+        resolved: Dict[str, Optional[ResolvedCategory]] = {}
+        missing: List[str] = []
+        for category in dict.fromkeys(c for c in categories if c):
+            hit, value = self._mappings.get(category)
+            if hit:
+                resolved[category] = value
+            else:
+                missing.append(category)
+        if not missing:
+            return resolved
+
+        # Redis tier
+        cached = await self.redis.mget([MAPPING_KEY.format(category=c) for c in missing])
+        still_missing = []
+        for category, raw in zip(missing, cached, strict=True):
+            if raw is None:
+                still_missing.append(category)
+                continue
+            data = json.loads(raw)
+            value = ResolvedCategory(**data) if data else None
+            self._mappings.set(category, value)
+            resolved[category] = value
+        if not still_missing:
+            return resolved
+
+        # Database tier
+        loaded = await self._load_mappings(db, still_missing)
+        await self._store_mappings(loaded)
+        resolved.update(loaded)
+        return resolved
+
+    async def preload_all(self, db: AsyncSession) -> int:
+        """
+        Warm both cache tiers with every active mapping (e.g. at job start).
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of mapped categories cached
+        """
+        loaded = await self._load_mappings(db, None)
+        await self._store_mappings(loaded)
+        logger.info(f"Preloaded {len(loaded)} category mappings")
+        return len(loaded)
+
+    async def get_attributes(self, naver_category_id: str) -> Dict[str, Any]:
+        """
+        Get a Naver category's attributes, calling Naver only on a cache miss.
+
+        Concurrent misses for the same category in this process share one call.
+
+        Args:
+            naver_category_id: Naver leaf category ID
+
+        Returns:
+            Naver get_category_attributes response
+        """
+        hit, value = self._attributes.get(naver_category_id)
+        if hit and value is not None:
+            return value
+
+        key = ATTRIBUTES_KEY.format(category_id=naver_category_id)
+        raw = await self.redis.get(key)
+        if raw is not None:
+            attributes: Dict[str, Any] = json.loads(raw)
+            self._attributes.set(naver_category_id, attributes)
+            return attributes
+
+        pending = self._attribute_fetches.get(naver_category_id)
+        if pending is not None:
+            return await pending
+
+        future: asyncio.Future[Dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._attribute_fetches[naver_category_id] = future
+        try:
+            if self.naver_client is None:
+                self.naver_client = NaverClient()
+            attributes = await self.naver_client.get_category_attributes(naver_category_id)
+            await self.redis.set(key, json.dumps(attributes), ex=self.redis_ttl)
+            self._attributes.set(naver_category_id, attributes)
+            future.set_result(attributes)
+            return attributes
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; mark retrieved so an unawaited future does not warn
+            future.exception()
+            raise
+        finally:
+            del self._attribute_fetches[naver_category_id]
+
+    async def _load_mappings(
+        self, db: AsyncSession, categories: Optional[List[str]]
+    ) -> Dict[str, Optional[ResolvedCategory]]:
+        """Load the best active mapping per category (None for unmapped ones)."""
+        stmt = (
+            select(
+                CategoryMapping.domeggook_category,
+                CategoryMapping.naver_leaf_category_id,
+                CategoryMapping.required_attributes,
+                CategoryMapping.default_attributes,
+            )
+            .where(CategoryMapping.is_active.is_(True))
+            .order_by(CategoryMapping.domeggook_category, CategoryMapping.confidence.desc())
+        )
+        if categories is not None:
+            stmt = stmt.where(CategoryMapping.domeggook_category.in_(categories))
+
+        loaded: Dict[str, Optional[ResolvedCategory]] = dict.fromkeys(categories or [])
+        result = await db.execute(stmt)
+        for row in result:
+            # Highest confidence first; keep it
+            if loaded.get(row.domeggook_category) is None:
+                loaded[row.domeggook_category] = ResolvedCategory(
+                    naver_category_id=row.naver_leaf_category_id,
+                    required_attributes=row.required_attributes,
+                    default_attributes=row.default_attributes or {},
+                )
+        return loaded
+
+    async def _store_mappings(self, mappings: Dict[str, Optional[ResolvedCategory]]) -> None:
+        """Write mappings to both cache tiers; unmapped markers expire after local_ttl."""
+        if not mappings:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        for category, value in mappings.items():
+            self._mappings.set(category, value)
+            pipe.set(
+                MAPPING_KEY.format(category=category),
+                json.dumps(asdict(value) if value else None),
+                ex=self.redis_ttl if value else max(1, int(self.local_ttl)),
+            )
+        await pipe.execute()
+
+    async def close(self) -> None:
+        """Close Redis connection."""
+        await self.redis.close()
@@ -0,0 +1,152 @@
+"""Redis cache for Domeggook API responses."""
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+import redis.asyncio as aioredis
+
+from app.config import settings
+from app.services.metrics import RESPONSE_CACHE_LOOKUPS
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_KEY = "domeggook:response:{endpoint}:{digest}"
+
+
+@dataclass
+class CachedResponse:
+    """
+    A cached Domeggook response.
+
+    status is 200 for a decoded body, or 404 for a cached "not found"
+    (negative entry, data empty). etag and last_modified are the validators
+    sent back to revalidate the entry once it is stale; fresh_until (epoch
+    seconds) is set when the entry is stored.
+    """
+
+    data: Dict[str, Any]
+    status: int = 200
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fresh_until: float = 0.0
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+    @property
+    def is_missing(self) -> bool:
+        return self.status == 404
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that revalidate this entry (empty without validators)."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DomeggookResponseCache:
+    """
+    Domeggook responses shared by every worker, keyed on (endpoint, params).
+
+    Every Domeggook call counts against the 15,000/day quota, so re-running
+    an import or sync should not fetch what was fetched minutes ago. Fresh
+    entries are served without a call; stale entries that carry an ETag or
+    Last-Modified are kept for revalidate_ttl more seconds so the next call
+    can be conditional (304 = reuse the cached body). Redis errors are
+    treated as misses: the cache never fails a call.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional["aioredis.Redis[str]"] = None,
+        revalidate_ttl: int = settings.domeggook_cache_revalidate_ttl,
+    ) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            redis_client: Redis client (if None, creates new one)
+            revalidate_ttl: Seconds a stale entry with validators is kept (default: 86400)
+        """
+        self.redis = redis_client or aioredis.from_url(settings.redis_url, decode_responses=True)
+        self.revalidate_ttl = revalidate_ttl
+
+    @staticmethod
+    def key(endpoint: str, params: Dict[str, Any]) -> str:
+        """Redis key of an endpoint and its query parameters (API key excluded)."""
+        canonical = json.dumps(params, sort_keys=True, default=str, ensure_ascii=False)
+        digest = hashlib.sha256(canonical.encode()).hexdigest()[:32]
+        return RESPONSE_KEY.format(endpoint=endpoint.strip("/"), digest=digest)
+
+    async def get(self, endpoint: str, params: Dict[str, Any]) -> Optional[CachedResponse]:
+        """
+        Look up a response.
+
+        Args:
+            endpoint: Request path, e.g. "/getItemView"
+            params: Query parameters without the API key
+
+        Returns:
+            CachedResponse (fresh or stale), or None on a miss (including
+            an unreadable entry, which is deleted)
+        """
+        try:
+            raw = await self.redis.get(self.key(endpoint, params))
+        except Exception as e:
+            logger.warning(f"Domeggook cache read failed: {e}")
+            return None
+
+        if raw is None:
+            RESPONSE_CACHE_LOOKUPS.labels(endpoint, "miss").inc()
+            return None
+        try:
+            cached = CachedResponse(**json.loads(raw))
+            is_fresh = cached.is_fresh
+        except (ValueError, TypeError) as e:
+            # Corrupt or written by an older version: drop it and fetch again
+            logger.warning(f"Discarding unreadable Domeggook cache entry for {endpoint}: {e}")
+            RESPONSE_CACHE_LOOKUPS.labels(endpoint, "miss").inc()
+            try:
+                await self.redis.delete(self.key(endpoint, params))
+            except Exception as delete_error:
+                logger.warning(f"Domeggook cache delete failed: {delete_error}")
+            return None
+
+        if not is_fresh:
+            outcome = "stale"
+        else:
+            outcome = "negative" if cached.is_missing else "hit"
+        RESPONSE_CACHE_LOOKUPS.labels(endpoint, outcome).inc()
+        return cached
+
+    async def set(
+        self, endpoint: str, params: Dict[str, Any], cached: CachedResponse, ttl: int
+    ) -> None:
+        """
+        Store a response, fresh for ttl seconds.
+
+        Args:
+            endpoint: Request path
+            params: Query parameters without the API key
+            cached: Response to store (fresh_until is set here)
+            ttl: Freshness lifetime in seconds
+        """
+        cached.fresh_until = time.time() + ttl
+        if cached.conditional_headers():
+            ttl += self.revalidate_ttl
+        try:
+            await self.redis.set(
+                self.key(endpoint, params),
+                json.dumps(asdict(cached), ensure_ascii=False),
+                ex=max(1, ttl),
+            )
+        except Exception as e:
+            logger.warning(f"Domeggook cache write failed: {e}")
@@ -0,0 +1,248 @@
+"""Product image pipeline: download, dedup by content hash, upload to Naver."""
+
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.connectors.naver_client import NaverClient, NaverRateLimitError
+from app.models import ImageAsset
+from app.services.naver_dispatcher import NaverDispatchClient, NaverDispatchError
+
+logger = logging.getLogger(__name__)
+
+# Errors that fail one image upload (bad response, transport error, timeout);
+# throttling is raised as NaverRateLimitError instead
+UPLOAD_ERRORS = (httpx.HTTPError, NaverDispatchError, TimeoutError, KeyError, ValueError)
+
+
+@dataclass
+class ImageResult:
+    """Image pipeline result."""
+
+    naver_urls: Dict[str, str] = field(default_factory=dict)
+    failed_urls: Dict[str, str] = field(default_factory=dict)
+    uploaded_count: int = 0
+    reused_count: int = 0
+
+    def resolve(self, source_urls: List[str]) -> List[str]:
+        """
+        Map a product's source image URLs to Naver CDN URLs.
+
+        Args:
+            source_urls: Domeggook image URLs in display order
+
+        Returns:
+            Naver CDN URLs in the same order, skipping images that failed
+        """
+        return [self.naver_urls[url] for url in source_urls if url in self.naver_urls]
+
+
+class ImagePipeline:
+    """
+    Move product images from Domeggook to the Naver CDN.
+
+    The same image is often shared by hundreds of SKUs, and uploads use the
+    same rate limit budget as product registration. For a set of source URLs:
+    1. URLs already in image_assets are resolved without downloading
+    2. The rest are downloaded concurrently (bounded) and hashed with SHA-256
+    3. Hashes already in image_assets reuse the stored Naver URL
+    4. Only images never seen before are uploaded, once per hash
+    5. New source URL -> hash -> Naver URL rows are stored for next time
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        naver_client: Union[NaverClient, NaverDispatchClient],
+        http_client: Optional[httpx.AsyncClient] = None,
+        download_concurrency: int = settings.image_download_concurrency,
+        upload_concurrency: int = settings.image_upload_concurrency,
+        max_image_bytes: int = settings.image_max_bytes,
+    ) -> None:
+        """
+        Initialize image pipeline.
+
+        Args:
+            db: Database session
+            naver_client: Naver client used for uploads
+            http_client: Long-lived HTTP client for downloads, so connections are
+                reused across runs (if None, creates new one per run)
+            download_concurrency: Maximum concurrent downloads (default: 16)
+            upload_concurrency: Maximum concurrent uploads (default: 4)
+            max_image_bytes: Largest image accepted in bytes (default: 10 MB)
+        """
+        self.db = db
+        self.naver_client = naver_client
+        self.http_client = http_client
+        self.download_concurrency = max(1, download_concurrency)
+        self.upload_concurrency = max(1, upload_concurrency)
+        self.max_image_bytes = max_image_bytes
+
+    async def process(self, source_urls: List[str]) -> ImageResult:
+        """
+        Resolve source image URLs to Naver CDN URLs.
+
+        Args:
+            source_urls: Source image URLs (duplicates allowed)
+
+        Returns:
+            ImageResult mapping each resolved source URL to its Naver URL
+
+        Raises:
+            NaverRateLimitError: If Naver throttled an upload (images uploaded
+                before it are still stored)
+        """
+        result = ImageResult()
+        urls = list(dict.fromkeys(url for url in source_urls if url))
+        if not urls:
+            return result
+
+        # 1. Known source URLs
+        rows = await self.db.execute(
+            select(ImageAsset.source_url, ImageAsset.naver_url).where(
+                ImageAsset.source_url.in_(urls)
+            )
+        )
+        result.naver_urls.update({row.source_url: row.naver_url for row in rows})
+
+        # 2. Download and hash the rest
+        unknown = [url for url in urls if url not in result.naver_urls]
+        if not unknown:
+            result.reused_count = len(result.naver_urls)
+            return result
+        downloads = await self._download_all(unknown, result)
+
+        hashes: Dict[str, str] = {}
+        contents: Dict[str, bytes] = {}
+        for url, content in downloads.items():
+            content_hash = hashlib.sha256(content).hexdigest()
+            hashes[url] = content_hash
+            contents.setdefault(content_hash, content)
+
+        # 3. Known content hashes
+        naver_by_hash: Dict[str, str] = {}
+        if contents:
+            rows = await self.db.execute(
+                select(ImageAsset.content_hash, ImageAsset.naver_url).where(
+                    ImageAsset.content_hash.in_(list(contents))
+                )
+            )
+            naver_by_hash = {row.content_hash: row.naver_url for row in rows}
+
+        # 4. Upload unseen images once per hash
+        unseen = {h: content for h, content in contents.items() if h not in naver_by_hash}
+        uploaded, throttled = await self._upload_all(unseen, result)
+        naver_by_hash.update(uploaded)
+
+        # 5. Remember every newly resolved URL
+        asset_rows = []
+        for url, content_hash in hashes.items():
+            naver_url = naver_by_hash.get(content_hash)
+            if naver_url is None:
+                result.failed_urls.setdefault(url, "upload failed")
+                continue
+            result.naver_urls[url] = naver_url
+            asset_rows.append(
+                {
+                    "source_url": url,
+                    "content_hash": content_hash,
+                    "naver_url": naver_url,
+                    "size_bytes": len(contents[content_hash]),
+                }
+            )
+
+        if asset_rows:
+            stmt = pg_insert(ImageAsset).values(asset_rows)
+            await self.db.execute(stmt.on_conflict_do_nothing(index_elements=["source_url"]))
+            await self.db.commit()
+
+        if throttled is not None:
+            raise throttled
+
+        result.reused_count = len(result.naver_urls) - result.uploaded_count
+        logger.info(
+            f"Images: {len(urls)} unique, {result.uploaded_count} uploaded, "
+            f"{result.reused_count} reused, {len(result.failed_urls)} failed"
+        )
+        return result
+
+    async def _download_all(self, urls: List[str], result: ImageResult) -> Dict[str, bytes]:
+        """Download images with bounded concurrency; failures go to result.failed_urls."""
+        semaphore = asyncio.Semaphore(self.download_concurrency)
+        client = self.http_client or httpx.AsyncClient(timeout=30.0, follow_redirects=True)
+
+        async def download(url: str) -> Optional[bytes]:
+            async with semaphore:
+                try:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                except httpx.HTTPError as e:
+                    logger.warning(f"Failed to download image {url}: {e}")
+                    result.failed_urls[url] = str(e)
+                    return None
+
+                if len(response.content) > self.max_image_bytes:
+                    result.failed_urls[url] = f"image too large: {len(response.content)} bytes"
+                    return None
+                return response.content
+
+        try:
+            contents = await asyncio.gather(*(download(url) for url in urls))
+        finally:
+            if self.http_client is None:
+                await client.aclose()
+
+        return {
+            url: content for url, content in zip(urls, contents, strict=True) if content is not None
+        }
+
+    async def _upload_all(
+        self, images: Dict[str, bytes], result: ImageResult
+    ) -> Tuple[Dict[str, str], Optional[NaverRateLimitError]]:
+        """
+        Upload images keyed by content hash.
+
+        Once Naver throttles an upload, the uploads not started yet are skipped.
+
+        Returns:
+            (hash -> Naver URL, the throttling error if any upload was throttled)
+        """
+        semaphore = asyncio.Semaphore(self.upload_concurrency)
+        throttled: List[NaverRateLimitError] = []
+
+        async def upload(content_hash: str, content: bytes) -> Optional[str]:
+            async with semaphore:
+                if throttled:
+                    return None
+                try:
+                    response = await self.naver_client.upload_image(
+                        content, filename=f"{content_hash[:16]}.jpg"
+                    )
+                    naver_url: str = response["image_url"]
+                except NaverRateLimitError as e:
+                    throttled.append(e)
+                    return None
+                except UPLOAD_ERRORS as e:
+                    if getattr(e, "status_code", None) == 429:
+                        # Throttled behind the dispatcher
+                        error = NaverRateLimitError("Rate limit exceeded")
+                        error.__cause__ = e
+                        throttled.append(error)
+                        return None
+                    logger.error(f"Failed to upload image {content_hash[:16]}: {e}")
+                    return None
+                result.uploaded_count += 1
+                return naver_url
+
+        hashes = list(images)
+        urls = await asyncio.gather(*(upload(h, images[h]) for h in hashes))
+        uploaded = {h: url for h, url in zip(hashes, urls, strict=True) if url is not None}
+        return uploaded, throttled[0] if throttled else None
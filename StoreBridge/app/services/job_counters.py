@@ -0,0 +1,210 @@
+"""Per-job registration state counters kept in Redis."""
+
+import logging
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import redis.asyncio as aioredis
+
+from app.config import settings
+from app.models import State
+
+logger = logging.getLogger(__name__)
+
+COUNTERS_KEY = "job:counters:{job_id}"
+DIRTY_KEY = "job:counters:dirty"
+
+# Hash field bumped with every update, so readers can order counter values
+VERSION_FIELD = "version"
+
+# Hash field counting products that failed to be written (never registered)
+WRITE_FAILED_FIELD = "WRITE_FAILED"
+
+# Registration states that still expect a transition
+IN_FLIGHT_STATES = (
+    State.PENDING,
+    State.VALIDATED,
+    State.UPLOADING,
+    State.REGISTERING,
+    State.RETRYING,
+)
+
+# Registration states that end a registration
+FINAL_STATES = (State.COMPLETED, State.FAILED, State.MANUAL_REVIEW)
+
+
+@dataclass(frozen=True)
+class Transition:
+    """A registration's state change (from_state None = newly owned by the job)."""
+
+    job_id: Optional[uuid.UUID]
+    from_state: Optional[State]
+    to_state: State
+    error_type: str = ""
+
+
+def summarize(state_counts: Dict[str, int]) -> Tuple[int, int, int]:
+    """
+    Reduce per-state counts to job statistics.
+
+    Returns:
+        (success_count, failed_count, in_flight_count); MANUAL_REVIEW and
+        products that failed to be written count as failed
+    """
+    success = state_counts.get(State.COMPLETED.value, 0)
+    failed = (
+        state_counts.get(State.FAILED.value, 0)
+        + state_counts.get(State.MANUAL_REVIEW.value, 0)
+        + state_counts.get(WRITE_FAILED_FIELD, 0)
+    )
+    in_flight = sum(state_counts.get(state.value, 0) for state in IN_FLIGHT_STATES)
+    return success, failed, in_flight
+
+
+class JobCounters:
+    """
+    Registration counts per job and state, maintained with HINCRBY.
+
+    Every state transition moves one count between two fields of the job's
+    hash, so reading a job's progress is one HGETALL instead of a GROUP BY
+    over product_registrations. Every update also bumps the hash's version
+    field and reads the hash back in the same transaction, so the counts
+    returned with an update are exactly those of that version. Updated jobs
+    are added to a dirty set that a periodic task drains into the jobs table.
+    Updates are best effort: a lost update is corrected by reconciling from
+    the database (reset).
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional["aioredis.Redis[str]"] = None,
+        ttl: int = settings.job_counters_ttl,
+    ) -> None:
+        """
+        Initialize counters.
+
+        Args:
+            redis_client: Redis client (if None, creates new one)
+            ttl: Hash lifetime in seconds after the last update (default: 7 days)
+        """
+        self.redis = redis_client or aioredis.from_url(settings.redis_url, decode_responses=True)
+        self.ttl = ttl
+
+    async def record(self, transitions: Iterable[Transition]) -> Dict[str, Dict[str, int]]:
+        """
+        Apply state transitions.
+
+        Args:
+            transitions: Transitions of registrations (those without a job are ignored)
+
+        Returns:
+            Job UUID string -> counts after the update (see increment)
+        """
+        deltas: Dict[uuid.UUID, Dict[str, int]] = {}
+        for transition in transitions:
+            if transition.job_id is None:
+                continue
+            delta = deltas.setdefault(transition.job_id, Counter())
+            if transition.from_state is not None:
+                delta[transition.from_state.value] -= 1
+            delta[transition.to_state.value] += 1
+        return await self.increment(deltas)
+
+    async def increment(self, deltas: Dict[Any, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+        """
+        Add per-state deltas to jobs' counters in one round trip.
+
+        Args:
+            deltas: Job UUID -> state -> delta
+
+        Returns:
+            Job UUID string -> counts (with their version) right after the
+            update, for every changed job; empty if Redis failed
+        """
+        pipe = self.redis.pipeline(transaction=True)
+        dirty: List[str] = []
+        for job_id, delta in deltas.items():
+            key = COUNTERS_KEY.format(job_id=job_id)
+            changed = False
+            for state, count in delta.items():
+                if count:
+                    pipe.hincrby(key, state, count)
+                    changed = True
+            if changed:
+                pipe.hincrby(key, VERSION_FIELD, 1)
+                pipe.expire(key, self.ttl)
+                dirty.append(str(job_id))
+        if not dirty:
+            return {}
+        pipe.sadd(DIRTY_KEY, *dirty)
+        for job_id in dirty:
+            pipe.hgetall(COUNTERS_KEY.format(job_id=job_id))
+        try:
+            results = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to update job counters for {dirty}: {e}")
+            return {}
+        return {
+            job_id: {state: int(count) for state, count in raw.items()}
+            for job_id, raw in zip(dirty, results[-len(dirty) :], strict=True)
+        }
+
+    async def get(self, job_id: Any) -> Dict[str, int]:
+        """
+        Get a job's counts per state.
+
+        Returns:
+            State -> count (empty if the job has no counters)
+        """
+        raw = await self.redis.hgetall(COUNTERS_KEY.format(job_id=job_id))
+        return {state: int(count) for state, count in raw.items()}
+
+    async def get_many(self, job_ids: List[str]) -> List[Dict[str, int]]:
+        """Get several jobs' counts per state in one round trip."""
+        pipe = self.redis.pipeline(transaction=False)
+        for job_id in job_ids:
+            pipe.hgetall(COUNTERS_KEY.format(job_id=job_id))
+        return [
+            {state: int(count) for state, count in raw.items()} for raw in await pipe.execute()
+        ]
+
+    async def reset(self, job_id: Any, state_counts: Dict[str, int]) -> None:
+        """
+        Replace a job's registration counts with counts recomputed from the database.
+
+        The version keeps increasing across resets, and write failures (which
+        the database does not record per job) are kept.
+
+        Args:
+            job_id: Job UUID
+            state_counts: State -> count
+        """
+        key = COUNTERS_KEY.format(job_id=job_id)
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hdel(key, *(state.value for state in State))
+        for state, count in state_counts.items():
+            pipe.hset(key, state, count)
+        pipe.hincrby(key, VERSION_FIELD, 1)
+        pipe.expire(key, self.ttl)
+        await pipe.execute()
+
+    async def pop_dirty(self, count: int = 1000) -> List[str]:
+        """
+        Take up to count jobs whose counters changed since the last flush.
+
+        Returns:
+            Job UUID strings
+        """
+        return [str(job_id) for job_id in await self.redis.spop(DIRTY_KEY, count) or []]
+
+    async def mark_dirty(self, job_ids: Iterable[str]) -> None:
+        """Queue jobs for the next flush (e.g. after a failed flush)."""
+        job_ids = list(job_ids)
+        if job_ids:
+            await self.redis.sadd(DIRTY_KEY, *job_ids)
+
+    async def close(self) -> None:
+        """Close Redis connection."""
+        await self.redis.close()
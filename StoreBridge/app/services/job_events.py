@@ -0,0 +1,246 @@
+"""Job progress events over Redis pub/sub."""
+
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import redis.asyncio as aioredis
+
+from app.config import settings
+from app.models import JobStatus
+from app.services.job_counters import VERSION_FIELD, summarize
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_KEY = "job:events:{job_id}"
+
+# Statuses that end a job even with registrations outstanding
+ABORTED_STATUSES = {JobStatus.FAILED.value, JobStatus.CANCELLED.value}
+
+
+def channel(job_id: str) -> str:
+    """Pub/sub channel carrying a job's events."""
+    return CHANNEL_KEY.format(job_id=job_id)
+
+
+class JobEventPublisher:
+    """
+    Publish job events from workers.
+
+    Events are deltas, so publishing never reads the database:
+    - {"type": "status", "status": "RUNNING", "total_count": 1000}
+    - {"type": "progress", "success": 48, "failed": 2, "errors": {"MANUAL_REVIEW": 2}}
+
+    Progress of jobs counted in JobCounters also carries the job's counters
+    as of the update ({"counters": {"COMPLETED": 48, ..., "version": 7}}), so
+    a subscriber whose snapshot already includes the update can skip it.
+
+    Publishing is best effort; a Redis error is logged and never fails the task.
+    """
+
+    def __init__(self, redis_client: Optional["aioredis.Redis[str]"] = None) -> None:
+        """
+        Initialize publisher.
+
+        Args:
+            redis_client: Redis client (if None, creates new one)
+        """
+        self.redis = redis_client or aioredis.from_url(settings.redis_url, decode_responses=True)
+
+    async def publish(self, job_id: Any, event: Dict[str, Any]) -> None:
+        """
+        Publish an event on the job's channel.
+
+        Args:
+            job_id: Job UUID
+            event: Event payload
+        """
+        message = json.dumps({**event, "job_id": str(job_id), "ts": time.time()})
+        try:
+            await self.redis.publish(channel(str(job_id)), message)
+        except Exception as e:
+            logger.warning(f"Failed to publish event for job {job_id}: {e}")
+
+    async def status(
+        self, job_id: Any, status: JobStatus, total_count: Optional[int] = None
+    ) -> None:
+        """Publish a job status change."""
+        event: Dict[str, Any] = {"type": "status", "status": status.value}
+        if total_count is not None:
+            event["total_count"] = total_count
+        await self.publish(job_id, event)
+
+    async def progress(
+        self,
+        job_id: Any,
+        success: int = 0,
+        failed: int = 0,
+        errors: Optional[Dict[str, int]] = None,
+        counters: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """Publish finished registrations (counts are deltas, counters absolute)."""
+        if not (success or failed):
+            return
+        event: Dict[str, Any] = {
+            "type": "progress",
+            "success": success,
+            "failed": failed,
+            "errors": errors or {},
+        }
+        if counters is not None:
+            event["counters"] = counters
+        await self.publish(job_id, event)
+
+    async def close(self) -> None:
+        """Close Redis connection."""
+        await self.redis.close()
+
+
+@dataclass
+class JobProgress:
+    """Job progress rebuilt from a snapshot plus events."""
+
+    status: str
+    total_count: int = 0
+    success_count: int = 0
+    failed_count: int = 0
+    error_summary: Dict[str, int] = field(default_factory=dict)
+    started_at: Optional[datetime] = None
+    counters_version: Optional[int] = None
+
+    @property
+    def done_count(self) -> int:
+        return self.success_count + self.failed_count
+
+    @property
+    def finished(self) -> bool:
+        """
+        Whether no more events are expected.
+
+        An import with auto_register is COMPLETED once crawling ends, while its
+        registrations are still running, so COMPLETED alone is not the end.
+        """
+        if self.status in ABORTED_STATUSES:
+            return True
+        if self.status != JobStatus.COMPLETED.value:
+            return False
+        return self.total_count <= 0 or self.done_count >= self.total_count
+
+    @property
+    def progress_percent(self) -> float:
+        if self.total_count <= 0:
+            return 0.0
+        return round(self.done_count / self.total_count * 100, 2)
+
+    def estimated_remaining_seconds(self, now: Optional[datetime] = None) -> Optional[float]:
+        """
+        Remaining time at the job's observed throughput so far.
+
+        Returns:
+            Seconds, or None until there is a throughput to extrapolate from
+        """
+        if self.finished:
+            return 0.0
+        done = self.done_count
+        if self.started_at is None or done <= 0 or self.total_count <= 0:
+            return None
+        elapsed = ((now or datetime.now(timezone.utc)) - self.started_at).total_seconds()
+        if elapsed <= 0:
+            return None
+        remaining = max(0, self.total_count - done)
+        return round(remaining / (done / elapsed), 1)
+
+    def set_counters(self, state_counts: Dict[str, int]) -> bool:
+        """
+        Take the counts from the job's counters unless they are not newer.
+
+        Returns:
+            Whether the counts were taken
+        """
+        version = state_counts.get(VERSION_FIELD, 0)
+        if self.counters_version is not None and version <= self.counters_version:
+            return False
+        self.success_count, self.failed_count, _ = summarize(state_counts)
+        self.counters_version = version
+        return True
+
+    def apply(self, event: Dict[str, Any]) -> None:
+        """Apply a published event (progress already in the snapshot is skipped)."""
+        if event.get("type") == "status":
+            self.status = event["status"]
+            if "total_count" in event:
+                self.total_count = event["total_count"]
+            if self.status == JobStatus.RUNNING.value and self.started_at is None:
+                self.started_at = datetime.fromtimestamp(event["ts"], tz=timezone.utc)
+        elif event.get("type") == "progress":
+            if "counters" in event:
+                if not self.set_counters(event["counters"]):
+                    return
+            else:
+                self.success_count += event.get("success", 0)
+                self.failed_count += event.get("failed", 0)
+            for error_type, count in event.get("errors", {}).items():
+                self.error_summary[error_type] = self.error_summary.get(error_type, 0) + count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Progress payload for API responses."""
+        return {
+            "status": self.status,
+            "statistics": {
+                "total_count": self.total_count,
+                "success_count": self.success_count,
+                "failed_count": self.failed_count,
+                "progress_percent": self.progress_percent,
+            },
+            "error_summary": self.error_summary,
+            "estimated_remaining_seconds": self.estimated_remaining_seconds(),
+        }
+
+
+async def stream_job_events(
+    pubsub: aioredis.client.PubSub,
+    progress: JobProgress,
+    heartbeat_interval: float = 15.0,
+) -> AsyncIterator[str]:
+    """
+    Render a subscribed job channel as Server-Sent Events.
+
+    The caller subscribes before taking the snapshot in progress, so no event
+    is lost between the two; events carrying counters the snapshot already
+    includes are not counted again. Each event carries the delta and the
+    resulting progress; the stream ends once the job finishes.
+
+    Args:
+        pubsub: PubSub already subscribed to the job's channel
+        progress: Snapshot to apply events to
+        heartbeat_interval: Seconds between keep-alive comments
+
+    Yields:
+        SSE-formatted messages
+    """
+    try:
+        yield _sse("snapshot", progress.to_dict())
+
+        while not progress.finished:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=heartbeat_interval
+            )
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+
+            event = json.loads(message["data"])
+            progress.apply(event)
+            yield _sse(event.get("type", "progress"), {"delta": event, **progress.to_dict()})
+    finally:
+        await pubsub.unsubscribe()
+        await pubsub.close()
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
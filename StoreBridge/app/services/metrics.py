@@ -0,0 +1,198 @@
+"""Prometheus metrics for the import/registration pipeline."""
+
+import logging
+import os
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Tuple
+
+import redis.asyncio as aioredis
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets for Domeggook/Naver calls (seconds)
+EXTERNAL_CALL_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+
+EXTERNAL_CALL_SECONDS = Histogram(
+    "storebridge_external_call_duration_seconds",
+    "Latency of Domeggook and Naver API calls",
+    ["service", "method", "endpoint", "outcome"],
+    buckets=EXTERNAL_CALL_BUCKETS,
+)
+
+RATE_LIMIT_DECISIONS = Counter(
+    "storebridge_rate_limit_decisions_total",
+    "Naver rate limiter script results",
+    ["limiter", "outcome"],
+)
+
+REGISTRATION_TRANSITIONS = Counter(
+    "storebridge_registration_transitions_total",
+    "Product registrations entering each state",
+    ["state"],
+)
+
+RESPONSE_CACHE_LOOKUPS = Counter(
+    "storebridge_domeggook_cache_lookups_total",
+    "Domeggook response cache lookups (hit, negative, stale, miss, revalidated)",
+    ["endpoint", "outcome"],
+)
+
+DB_COMMIT_SECONDS = Histogram(
+    "storebridge_db_commit_duration_seconds",
+    "Duration of database session commits (flush included)",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+# Shared state read from Redis at scrape time by the API process only, so
+# every worker does not export its own copy
+QUEUE_DEPTH = Gauge(
+    "storebridge_celery_queue_depth",
+    "Messages waiting in each Celery queue",
+    ["queue"],
+    multiprocess_mode="livemax",
+)
+
+NAVER_EFFECTIVE_TPS = Gauge(
+    "storebridge_naver_effective_tps",
+    "Naver request rate currently allowed by the adaptive rate controller",
+    multiprocess_mode="livemax",
+)
+
+# Rate limiter script return codes -> outcome label
+WINDOW_OUTCOMES = {0: "blocked", 1: "normal", 2: "burst"}
+GCRA_OUTCOMES = {0: "blocked", 1: "allowed", 2: "reserved"}
+
+# Path segments that are identifiers (Naver product numbers, UUIDs)
+_ID_SEGMENT = re.compile(r"/(?:\d+|[0-9a-fA-F-]{32,36})(?=/|$)")
+
+
+def endpoint_label(path: str) -> str:
+    """
+    Collapse identifiers in a request path so each endpoint is one series.
+
+    Args:
+        path: Request path, e.g. "/v2/products/origin-products/123"
+
+    Returns:
+        Path template, e.g. "/v2/products/origin-products/{id}"
+    """
+    return _ID_SEGMENT.sub("/{id}", path.split("?", 1)[0])
+
+
+@contextmanager
+def track_external_call(service: str, method: str, endpoint: str) -> Iterator[None]:
+    """
+    Time an external API call.
+
+    The outcome label is "ok", the HTTP status of an error response, or the
+    exception class name (e.g. ReadTimeout).
+
+    Args:
+        service: "domeggook" or "naver"
+        method: HTTP method
+        endpoint: Request path (identifiers are collapsed)
+    """
+    started = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield
+    except Exception as e:
+        status_code = getattr(getattr(e, "response", None), "status_code", None)
+        outcome = str(status_code) if status_code else type(e).__name__
+        raise
+    finally:
+        EXTERNAL_CALL_SECONDS.labels(
+            service, method.upper(), endpoint_label(endpoint), outcome
+        ).observe(time.perf_counter() - started)
+
+
+def record_rate_limit(limiter: str, code: int) -> None:
+    """Count a rate limiter script result ("window" or "gcra" limiter)."""
+    outcomes = GCRA_OUTCOMES if limiter == "gcra" else WINDOW_OUTCOMES
+    RATE_LIMIT_DECISIONS.labels(limiter, outcomes.get(code, str(code))).inc()
+
+
+async def refresh_shared_gauges(redis_client: "aioredis.Redis[str]") -> None:
+    """
+    Update the gauges that describe shared state (queue depth, effective rate).
+
+    Called before each scrape of the API's /metrics. Best effort: on Redis
+    errors the gauges keep their previous values.
+
+    Args:
+        redis_client: Redis client of the Celery broker
+    """
+    # Imported here: the worker modules import this one
+    from app.services.rate_limiter import AdaptiveRateController
+    from app.workers.celery_app import celery_queues
+
+    queues = celery_queues()
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for queue in queues:
+            pipe.llen(queue)
+        depths = await pipe.execute()
+        for queue, depth in zip(queues, depths, strict=True):
+            QUEUE_DEPTH.labels(queue).set(depth)
+
+        controller = AdaptiveRateController(redis_client=redis_client)
+        NAVER_EFFECTIVE_TPS.set(await controller.current_rate())
+    except Exception as e:
+        logger.warning(f"Failed to refresh metrics gauges: {e}")
+
+
+def _registry() -> CollectorRegistry:
+    """Registry to expose (aggregated over processes in multiprocess mode)."""
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Render all metrics in the Prometheus text format.
+
+    Returns:
+        (body, content_type)
+    """
+    return generate_latest(_registry()), CONTENT_TYPE_LATEST
+
+
+def start_metrics_server(port: int = settings.prometheus_port) -> None:
+    """
+    Serve /metrics over HTTP from a background thread (Celery workers).
+
+    A prefork worker records metrics in its child processes, so the server in
+    the parent only sees them when PROMETHEUS_MULTIPROC_DIR is set.
+
+    Args:
+        port: Port to listen on (0 disables the server)
+    """
+    if port <= 0:
+        return
+    start_http_server(port, registry=_registry())
+    logger.info(f"Metrics server listening on :{port}")
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop a finished worker process's live gauges (multiprocess mode)."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,483 @@
+"""Long-lived Naver API dispatcher that owns the 2 TPS budget."""
+
+import asyncio
+import base64
+import json
+import logging
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import redis.asyncio as aioredis
+
+from app.config import settings
+from app.connectors.naver_client import NaverClient
+from app.services.quota_ledger import QuotaLedger
+from app.services.rate_limiter import create_rate_limiter
+from app.services.token_cache import NaverTokenCache
+
+logger = logging.getLogger(__name__)
+
+PRIORITIES = ["urgent", "high", "normal"]
+QUEUE_KEY = "naver:dispatch:queue:{priority}"
+# Requests claimed from a lane and not answered yet (moved back on startup)
+PROCESSING_KEY = "naver:dispatch:processing:{priority}"
+# Wakes the idle dispatcher when a request is queued (holds at most one token)
+DOORBELL_KEY = "naver:dispatch:doorbell"
+REPLY_KEY = "naver:dispatch:reply:{request_id}"
+REPLY_TTL = 600
+
+
+class NaverDispatchError(Exception):
+    """Naver call failed inside the dispatcher."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _queue_key(priority: str) -> str:
+    """Redis list holding pending requests for a priority."""
+    if priority not in PRIORITIES:
+        priority = "normal"
+    return QUEUE_KEY.format(priority=priority)
+
+
+def _processing_key(priority: str) -> str:
+    """Redis list holding claimed, unanswered requests of a priority."""
+    return PROCESSING_KEY.format(priority=priority)
+
+
+class StrideScheduler:
+    """
+    Weighted fair choice between priority lanes (stride scheduling).
+
+    Serving a lane advances its pass by 1 / weight, and the backlogged lane
+    with the lowest pass goes next. With weights 8:3:1 and every lane busy,
+    urgent gets 8 of every 12 slots while normal still gets 1, so a bulk
+    import neither blocks an urgent job nor starves behind it. A lane that
+    was idle rejoins at the current pass rather than spending credit saved
+    while idle.
+    """
+
+    def __init__(self, weights: Dict[str, int]) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            weights: Priority -> relative share of rate limit slots (missing = 1)
+        """
+        self.strides = {p: 1.0 / max(1, weights.get(p, 1)) for p in PRIORITIES}
+        self.passes = dict.fromkeys(PRIORITIES, 0.0)
+        self.global_pass = 0.0
+
+    def pick(self, active: Iterable[str]) -> str:
+        """
+        Choose the lane to serve next.
+
+        Args:
+            active: Lanes with pending requests (at least one)
+
+        Returns:
+            Chosen priority (ties go to the higher priority)
+        """
+        active = set(active)
+        lanes = [p for p in PRIORITIES if p in active]
+        for lane in lanes:
+            self.passes[lane] = max(self.passes[lane], self.global_pass)
+        return min(lanes, key=lambda lane: (self.passes[lane], PRIORITIES.index(lane)))
+
+    def charge(self, lane: str) -> None:
+        """Account one served request to a lane."""
+        self.global_pass = max(self.global_pass, self.passes[lane])
+        self.passes[lane] += self.strides[lane]
+
+
+class NaverDispatcher:
+    """
+    Single process that performs every Naver call on behalf of the workers.
+
+    Keeps one warm HTTP/2 connection pool and one OAuth token (refreshed in the
+    background before it expires), and drains per-priority Redis queues at the
+    rate allowed by the shared rate limiter. A rate limit slot is only taken
+    once an in-flight slot is free, so granted slots are never left unused.
+    Each granted slot goes to the lane picked by weighted stride scheduling
+    (naver_priority_weights). The pick happens when the slot is granted, so
+    an urgent request that arrives while we wait for a slot is still
+    considered.
+
+    Requests are claimed by moving them atomically to a per-lane processing
+    list and removed from it once answered. Requests claimed by a dispatcher
+    that died are moved back to the head of their lane on startup (delivery
+    is at-least-once), so only one dispatcher may run at a time.
+
+    Protocol:
+    - Workers RPUSH a JSON request to naver:dispatch:queue:{priority}, then
+      ring naver:dispatch:doorbell
+    - The dispatcher LPUSHes a JSON reply to naver:dispatch:reply:{id}
+    """
+
+    # KEYS = lane queues in preference order, then their processing lists in
+    # the same order. Moves the head of the first non-empty lane to its
+    # processing list; returns {1-based lane index, request} or nil.
+    LUA_CLAIM = """
+    local lanes = #KEYS / 2
+    for i = 1, lanes do
+        local raw = redis.call('LMOVE', KEYS[i], KEYS[lanes + i], 'LEFT', 'RIGHT')
+        if raw then
+            return {i, raw}
+        end
+    end
+    return nil
+    """
+
+    def __init__(
+        self,
+        client: Optional[NaverClient] = None,
+        redis_client: Optional["aioredis.Redis[str]"] = None,
+        max_in_flight: int = settings.naver_dispatcher_max_in_flight,
+        weights: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Initialize dispatcher.
+
+        Args:
+            client: Naver API client (default: create new)
+            redis_client: Redis client (if None, creates new one)
+            max_in_flight: Maximum concurrent Naver HTTP requests (default: 4)
+            weights: Slot share per priority (default: naver_priority_weights)
+        """
+        self.redis = redis_client or aioredis.from_url(settings.redis_url, decode_responses=True)
+        self.client = client or NaverClient(
+            rate_limiter=create_rate_limiter(self.redis),
+            token_cache=NaverTokenCache(redis_client=self.redis),
+            quota=QuotaLedger(redis_client=self.redis).usage("naver"),
+        )
+        self.max_in_flight = max_in_flight
+        self.scheduler = StrideScheduler(weights or settings.naver_priority_weights)
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._stopping = False
+        self._claim_sha: Optional[str] = None
+
+    async def run(self) -> None:
+        """Serve requests until stop() is called."""
+        logger.info("Naver dispatcher started")
+        await self.recover()
+        await self.client._ensure_authenticated()
+        refresher = asyncio.create_task(self._refresh_token_loop())
+
+        try:
+            while not self._stopping:
+                await self.dispatch_next(block_timeout=1)
+        finally:
+            refresher.cancel()
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            logger.info("Naver dispatcher stopped")
+
+    def stop(self) -> None:
+        """Ask the run loop to exit after the current request."""
+        self._stopping = True
+
+    async def recover(self) -> int:
+        """
+        Move requests left claimed by a previous dispatcher back to their lanes.
+
+        Returns:
+            Number of requests moved back
+        """
+        recovered = 0
+        for priority in PRIORITIES:
+            # Newest claim first, so the oldest ends up at the head again
+            while await self.redis.lmove(
+                _processing_key(priority), _queue_key(priority), "RIGHT", "LEFT"
+            ):
+                recovered += 1
+        if recovered:
+            logger.warning(f"Re-queued {recovered} unanswered Naver dispatch requests")
+        return recovered
+
+    async def dispatch_next(self, block_timeout: int = 1) -> bool:
+        """
+        Wait for an in-flight slot, a request and a rate limit slot, then send it.
+
+        Args:
+            block_timeout: Seconds to block waiting for a request
+
+        Returns:
+            True if a request was dispatched
+        """
+        await self._in_flight.acquire()
+        try:
+            claimed = await self._next_request(block_timeout)
+        except BaseException:
+            self._in_flight.release()
+            raise
+        if claimed is None:
+            self._in_flight.release()
+            return False
+
+        priority, raw = claimed
+        task = asyncio.create_task(self._execute(raw, priority))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _lane_lengths(self) -> List[int]:
+        """Pending requests per lane, in PRIORITIES order."""
+        pipe = self.redis.pipeline(transaction=False)
+        for priority in PRIORITIES:
+            pipe.llen(_queue_key(priority))
+        lengths: List[int] = await pipe.execute()
+        return lengths
+
+    async def _next_request(self, block_timeout: int) -> Optional[Tuple[str, str]]:
+        """
+        Wait for a request and a rate limit slot, then claim a request.
+
+        Returns:
+            (priority, raw) of the claimed request, or None if nothing is due
+        """
+        if not any(await self._lane_lengths()):
+            await self.redis.blpop([DOORBELL_KEY], timeout=block_timeout)
+            if not any(await self._lane_lengths()):
+                return None
+
+        if not await self.client.rate_limiter.acquire_with_wait():
+            # No slot within max_wait; the requests stay queued
+            return None
+        return await self._claim()
+
+    async def _claim(self) -> Optional[Tuple[str, str]]:
+        """
+        Claim the head of the lane the stride scheduler picks for this slot.
+
+        Returns:
+            (priority, raw) of the claimed request, or None if every lane is empty
+        """
+        lengths = await self._lane_lengths()
+        active = [p for p, length in zip(PRIORITIES, lengths, strict=True) if length]
+        if not active:
+            return None
+        chosen = self.scheduler.pick(active)
+        # Fall back to the other lanes if the chosen one emptied meanwhile
+        order = [chosen] + [p for p in PRIORITIES if p != chosen]
+
+        if self._claim_sha is None:
+            self._claim_sha = await self.redis.script_load(self.LUA_CLAIM)  # type: ignore[no-untyped-call]
+        keys = [_queue_key(p) for p in order] + [_processing_key(p) for p in order]
+        claimed = await self.redis.evalsha(self._claim_sha, len(keys), *keys)  # type: ignore[no-untyped-call]
+        if not claimed:
+            return None
+
+        index, raw = claimed
+        priority = order[int(index) - 1]
+        self.scheduler.charge(priority)
+        return priority, raw
+
+    async def _execute(self, raw: str, priority: str = "normal") -> None:
+        """Perform one request, push the reply and drop the request from processing."""
+        try:
+            await self._answer(raw)
+        finally:
+            await self.redis.lrem(_processing_key(priority), 1, raw)
+
+    async def _answer(self, raw: str) -> None:
+        """Perform one request and push the reply."""
+        try:
+            request = json.loads(raw)
+        except ValueError:
+            self._in_flight.release()
+            logger.error(f"Dropping malformed dispatch request: {raw[:200]}")
+            return
+
+        reply: Dict[str, Any]
+        try:
+            deadline = request.get("deadline")
+            if deadline is not None and time.time() > deadline:
+                raise NaverDispatchError("Request expired before dispatch")
+
+            if request.get("kind") == "upload_image":
+                data = await self.client.upload_image(
+                    base64.b64decode(request["image"]),
+                    request.get("filename", "image.jpg"),
+                    rate_limit=False,
+                )
+            else:
+                data = await self.client._make_request(
+                    request["method"],
+                    request["endpoint"],
+                    data=request.get("data"),
+                    params=request.get("params"),
+                    rate_limit=False,
+                )
+            reply = {"ok": True, "data": data}
+
+        except Exception as e:
+            response = getattr(e, "response", None) or getattr(e.__cause__, "response", None)
+            status_code = getattr(response, "status_code", None)
+            logger.error(f"Dispatched Naver call failed: {e}")
+            reply = {"ok": False, "error": str(e), "status_code": status_code}
+
+        finally:
+            self._in_flight.release()
+
+        reply_key = REPLY_KEY.format(request_id=request["id"])
+        await self.redis.lpush(reply_key, json.dumps(reply))
+        await self.redis.expire(reply_key, REPLY_TTL)
+
+    async def _refresh_token_loop(self) -> None:
+        """Refresh the OAuth token before it expires so no request waits on it."""
+        while True:
+            refresh_in = self.client.token_refresh_in()
+            if refresh_in is None:
+                return
+            await asyncio.sleep(refresh_in)
+            try:
+                await self.client._refresh_token()
+            except Exception as e:
+                logger.error(f"Background token refresh failed: {e}")
+                await asyncio.sleep(5)
+
+    async def close(self) -> None:
+        """Close Naver client and Redis connection."""
+        await self.client.close()
+        await self.redis.close()
+
+
+class NaverDispatchClient:
+    """
+    NaverClient-compatible facade that submits calls to the dispatcher.
+
+    Celery tasks use this instead of NaverClient when the dispatcher is
+    enabled, so they never open their own HTTP connection or fetch a token.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional["aioredis.Redis[str]"] = None,
+        priority: str = "normal",
+        timeout: float = settings.naver_dispatcher_timeout,
+    ) -> None:
+        """
+        Initialize dispatch client.
+
+        Args:
+            redis_client: Redis client (if None, creates new one)
+            priority: Queue priority (urgent, high, normal)
+            timeout: Seconds to wait for the dispatcher's reply (default: 300)
+        """
+        self._owns_redis = redis_client is None
+        self.redis = redis_client or aioredis.from_url(settings.redis_url, decode_responses=True)
+        self.priority = priority
+        self.timeout = timeout
+
+    async def _submit(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Enqueue a request and wait for its reply.
+
+        Args:
+            request: Request payload (without id)
+
+        Returns:
+            Response JSON data
+
+        Raises:
+            TimeoutError: If no reply arrives within timeout
+            Exception: If the Naver call failed
+        """
+        request_id = str(uuid.uuid4())
+        request = {**request, "id": request_id, "deadline": time.time() + self.timeout}
+
+        await self.redis.rpush(_queue_key(self.priority), json.dumps(request))
+        # One token is enough to wake the dispatcher
+        await self.redis.lpush(DOORBELL_KEY, "1")
+        await self.redis.ltrim(DOORBELL_KEY, 0, 0)
+        popped = await self.redis.blpop(
+            [REPLY_KEY.format(request_id=request_id)], timeout=int(self.timeout) + 1
+        )
+        if popped is None:
+            raise TimeoutError(f"Naver dispatcher did not reply within {self.timeout}s")
+
+        reply = json.loads(popped[1])
+        if not reply["ok"]:
+            if reply.get("status_code") == 429:
+                raise NaverDispatchError("Rate limit exceeded", 429)
+            raise NaverDispatchError(reply["error"], reply.get("status_code"))
+        data: Dict[str, Any] = reply["data"]
+        return data
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Submit an API request through the dispatcher."""
+        return await self._submit(
+            {"method": method, "endpoint": endpoint, "data": data, "params": params}
+        )
+
+    async def upload_image(self, image_data: bytes, filename: str = "image.jpg") -> Dict[str, Any]:
+        """Upload image to Naver CDN through the dispatcher."""
+        return await self._submit(
+            {
+                "kind": "upload_image",
+                "image": base64.b64encode(image_data).decode("ascii"),
+                "filename": filename,
+            }
+        )
+
+    async def register_product(self, product_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Register product to Naver Smart Store."""
+        data = await self._make_request("POST", "/v2/products", data=product_data)
+        return {"success": True, "originProductNo": data.get("originProductNo")}
+
+    async def get_product(self, product_id: str) -> Dict[str, Any]:
+        """Get product detail from Naver."""
+        return await self._make_request("GET", f"/v2/products/{product_id}")
+
+    async def update_product(
+        self, product_id: str, product_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Update product in Naver Smart Store."""
+        data = await self._make_request("PUT", f"/v2/products/{product_id}", data=product_data)
+        return {"success": True, "originProductNo": data.get("originProductNo")}
+
+    async def delete_product(self, product_id: str) -> Dict[str, Any]:
+        """Delete product from Naver Smart Store."""
+        await self._make_request("DELETE", f"/v2/products/{product_id}")
+        return {"success": True}
+
+    async def get_category_attributes(self, category_id: str) -> Dict[str, Any]:
+        """Get required attributes for a category."""
+        return await self._make_request("GET", f"/v1/categories/{category_id}/attributes")
+
+    async def close(self) -> None:
+        """Close Redis connection (only if this client created it)."""
+        if self._owns_redis:
+            await self.redis.close()
+
+    async def __aenter__(self) -> "NaverDispatchClient":
+        """Async context manager enter."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+
+async def main() -> None:
+    """Run the dispatcher until interrupted."""
+    logging.basicConfig(level=logging.INFO)
+    dispatcher = NaverDispatcher()
+    try:
+        await dispatcher.run()
+    finally:
+        await dispatcher.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,6 +1,14 @@
 """Option mapper for converting Domeggook options to Naver format."""
 
-from typing import Any, Dict, List, Optional
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Pattern, Sequence, Tuple
+
+
+def _keyword_pattern(keywords: Sequence[str]) -> Pattern[str]:
+    """Compile keywords into one alternation (longest first) for substring search."""
+    return re.compile("|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)))
 
 
 class OptionMapper:
@@ -11,9 +19,28 @@ class OptionMapper:
     - 1D options (simple): ["블랙", "화이트", "네이비"]
     - 2D options (combination): ["블랙-S", "블랙-M", "화이트-S"]
     - 3D options (combination): ["블랙-S-면", "화이트-M-폴리"]
+
+    Keyword tables are compiled once per class, and parse() results are
+    memoized by the raw option list since many products share identical
+    option sets (e.g. size runs). Parsed results are shared between callers
+    and must be treated as read-only.
     """
 
     SEPARATORS = ["-", "/", "_", " ", ":"]
+    PARSE_CACHE_SIZE = 4096
+
+    # Exact-match keywords for simple (1D) options
+    SIMPLE_SIZE_KEYWORDS: FrozenSet[str] = frozenset(["S", "M", "L", "XL", "XXL", "FREE"])
+    SIMPLE_COLOR_KEYWORDS: FrozenSet[str] = frozenset(
+        ["블랙", "화이트", "레드", "블루", "그린", "옐로우", "네이비"]
+    )
+
+    # Substring keywords for combination dimensions
+    SIZE_PATTERN = _keyword_pattern(["S", "M", "L", "XL", "XXL", "FREE", "24", "26", "28", "30"])
+    COLOR_PATTERN = _keyword_pattern(
+        ["블랙", "화이트", "레드", "블루", "그린", "옐로우", "네이비", "그레이"]
+    )
+    MATERIAL_PATTERN = _keyword_pattern(["면", "폴리", "나일론", "레이온", "울", "캐시미어"])
 
     def parse(self, raw_options: List[str]) -> Dict[str, Any]:
         """
@@ -23,7 +50,7 @@ class OptionMapper:
             raw_options: Raw option strings (e.g., ["블랙-S", "화이트-M"])
 
         Returns:
-            Parsed option structure:
+            Parsed option structure (shared, read-only):
             {
                 "type": "SIMPLE" | "COMBINATION" | "EMPTY",
                 "separator": str | None,
@@ -37,6 +64,16 @@ class OptionMapper:
         if not raw_options:
             return {"type": "EMPTY", "separator": None, "dimensions": [], "combinations": []}
 
+        return self._parse_cached(tuple(raw_options))
+
+    @classmethod
+    @lru_cache(maxsize=PARSE_CACHE_SIZE)
+    def _parse_cached(cls, raw_options: Tuple[str, ...]) -> Dict[str, Any]:
+        """parse() memoized per class by the raw option tuple."""
+        return cls()._parse(list(raw_options))
+
+    def _parse(self, raw_options: List[str]) -> Dict[str, Any]:
+        """Parse a non-empty option list (uncached)."""
         # Strip whitespace
         raw_options = [opt.strip() for opt in raw_options]
 
@@ -48,15 +85,19 @@ class OptionMapper:
             return self._parse_simple(raw_options)
         else:
             # Combination 2D/3D options
-            split_options = [opt.split(separator) for opt in raw_options]
-            # Strip whitespace from each part
-            split_options = [[part.strip() for part in opt] for opt in split_options]
+            split_options = [
+                [part.strip() for part in opt.split(separator)] for opt in raw_options
+            ]
             return self._parse_combination(split_options, separator)
 
     def _detect_separator(self, raw_options: List[str]) -> Optional[str]:
         """
         Detect separator used in options.
 
+        Each option is scanned once for all separators; the counts are then
+        checked in SEPARATORS order (space last, and only if nothing else is
+        used).
+
         Args:
             raw_options: Raw option strings
 
@@ -66,21 +107,25 @@ class OptionMapper:
         Raises:
             ValueError: If multiple separators are used inconsistently
         """
+        separator_chars = frozenset(self.SEPARATORS)
+        counts: Counter[str] = Counter()
+        for opt in raw_options:
+            counts.update(separator_chars.intersection(opt))
+
+        total = len(raw_options)
         detected_separator = None
         found_separators = []
 
         for sep in self.SEPARATORS:
             # Skip space separator initially to check for actual separators first
-            if sep == " ":
+            if sep == " " or not counts[sep]:
                 continue
 
-            if any(sep in opt for opt in raw_options):
-                found_separators.append(sep)
-                # Check if all options use this separator consistently
-                uses_sep = [sep in opt for opt in raw_options]
-                if all(uses_sep):
-                    detected_separator = sep
-                    break
+            found_separators.append(sep)
+            # Check if all options use this separator consistently
+            if counts[sep] == total:
+                detected_separator = sep
+                break
 
         # Check for inconsistent separators (some options use one, some use another)
         if len(found_separators) > 1:
@@ -88,13 +133,9 @@ class OptionMapper:
                 f"Inconsistent separator: both '{found_separators[0]}' and '{found_separators[1]}'"
             )
 
-        # If no separator found and contains space, check if space is actual separator
-        if detected_separator is None:
-            # Check for space separator (but only if consistent)
-            if any(" " in opt for opt in raw_options):
-                uses_space = [" " in opt for opt in raw_options]
-                if all(uses_space):
-                    detected_separator = " "
+        # If no separator found, space is the separator only if every option uses it
+        if detected_separator is None and counts[" "] == total:
+            detected_separator = " "
 
         return detected_separator
 
@@ -159,7 +200,7 @@ class OptionMapper:
         # Extract unique values per dimension
         dimensions = []
         for dim_idx in range(num_dimensions):
-            values = list(set(opt[dim_idx] for opt in split_options if len(opt) > dim_idx))
+            values = list({opt[dim_idx] for opt in split_options if len(opt) > dim_idx})
             dimension_name = self._infer_dimension_name_from_values(values, dim_idx)
             dimensions.append({"name": dimension_name, "values": sorted(values)})
 
@@ -188,11 +229,8 @@ class OptionMapper:
             Inferred dimension name (e.g., "색상", "사이즈")
         """
         # Simple heuristics
-        size_keywords = ["S", "M", "L", "XL", "XXL", "FREE"]
-        color_keywords = ["블랙", "화이트", "레드", "블루", "그린", "옐로우", "네이비"]
-
-        has_size = any(v.upper() in size_keywords for v in values)
-        has_color = any(v in color_keywords for v in values)
+        has_size = any(v.upper() in self.SIMPLE_SIZE_KEYWORDS for v in values)
+        has_color = any(v in self.SIMPLE_COLOR_KEYWORDS for v in values)
 
         if has_size:
             return "사이즈"
@@ -212,20 +250,12 @@ class OptionMapper:
         Returns:
             Inferred dimension name
         """
-        # Try to infer from values
-        size_keywords = ["S", "M", "L", "XL", "XXL", "FREE", "24", "26", "28", "30"]
-        color_keywords = ["블랙", "화이트", "레드", "블루", "그린", "옐로우", "네이비", "그레이"]
-        material_keywords = ["면", "폴리", "나일론", "레이온", "울", "캐시미어"]
-
-        has_size = any(any(k in v.upper() for k in size_keywords) for v in values)
-        has_color = any(any(k in v for k in color_keywords) for v in values)
-        has_material = any(any(k in v for k in material_keywords) for v in values)
-
-        if has_color:
+        # Try to infer from values (one compiled search per value and kind)
+        if any(self.COLOR_PATTERN.search(v) for v in values):
             return "색상"
-        elif has_size:
+        elif any(self.SIZE_PATTERN.search(v.upper()) for v in values):
             return "사이즈"
-        elif has_material:
+        elif any(self.MATERIAL_PATTERN.search(v) for v in values):
             return "재질"
         else:
             # Default names by index
@@ -0,0 +1,147 @@
+"""Transactional outbox for Celery tasks."""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+# send(task_name, args, queue, countdown) publishes one task to the broker
+Sender = Callable[[str, List[Any], Optional[str], Optional[int]], None]
+
+
+def stage_task(
+    db: AsyncSession,
+    task_name: str,
+    args: Optional[List[Any]] = None,
+    queue: Optional[str] = None,
+    countdown: Optional[int] = None,
+    not_before: Optional[datetime] = None,
+) -> None:
+    """
+    Stage a Celery task in the session's transaction.
+
+    The task reaches the broker only if the transaction commits, and is not
+    lost if the process dies right after the commit: the relay publishes it.
+
+    Args:
+        db: Session whose transaction carries the state change
+        task_name: Registered Celery task name
+        args: JSON-serializable positional arguments
+        queue: Target queue (None = the task's route)
+        countdown: Seconds to delay the task after it is relayed
+        not_before: Relay no earlier than this (for delays of hours)
+    """
+    db.add(
+        OutboxMessage(
+            task_name=task_name,
+            args=args or [],
+            queue=queue,
+            countdown=countdown,
+            available_at=not_before,
+        )
+    )
+
+
+def send_celery_task(
+    task_name: str, args: List[Any], queue: Optional[str], countdown: Optional[int]
+) -> None:
+    """Publish a task through the Celery app."""
+    from app.workers.celery_app import celery_app
+
+    celery_app.send_task(task_name, args=args, queue=queue, countdown=countdown)
+
+
+def _publish(
+    send: Sender,
+    batch: List[Tuple[int, str, List[Any], Optional[str], Optional[int]]],
+    sent_ids: List[int],
+    stop: threading.Event,
+) -> None:
+    """Send a batch in order, recording sent ids, until stop is set."""
+    for message_id, task_name, args, queue, countdown in batch:
+        if stop.is_set():
+            return
+        send(task_name, args, queue, countdown)
+        sent_ids.append(message_id)
+
+
+async def relay_outbox(
+    db: AsyncSession,
+    send: Sender = send_celery_task,
+    batch_size: int = settings.outbox_relay_batch_size,
+    timeout: float = settings.outbox_publish_timeout,
+) -> int:
+    """
+    Publish staged tasks that are due to the broker, oldest first.
+
+    Each batch is locked with SKIP LOCKED, so concurrent relays never publish
+    the same message, and deleted in the transaction that published it. A
+    crash between publishing and committing publishes the batch again, so
+    tasks must tolerate duplicates (at-least-once).
+
+    Publishing blocks on the broker, so each batch is sent from a worker
+    thread and the event loop (API or worker) keeps running while it waits.
+
+    Args:
+        db: Session with no pending changes
+        send: Publishes one task (default: Celery send_task)
+        batch_size: Messages per transaction
+        timeout: Seconds to wait for the broker per batch (default: 5)
+
+    Returns:
+        Number of tasks published
+
+    Raises:
+        TimeoutError: If the broker took longer than timeout; what was
+            published is kept, the rest is left for the next relay
+    """
+    published = 0
+    while True:
+        result = await db.execute(
+            select(OutboxMessage)
+            .where(
+                or_(OutboxMessage.available_at.is_(None), OutboxMessage.available_at <= func.now())
+            )
+            .order_by(OutboxMessage.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        messages = list(result.scalars())
+        if not messages:
+            await db.commit()
+            return published
+
+        # Plain values: the thread must not touch ORM objects the commit expires
+        batch = [(m.id, m.task_name, m.args, m.queue, m.countdown) for m in messages]
+        sent_ids: List[int] = []
+        stop = threading.Event()
+        try:
+            await asyncio.wait_for(
+                asyncio.to_thread(_publish, send, batch, sent_ids, stop), timeout
+            )
+        finally:
+            stop.set()
+            # A send still running after a timeout is published again next time
+            published_ids = list(sent_ids)
+            # Keep what was published even if the broker failed midway
+            if published_ids:
+                await db.execute(
+                    delete(OutboxMessage)
+                    .where(OutboxMessage.id.in_(published_ids))
+                    .execution_options(synchronize_session=False)
+                )
+            await db.commit()
+            published += len(published_ids)
+
+        if len(messages) < batch_size:
+            return published
@@ -0,0 +1,177 @@
+"""Staged asyncio pipelines with bounded queues and group-committed writes."""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, Iterable, List, Optional, TypeVar
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Tells a stage worker that no more items will arrive
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """
+    One pipeline stage.
+
+    Attributes:
+        name: Stage name
+        handler: Processes one item and returns the item for the next stage,
+            or None when the item leaves the pipeline here
+        concurrency: Number of workers running the handler
+    """
+
+    name: str
+    handler: Callable[[Any], Awaitable[Any]]
+    concurrency: int = 1
+
+
+async def _gather_or_cancel(coroutines: Iterable[Awaitable[Any]]) -> None:
+    """Run coroutines concurrently; if one fails, cancel the rest and re-raise."""
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class StagePipeline:
+    """
+    Run items through stages connected by bounded queues.
+
+    Every stage has its own workers, so a slow stage (e.g. a rate-limited API
+    call) works on one item while the stages before it prepare the next ones,
+    and a full queue stops the stages before it from running ahead
+    (backpressure). Handlers deal with per-item errors themselves; an
+    exception escaping a handler cancels the whole pipeline.
+    """
+
+    def __init__(
+        self, stages: List[Stage], queue_size: int = settings.registration_pipeline_queue_size
+    ) -> None:
+        """
+        Initialize pipeline.
+
+        Args:
+            stages: Stages in processing order
+            queue_size: Items waiting between two stages (default: 8)
+        """
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+
+    async def run(self, items: Iterable[Any]) -> None:
+        """
+        Process items until every item has left the pipeline.
+
+        Args:
+            items: Input of the first stage
+        """
+        if not self.stages:
+            return
+        queues: List[asyncio.Queue[Any]] = [
+            asyncio.Queue(maxsize=self.queue_size) for _ in self.stages
+        ]
+        await _gather_or_cancel(
+            [self._feed(items, queues[0])]
+            + [self._run_stage(index, queues) for index in range(len(self.stages))]
+        )
+
+    def _workers(self, index: int) -> int:
+        return max(1, self.stages[index].concurrency)
+
+    async def _feed(self, items: Iterable[Any], queue: "asyncio.Queue[Any]") -> None:
+        for item in items:
+            await queue.put(item)
+        for _ in range(self._workers(0)):
+            await queue.put(_DONE)
+
+    async def _run_stage(self, index: int, queues: List["asyncio.Queue[Any]"]) -> None:
+        stage = self.stages[index]
+        inbox = queues[index]
+        outbox = queues[index + 1] if index + 1 < len(queues) else None
+
+        async def work() -> None:
+            while (item := await inbox.get()) is not _DONE:
+                result = await stage.handler(item)
+                if outbox is not None and result is not None:
+                    await outbox.put(result)
+
+        await _gather_or_cancel([work() for _ in range(self._workers(index))])
+        logger.debug(f"Pipeline stage {stage.name} finished")
+        if outbox is not None:
+            for _ in range(self._workers(index + 1)):
+                await outbox.put(_DONE)
+
+
+class BatchWriter(Generic[T]):
+    """
+    Write items added by concurrent producers in batches (group commit).
+
+    A background task writes everything added while the previous write was
+    in flight, so producers never wait on the database and N items cost one
+    write per round trip instead of N. Used as an async context manager;
+    leaving it writes what is left.
+    """
+
+    def __init__(self, write: Callable[[List[T]], Awaitable[None]]) -> None:
+        """
+        Initialize writer.
+
+        Args:
+            write: Writes one batch of items, in the order they were added
+        """
+        self._write = write
+        self._items: List[T] = []
+        self._ready = asyncio.Event()
+        self._closed = False
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def add(self, item: T) -> None:
+        """
+        Queue an item for the next write.
+
+        Raises:
+            Exception: The error of a failed earlier write
+        """
+        task = self._task
+        if task is not None and task.done() and not task.cancelled():
+            error = task.exception()
+            if error is not None:
+                raise error
+        self._items.append(item)
+        self._ready.set()
+
+    async def flush(self) -> None:
+        """Write the queued items now."""
+        items, self._items = self._items, []
+        if items:
+            await self._write(items)
+
+    async def __aenter__(self) -> "BatchWriter[T]":
+        self._task = asyncio.ensure_future(self._run())
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        assert self._task is not None
+        self._closed = True
+        self._ready.set()
+        if exc_type is None:
+            await self._task
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while not (self._closed and not self._items):
+            await self._ready.wait()
+            self._ready.clear()
+            await self.flush()
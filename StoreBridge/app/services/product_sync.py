@@ -0,0 +1,223 @@
+"""Differential price/inventory sync driven by content fingerprints."""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.connectors.naver_client import NaverClient
+from app.models import JobType, Product, ProductRegistration, State
+from app.services.naver_dispatcher import NaverDispatchClient
+
+logger = logging.getLogger(__name__)
+
+# Builds the full Naver product payload (the one registration sends) for a
+# product and its registration; update_product replaces the whole product
+PayloadBuilder = Callable[[Product, ProductRegistration], Awaitable[Dict[str, Any]]]
+
+# Domeggook item fields each sync job compares and pushes to Naver
+SYNC_FIELDS: Dict[JobType, Tuple[str, ...]] = {
+    JobType.SYNC_PRICE: ("price",),
+    JobType.SYNC_INVENTORY: ("stock_quantity", "options"),
+}
+
+
+def fingerprint(item: Dict[str, Any], fields: Tuple[str, ...]) -> str:
+    """
+    Hash the given fields of a Domeggook item.
+
+    Args:
+        item: Domeggook item (or a product's stored raw_data)
+        fields: Field names to include
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON of those fields
+    """
+    payload = json.dumps(
+        {name: item.get(name) for name in fields},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SyncResult:
+    """Sync result."""
+
+    checked_count: int = 0
+    unchanged_count: int = 0
+    updated_count: int = 0
+    failed_count: int = 0
+    skipped_count: int = 0
+    error_summary: Dict[str, int] = field(default_factory=dict)
+
+    def merge(self, other: "SyncResult") -> None:
+        """Accumulate another result into this one."""
+        self.checked_count += other.checked_count
+        self.unchanged_count += other.unchanged_count
+        self.updated_count += other.updated_count
+        self.failed_count += other.failed_count
+        self.skipped_count += other.skipped_count
+        for error_type, count in other.error_summary.items():
+            self.error_summary[error_type] = self.error_summary.get(error_type, 0) + count
+
+
+class ProductSyncEngine:
+    """
+    Push Domeggook price or inventory changes to Naver.
+
+    Each re-crawled item is fingerprinted over the fields the job type cares
+    about and compared with the fingerprint of the product's stored raw_data.
+    Only registered products whose fingerprint changed cost a Naver call.
+    Naver's update replaces the whole product, so each call carries the full
+    registration payload built from the product with the new values applied;
+    the stored data is refreshed after Naver accepts the update, so a failed
+    update is retried by the next sync.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        naver_client: Union[NaverClient, NaverDispatchClient],
+        job_type: JobType,
+        build_payload: PayloadBuilder,
+        concurrency: int = settings.registration_batch_concurrency,
+    ) -> None:
+        """
+        Initialize sync engine.
+
+        Args:
+            db: Database session
+            naver_client: Naver client used for updates
+            job_type: SYNC_PRICE or SYNC_INVENTORY
+            build_payload: Builds the full product payload sent to Naver
+            concurrency: Maximum concurrent Naver updates (default: 4)
+
+        Raises:
+            ValueError: If job_type is not a sync job
+        """
+        if job_type not in SYNC_FIELDS:
+            raise ValueError(f"Not a sync job type: {job_type}")
+        self.db = db
+        self.naver_client = naver_client
+        self.job_type = job_type
+        self.fields = SYNC_FIELDS[job_type]
+        self.build_payload = build_payload
+        self.concurrency = max(1, concurrency)
+
+    async def sync(self, items: List[Dict[str, Any]]) -> SyncResult:
+        """
+        Sync one page of re-crawled items.
+
+        Args:
+            items: Domeggook items
+
+        Returns:
+            SyncResult
+        """
+        result = SyncResult(checked_count=len(items))
+        by_item_id = {str(item["item_id"]): item for item in items if item.get("item_id")}
+        result.skipped_count += len(items) - len(by_item_id)
+        if not by_item_id:
+            return result
+
+        rows = await self.db.execute(
+            select(Product, ProductRegistration)
+            .join(ProductRegistration, ProductRegistration.product_id == Product.id)
+            .where(
+                Product.domeggook_item_id.in_(list(by_item_id)),
+                ProductRegistration.state == State.COMPLETED,
+                ProductRegistration.naver_product_id.is_not(None),
+            )
+        )
+
+        # (registration, new product values)
+        changed: List[Tuple[ProductRegistration, Dict[str, Any]]] = []
+        # Full payloads, built one at a time since builders may use the session
+        payloads: List[Union[Dict[str, Any], Exception]] = []
+        for product, registration in rows:
+            item = by_item_id[product.domeggook_item_id]
+            raw_data = product.raw_data or {}
+            if fingerprint(item, self.fields) == fingerprint(raw_data, self.fields):
+                result.unchanged_count += 1
+                continue
+            values = self._product_values(raw_data, item)
+            changed.append((registration, values))
+            try:
+                payloads.append(
+                    await self.build_payload(self._synced_product(product, values), registration)
+                )
+            except Exception as e:
+                payloads.append(e)
+
+        # Not imported or not registered yet: the registration path handles them
+        result.skipped_count += len(by_item_id) - result.unchanged_count - len(changed)
+        if not changed:
+            return result
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def push(
+            naver_product_id: str, payload: Union[Dict[str, Any], Exception]
+        ) -> Optional[Exception]:
+            if isinstance(payload, Exception):
+                return payload
+            async with semaphore:
+                try:
+                    await self.naver_client.update_product(naver_product_id, payload)
+                    return None
+                except Exception as e:
+                    return e
+
+        errors = await asyncio.gather(
+            *(
+                push(str(registration.naver_product_id), payload)
+                for (registration, _), payload in zip(changed, payloads, strict=True)
+            )
+        )
+
+        product_rows = []
+        for (registration, values), error in zip(changed, errors, strict=True):
+            if error is not None:
+                logger.error(
+                    f"Failed to sync Naver product {registration.naver_product_id}: {error}"
+                )
+                result.failed_count += 1
+                error_type = type(error).__name__
+                result.error_summary[error_type] = result.error_summary.get(error_type, 0) + 1
+                continue
+            product_rows.append({"id": registration.product_id, **values})
+
+        if product_rows:
+            await self.db.execute(
+                update(Product).execution_options(synchronize_session=False), product_rows
+            )
+            await self.db.commit()
+        result.updated_count += len(product_rows)
+        return result
+
+    @staticmethod
+    def _synced_product(product: Product, values: Dict[str, Any]) -> Product:
+        """Detached copy of a product with the synced values applied."""
+        columns = {column.key: getattr(product, column.key) for column in Product.__table__.columns}
+        return Product(**{**columns, **values})
+
+    def _product_values(self, raw_data: Dict[str, Any], item: Dict[str, Any]) -> Dict[str, Any]:
+        """Product column values after a successful sync."""
+        merged = {**raw_data, **{name: item.get(name) for name in self.fields}}
+        values: Dict[str, Any] = {"raw_data": merged}
+        if self.job_type == JobType.SYNC_PRICE:
+            values["price"] = item.get("price") or 0
+        else:
+            values["options"] = {"raw": item.get("options") or []}
+        return values
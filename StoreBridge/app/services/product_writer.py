@@ -0,0 +1,435 @@
+"""Bulk product writers using PostgreSQL upserts and COPY."""
+
+import json
+import logging
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import case, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import Product, ProductRegistration, State
+
+logger = logging.getLogger(__name__)
+
+# Called with the session and the PENDING product IDs of a chunk before it commits
+PendingHook = Callable[[AsyncSession, List[uuid.UUID]], None]
+
+STAGING_TABLE = "product_ingest_staging"
+
+# Product columns plus the registration each product gets, in COPY order
+STAGING_COLUMNS = [
+    "id",
+    "domeggook_item_id",
+    "name",
+    "price",
+    "category",
+    "images",
+    "options",
+    "raw_data",
+    "registration_id",
+    "seller_product_code",
+]
+
+# Dropped at commit (or rollback), so pooled connections never keep it
+CREATE_STAGING_SQL = f"""
+CREATE TEMP TABLE {STAGING_TABLE} (
+    LIKE products INCLUDING DEFAULTS,
+    registration_id UUID NOT NULL,
+    seller_product_code VARCHAR(100) NOT NULL
+) ON COMMIT DROP
+"""
+
+# Same conflict rules as ProductBulkWriter._upsert, in one statement
+MERGE_STAGING_SQL = f"""
+WITH upserted AS (
+    INSERT INTO products AS p (
+        id, domeggook_item_id, name, price, category, images, options, raw_data
+    )
+    SELECT id, domeggook_item_id, name, price, category, images, options, raw_data
+    FROM {STAGING_TABLE}
+    ON CONFLICT (domeggook_item_id) DO UPDATE SET
+        name = EXCLUDED.name,
+        price = EXCLUDED.price,
+        category = EXCLUDED.category,
+        images = EXCLUDED.images,
+        options = EXCLUDED.options,
+        raw_data = EXCLUDED.raw_data,
+        updated_at = now()
+    RETURNING p.id, p.domeggook_item_id
+)
+INSERT INTO product_registrations AS r (
+    id, product_id, job_id, state, seller_product_code, retry_count
+)
+SELECT
+    s.registration_id,
+    u.id,
+    CAST(:job_id AS UUID),
+    CAST(:pending AS VARCHAR),
+    s.seller_product_code,
+    0
+FROM upserted u
+JOIN {STAGING_TABLE} s ON s.domeggook_item_id = u.domeggook_item_id
+ON CONFLICT (seller_product_code) DO UPDATE SET
+    product_id = EXCLUDED.product_id,
+    job_id = CASE WHEN r.state = :failed THEN EXCLUDED.job_id ELSE r.job_id END,
+    state = CASE WHEN r.state = :failed THEN :pending ELSE r.state END,
+    retry_count = CASE WHEN r.state = :failed THEN 0 ELSE r.retry_count END,
+    updated_at = now()
+RETURNING r.product_id, r.job_id, r.state
+"""
+
+
+@dataclass
+class WriteResult:
+    """Bulk write result."""
+
+    success_count: int = 0
+    failed_count: int = 0
+    error_summary: Dict[str, int] = field(default_factory=dict)
+    pending_product_ids: List[uuid.UUID] = field(default_factory=list)
+    # Registrations now owned by the job, per state
+    registration_states: Dict[str, int] = field(default_factory=dict)
+
+    def merge(self, other: "WriteResult") -> None:
+        """Accumulate another result into this one."""
+        self.success_count += other.success_count
+        self.failed_count += other.failed_count
+        for error_type, count in other.error_summary.items():
+            self.error_summary[error_type] = self.error_summary.get(error_type, 0) + count
+        self.pending_product_ids.extend(other.pending_product_ids)
+        for state, count in other.registration_states.items():
+            self.registration_states[state] = self.registration_states.get(state, 0) + count
+
+
+def product_row_from_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a Domeggook item into a products row.
+
+    Args:
+        item: Raw Domeggook item
+
+    Returns:
+        Column values for Product
+    """
+    return {
+        "id": uuid.uuid4(),
+        "domeggook_item_id": str(item.get("item_id") or uuid.uuid4()),
+        "name": item.get("item_name", "Unknown"),
+        "price": item.get("price") or 0,
+        "category": item.get("category"),
+        "images": item.get("images", []),
+        "options": {"raw": item.get("options", [])},
+        "raw_data": item,
+    }
+
+
+def seller_product_code(domeggook_item_id: str) -> str:
+    """Build the seller product code used on Naver for a Domeggook item."""
+    return f"DG-{domeggook_item_id}"
+
+
+class ProductBulkWriter:
+    """
+    Write crawled items as Product + ProductRegistration rows in chunks.
+
+    Each chunk is two statements and one transaction:
+    1. INSERT ... ON CONFLICT (domeggook_item_id) DO UPDATE ... RETURNING id
+    2. INSERT ... ON CONFLICT (seller_product_code) DO UPDATE ... RETURNING state
+
+    Re-importing an existing item refreshes its product data instead of failing
+    on the unique constraint. FAILED registrations are reset to PENDING and
+    move to the writing job; other states (e.g. COMPLETED, REGISTERING) are
+    kept as-is and stay with the job that owns them.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        job_id: Optional[uuid.UUID] = None,
+        chunk_size: int = settings.import_chunk_size,
+        on_pending: Optional[PendingHook] = None,
+    ) -> None:
+        """
+        Initialize writer.
+
+        Args:
+            db: Database session
+            job_id: Job that owns the registrations
+            chunk_size: Rows per INSERT statement (default: 500)
+            on_pending: Stages work for a chunk's PENDING registrations in the
+                chunk's transaction (e.g. registration tasks in the outbox)
+        """
+        self.db = db
+        self.job_id = job_id
+        self.chunk_size = max(1, chunk_size)
+        self.on_pending = on_pending
+        self._buffer: List[Dict[str, Any]] = []
+
+    async def add(self, items: List[Dict[str, Any]]) -> WriteResult:
+        """
+        Buffer items and write every full chunk.
+
+        Args:
+            items: Raw Domeggook items
+
+        Returns:
+            WriteResult for the chunks written by this call
+        """
+        self._buffer.extend(items)
+        result = WriteResult()
+        while len(self._buffer) >= self.chunk_size:
+            chunk = self._buffer[: self.chunk_size]
+            self._buffer = self._buffer[self.chunk_size :]
+            result.merge(await self.write(chunk))
+        return result
+
+    async def flush(self) -> WriteResult:
+        """
+        Write any buffered items.
+
+        Returns:
+            WriteResult for the remaining items
+        """
+        chunk, self._buffer = self._buffer, []
+        if not chunk:
+            return WriteResult()
+        return await self.write(chunk)
+
+    async def write(self, items: List[Dict[str, Any]]) -> WriteResult:
+        """
+        Upsert items in chunks, committing after each chunk.
+
+        A chunk that fails is split in half and retried, so one bad row only
+        fails itself rather than the whole chunk.
+
+        Args:
+            items: Raw Domeggook items
+
+        Returns:
+            WriteResult
+        """
+        result = WriteResult()
+        for start in range(0, len(items), self.chunk_size):
+            chunk = items[start : start + self.chunk_size]
+            rows = self._dedupe([product_row_from_item(item) for item in chunk])
+            result.merge(await self._write_chunk(rows))
+        return result
+
+    async def _write_chunk(self, rows: List[Dict[str, Any]]) -> WriteResult:
+        """Write one chunk's deduplicated rows."""
+        return await self._write_rows(rows)
+
+    async def _write_rows(self, rows: List[Dict[str, Any]]) -> WriteResult:
+        """Write rows in one transaction, bisecting on failure."""
+        try:
+            return await self._commit_rows(rows, await self._upsert(rows))
+
+        except Exception as e:
+            await self.db.rollback()
+
+            if len(rows) > 1:
+                mid = len(rows) // 2
+                result = await self._write_rows(rows[:mid])
+                result.merge(await self._write_rows(rows[mid:]))
+                return result
+
+            logger.error(f"Failed to write product {rows[0]['domeggook_item_id']}: {e}")
+            return WriteResult(failed_count=1, error_summary={type(e).__name__: 1})
+
+    async def _commit_rows(
+        self, rows: List[Dict[str, Any]], registrations: List[Tuple[uuid.UUID, State]]
+    ) -> WriteResult:
+        """Stage the PENDING registrations' work and commit the written rows."""
+        pending = [product_id for product_id, state in registrations if state == State.PENDING]
+        if self.on_pending is not None and pending:
+            self.on_pending(self.db, pending)
+        await self.db.commit()
+        return WriteResult(
+            success_count=len(rows),
+            pending_product_ids=pending,
+            registration_states=dict(Counter(state.value for _, state in registrations)),
+        )
+
+    async def _upsert(self, rows: List[Dict[str, Any]]) -> List[Tuple[uuid.UUID, State]]:
+        """
+        Upsert products and their registrations.
+
+        Args:
+            rows: Deduplicated product rows
+
+        Returns:
+            (product id, registration state) per registration owned by the job;
+            PENDING ones are ready to register
+        """
+        insert = pg_insert(Product).values(rows)
+        stmt = insert.on_conflict_do_update(
+            index_elements=[Product.domeggook_item_id],
+            set_={
+                "name": insert.excluded.name,
+                "price": insert.excluded.price,
+                "category": insert.excluded.category,
+                "images": insert.excluded.images,
+                "options": insert.excluded.options,
+                "raw_data": insert.excluded.raw_data,
+                "updated_at": func.now(),
+            },
+        ).returning(Product.id, Product.domeggook_item_id)
+
+        result = await self.db.execute(stmt)
+        product_ids = {row.domeggook_item_id: row.id for row in result}
+
+        registration_rows = [
+            {
+                "id": uuid.uuid4(),
+                "product_id": product_id,
+                "job_id": self.job_id,
+                "state": State.PENDING,
+                "seller_product_code": seller_product_code(item_id),
+                "retry_count": 0,
+            }
+            for item_id, product_id in product_ids.items()
+        ]
+
+        is_failed = ProductRegistration.state == State.FAILED
+        reg_insert = pg_insert(ProductRegistration).values(registration_rows)
+        reg_stmt = reg_insert.on_conflict_do_update(
+            index_elements=[ProductRegistration.seller_product_code],
+            set_={
+                "product_id": reg_insert.excluded.product_id,
+                "job_id": case(
+                    (is_failed, reg_insert.excluded.job_id), else_=ProductRegistration.job_id
+                ),
+                "state": case((is_failed, State.PENDING.value), else_=ProductRegistration.state),
+                "retry_count": case((is_failed, 0), else_=ProductRegistration.retry_count),
+                "updated_at": func.now(),
+            },
+        ).returning(
+            ProductRegistration.product_id, ProductRegistration.job_id, ProductRegistration.state
+        )
+
+        result = await self.db.execute(reg_stmt)
+        # Registrations kept by another job are that job's work, not this one's
+        return [(row.product_id, row.state) for row in result if row.job_id == self.job_id]
+
+    @staticmethod
+    def _dedupe(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Keep the last row per domeggook_item_id.
+
+        ON CONFLICT DO UPDATE cannot touch the same row twice in one statement.
+        """
+        by_item_id = {row["domeggook_item_id"]: row for row in rows}
+        return list(by_item_id.values())
+
+
+class ProductCopyWriter(ProductBulkWriter):
+    """
+    Write very large item streams (e.g. a new supplier's full catalog) via COPY.
+
+    Each chunk is one transaction: the rows are streamed with binary COPY into
+    a temporary staging table, then a single INSERT ... SELECT ... ON CONFLICT
+    statement merges them into products and creates or refreshes their
+    registrations, with the same conflict rules as ProductBulkWriter. Chunks
+    are much larger than upsert chunks because COPY has no bind parameter
+    limit. A chunk that fails (e.g. one name over 500 characters) is rolled
+    back and rewritten through ProductBulkWriter's upserts, which isolate the
+    bad rows.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        job_id: Optional[uuid.UUID] = None,
+        chunk_size: int = settings.import_copy_chunk_size,
+        on_pending: Optional[PendingHook] = None,
+        upsert_chunk_size: int = settings.import_chunk_size,
+    ) -> None:
+        """
+        Initialize writer.
+
+        Args:
+            db: Database session
+            job_id: Job that owns the registrations
+            chunk_size: Rows per COPY and merge (default: 10000)
+            on_pending: Stages work for a chunk's PENDING registrations in the
+                chunk's transaction (e.g. registration tasks in the outbox)
+            upsert_chunk_size: Rows per INSERT statement when a chunk falls
+                back to upserts (default: 500)
+        """
+        super().__init__(db, job_id=job_id, chunk_size=chunk_size, on_pending=on_pending)
+        self.upsert_chunk_size = max(1, upsert_chunk_size)
+
+    async def _write_chunk(self, rows: List[Dict[str, Any]]) -> WriteResult:
+        """COPY and merge rows in one transaction, falling back to upserts on failure."""
+        try:
+            return await self._commit_rows(rows, await self._copy_and_merge(rows))
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.warning(f"COPY ingest of {len(rows)} products failed, using upserts: {e}")
+
+            result = WriteResult()
+            for start in range(0, len(rows), self.upsert_chunk_size):
+                chunk = rows[start : start + self.upsert_chunk_size]
+                result.merge(await self._write_rows(chunk))
+            return result
+
+    async def _copy_and_merge(self, rows: List[Dict[str, Any]]) -> List[Tuple[uuid.UUID, State]]:
+        """
+        COPY rows into the staging table and merge them.
+
+        Args:
+            rows: Deduplicated product rows
+
+        Returns:
+            (product id, registration state) per registration owned by the job;
+            PENDING ones are ready to register
+
+        Raises:
+            RuntimeError: If the session is not backed by an asyncpg connection
+        """
+        await self.db.execute(text(CREATE_STAGING_SQL))
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if driver_connection is None:
+            raise RuntimeError("COPY ingest needs an open asyncpg connection")
+        # asyncpg's binary COPY; JSONB values go in as JSON text
+        await driver_connection.copy_records_to_table(
+            STAGING_TABLE,
+            records=[self._staging_record(row) for row in rows],
+            columns=STAGING_COLUMNS,
+        )
+
+        result = await self.db.execute(
+            text(MERGE_STAGING_SQL),
+            {
+                "job_id": self.job_id,
+                "pending": State.PENDING.value,
+                "failed": State.FAILED.value,
+            },
+        )
+        # Registrations kept by another job are that job's work, not this one's
+        return [(row.product_id, State(row.state)) for row in result if row.job_id == self.job_id]
+
+    @staticmethod
+    def _staging_record(row: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Staging table record (STAGING_COLUMNS order) of a product row."""
+        return (
+            row["id"],
+            row["domeggook_item_id"],
+            row["name"],
+            row["price"],
+            row["category"],
+            row["images"],
+            json.dumps(row["options"], ensure_ascii=False),
+            json.dumps(row["raw_data"], ensure_ascii=False),
+            uuid.uuid4(),
+            seller_product_code(row["domeggook_item_id"]),
+        )
@@ -0,0 +1,315 @@
+"""Daily API quota ledger for Domeggook and Naver."""
+
+import logging
+import math
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+import redis.asyncio as aioredis
+
+from app.config import settings
+from app.models import JobType
+
+logger = logging.getLogger(__name__)
+
+USAGE_KEY = "quota:{provider}:{window}"
+
+# Hash fields: "used" (calls made), "reserved" (calls promised to admitted
+# jobs and not made yet), "job:<id>" (one job's outstanding reservation)
+USED = "used"
+RESERVED = "reserved"
+
+# Window hashes outlive their day so jobs running past midnight can still
+# draw down and release their reservations
+KEY_TTL = 3 * 86400
+
+
+def daily_limits() -> Dict[str, int]:
+    """Calls allowed per provider per window."""
+    return {"domeggook": settings.domeggook_max_daily, "naver": settings.naver_max_daily}
+
+
+@dataclass
+class QuotaStatus:
+    """One provider's budget in one window."""
+
+    limit: int
+    used: int
+    reserved: int
+
+    @property
+    def remaining(self) -> int:
+        """Calls neither made nor promised to an admitted job."""
+        return max(0, self.limit - self.used - self.reserved)
+
+
+def estimate_job_calls(job_type: JobType, config: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Upper bound of the API calls a job makes, per provider.
+
+    - Domeggook: one getItemList call per page (cached pages cost nothing)
+    - Naver: imports with auto_register make one registration plus
+      quota_images_per_product image uploads per product; syncs push at most
+      one update per product
+
+    Jobs without a limit are assumed to have quota_unbounded_job_items items.
+
+    Args:
+        job_type: Job type
+        config: Job config (limit, auto_register)
+
+    Returns:
+        Provider -> calls
+    """
+    items = config.get("limit") or settings.quota_unbounded_job_items
+    page_size = max(1, min(settings.domeggook_page_size, items))
+    naver = 0
+    if job_type == JobType.IMPORT:
+        if config.get("auto_register", True):
+            naver = math.ceil(items * (1 + settings.quota_images_per_product))
+    else:
+        naver = items
+    return {"domeggook": math.ceil(items / page_size), "naver": naver}
+
+
+class QuotaLedger:
+    """
+    Daily call budgets shared by the API and every worker.
+
+    Calls are counted per provider in a Redis hash per window (a calendar
+    day in quota_timezone, when the Domeggook quota resets). Admitting a job
+    reserves its estimated calls; calls attributed to the job draw its
+    reservation down, and finishing the job releases what is left, so
+    budget promised to running jobs is never handed out twice. Counting
+    never fails an API call: Redis errors are logged and ignored.
+    """
+
+    # KEYS = current window, then earlier windows holding reservations
+    # ARGV = calls, job field ('' = unattributed), ttl, 1 to count the calls
+    # as used / 0 to only draw the job's reservation down
+    LUA_RECORD = """
+    local calls = tonumber(ARGV[1])
+    if ARGV[4] == '1' then
+        redis.call('HINCRBY', KEYS[1], 'used', calls)
+        redis.call('EXPIRE', KEYS[1], ARGV[3])
+    end
+    if ARGV[2] ~= '' then
+        for _, key in ipairs(KEYS) do
+            local left = tonumber(redis.call('HGET', key, ARGV[2]) or '0')
+            local take = math.min(left, calls)
+            if take > 0 then
+                redis.call('HINCRBY', key, ARGV[2], -take)
+                redis.call('HINCRBY', key, 'reserved', -take)
+                calls = calls - take
+            end
+        end
+    end
+    return calls
+    """
+
+    # KEYS = one hash per provider; ARGV = job field, ttl, then limit and
+    # calls per key. Reserves on every key or none; returns the 1-based
+    # index of the first provider without budget, or 0.
+    LUA_ADMIT = """
+    for i, key in ipairs(KEYS) do
+        local limit = tonumber(ARGV[1 + 2 * i])
+        local need = tonumber(ARGV[2 + 2 * i])
+        local used = tonumber(redis.call('HGET', key, 'used') or '0')
+        local reserved = tonumber(redis.call('HGET', key, 'reserved') or '0')
+        if need > 0 and used + reserved + need > limit then
+            return i
+        end
+    end
+    for i, key in ipairs(KEYS) do
+        local need = tonumber(ARGV[2 + 2 * i])
+        if need > 0 then
+            redis.call('HINCRBY', key, 'reserved', need)
+            redis.call('HINCRBY', key, ARGV[1], need)
+            redis.call('EXPIRE', key, ARGV[2])
+        end
+    end
+    return 0
+    """
+
+    # KEYS = one hash per provider; ARGV[1] = job field
+    LUA_RELEASE = """
+    for _, key in ipairs(KEYS) do
+        local left = tonumber(redis.call('HGET', key, ARGV[1]) or '0')
+        if left > 0 then
+            redis.call('HINCRBY', key, 'reserved', -left)
+        end
+        redis.call('HDEL', key, ARGV[1])
+    end
+    return 0
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional["aioredis.Redis[str]"] = None,
+        timezone: str = settings.quota_timezone,
+        limits: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Initialize ledger.
+
+        Args:
+            redis_client: Redis client (if None, creates new one)
+            timezone: Time zone whose midnight starts a window (default: Asia/Seoul)
+            limits: Calls per provider per window (default: from settings)
+        """
+        self.redis = redis_client or aioredis.from_url(settings.redis_url, decode_responses=True)
+        self.tz = ZoneInfo(timezone)
+        self.limits = limits or daily_limits()
+        self._shas: Dict[str, str] = {}
+
+    def window(self, now: Optional[datetime] = None) -> str:
+        """Current window, e.g. "2026-10-18"."""
+        return (now or datetime.now(self.tz)).astimezone(self.tz).date().isoformat()
+
+    def next_window(self, window: str) -> str:
+        """The window after `window`."""
+        return self._shift(window, 1)
+
+    def window_start(self, window: str) -> datetime:
+        """When a window starts (timezone-aware)."""
+        return datetime.combine(date.fromisoformat(window), time.min, tzinfo=self.tz)
+
+    @staticmethod
+    def _shift(window: str, days: int) -> str:
+        return (date.fromisoformat(window) + timedelta(days=days)).isoformat()
+
+    def _key(self, provider: str, window: str) -> str:
+        return USAGE_KEY.format(provider=provider, window=window)
+
+    @staticmethod
+    def _job_field(job_id: str) -> str:
+        return f"job:{job_id}"
+
+    async def _eval(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        sha = self._shas.get(script)
+        if sha is None:
+            sha = self._shas[script] = await self.redis.script_load(script)  # type: ignore[no-untyped-call]
+        return await self.redis.evalsha(sha, len(keys), *keys, *args)  # type: ignore[no-untyped-call]
+
+    async def record(self, provider: str, calls: int = 1, job_id: Optional[str] = None) -> None:
+        """
+        Count calls made to a provider in the current window.
+
+        Args:
+            provider: "domeggook" or "naver"
+            calls: Number of calls
+            job_id: Job the calls belong to (draws its reservation down)
+        """
+        await self._record(provider, calls, job_id, count_used=True)
+
+    async def draw(self, provider: str, calls_by_job: Dict[str, int]) -> None:
+        """
+        Draw jobs' reservations down for calls already counted unattributed.
+
+        Shared clients (e.g. the worker's Naver client) count every call
+        without knowing its job; the task that made them attributes them here.
+
+        Args:
+            provider: "domeggook" or "naver"
+            calls_by_job: Job UUID string -> calls
+        """
+        for job_id, calls in calls_by_job.items():
+            if calls > 0:
+                await self._record(provider, calls, job_id, count_used=False)
+
+    async def _record(
+        self, provider: str, calls: int, job_id: Optional[str], count_used: bool
+    ) -> None:
+        window = self.window()
+        # A job admitted yesterday may still be running
+        keys = [self._key(provider, window), self._key(provider, self._shift(window, -1))]
+        try:
+            await self._eval(
+                self.LUA_RECORD,
+                keys,
+                [calls, self._job_field(job_id) if job_id else "", KEY_TTL, int(count_used)],
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record {provider} quota usage: {e}")
+
+    async def admit(self, job_id: str, estimate: Dict[str, int], window: str) -> Optional[str]:
+        """
+        Reserve a job's estimated calls in a window if every provider has room.
+
+        Args:
+            job_id: Job UUID string
+            estimate: Provider -> calls (see estimate_job_calls)
+            window: Window to reserve in
+
+        Returns:
+            None if admitted, else the first provider without enough budget
+        """
+        providers = list(estimate)
+        args: List[Any] = [self._job_field(job_id), KEY_TTL]
+        for provider in providers:
+            args += [self.limits[provider], estimate[provider]]
+        index = await self._eval(self.LUA_ADMIT, [self._key(p, window) for p in providers], args)
+        return providers[int(index) - 1] if index else None
+
+    async def release(self, job_id: str, providers: Optional[List[str]] = None) -> None:
+        """
+        Return what is left of a job's reservations.
+
+        Looks in yesterday's, today's and tomorrow's windows, so jobs that
+        ran past midnight or were scheduled for the next window are covered.
+
+        Args:
+            job_id: Job UUID string
+            providers: Providers to release (default: all)
+        """
+        today = self.window()
+        windows = [self._shift(today, -1), today, self._shift(today, 1)]
+        try:
+            await self._eval(
+                self.LUA_RELEASE,
+                [self._key(p, w) for p in providers or list(self.limits) for w in windows],
+                [self._job_field(job_id)],
+            )
+        except Exception as e:
+            logger.warning(f"Failed to release quota of job {job_id}: {e}")
+
+    async def status(self, window: Optional[str] = None) -> Dict[str, QuotaStatus]:
+        """
+        Every provider's budget in a window.
+
+        Args:
+            window: Window (default: current)
+
+        Returns:
+            Provider -> QuotaStatus
+        """
+        window = window or self.window()
+        pipe = self.redis.pipeline(transaction=False)
+        for provider in self.limits:
+            pipe.hmget(self._key(provider, window), [USED, RESERVED])
+        rows = await pipe.execute()
+        return {
+            provider: QuotaStatus(
+                limit=limit, used=int(used or 0), reserved=max(0, int(reserved or 0))
+            )
+            for (provider, limit), (used, reserved) in zip(self.limits.items(), rows, strict=True)
+        }
+
+    def usage(self, provider: str, job_id: Optional[str] = None) -> "QuotaUsage":
+        """Bind a provider (and optionally a job) for a client to record its calls."""
+        return QuotaUsage(self, provider, job_id)
+
+
+@dataclass
+class QuotaUsage:
+    """Records one client's calls in the ledger."""
+
+    ledger: QuotaLedger
+    provider: str
+    job_id: Optional[str] = None
+
+    async def record(self, calls: int = 1) -> None:
+        """Count calls about to be made."""
+        await self.ledger.record(self.provider, calls, self.job_id)
@@ -1,12 +1,16 @@
 """Rate limiter with atomic Redis operations using Lua script."""
 
 import asyncio
+import logging
 import time
-from typing import Optional
+from typing import Optional, Tuple, Union
 
 import redis.asyncio as aioredis
 
 from app.config import settings
+from app.services.metrics import record_rate_limit
+
+logger = logging.getLogger(__name__)
 
 
 class NaverRateLimiter:
@@ -48,7 +52,7 @@ class NaverRateLimiter:
 
     def __init__(
         self,
-        redis_client: Optional[aioredis.Redis] = None,
+        redis_client: Optional["aioredis.Redis[str]"] = None,
         max_tps: int = settings.naver_max_tps,
         burst_max: int = settings.naver_burst_max,
         ttl: int = 2,
@@ -73,7 +77,7 @@ class NaverRateLimiter:
     async def _ensure_lua_script(self) -> str:
         """Ensure Lua script is loaded into Redis and return SHA."""
         if self._lua_script_sha is None:
-            self._lua_script_sha = await self.redis.script_load(self.LUA_ACQUIRE)
+            self._lua_script_sha = await self.redis.script_load(self.LUA_ACQUIRE)  # type: ignore[no-untyped-call]
         return self._lua_script_sha
 
     async def acquire(self, resource_id: str = "naver_api") -> bool:
@@ -98,7 +102,7 @@ class NaverRateLimiter:
             script_sha = await self._ensure_lua_script()
 
             # Execute Lua script atomically
-            result = await self.redis.evalsha(
+            result = await self.redis.evalsha(  # type: ignore[no-untyped-call]
                 script_sha,
                 1,  # number of keys
                 key,
@@ -107,7 +111,8 @@ class NaverRateLimiter:
                 str(self.burst_max),
             )
 
-            return result > 0  # 1 or 2 = success, 0 = blocked
+            record_rate_limit("window", int(result))
+            return int(result) > 0  # 1 or 2 = success, 0 = blocked
 
         except ConnectionError:
             # Re-raise ConnectionError as-is (for testing)
@@ -174,3 +179,421 @@ class NaverRateLimiter:
     async def close(self) -> None:
         """Close Redis connection."""
         await self.redis.close()
+
+
+class GCRARateLimiter:
+    """
+    GCRA (generic cell rate algorithm) rate limiter for Naver Commerce API.
+
+    Instead of counting requests in fixed one-second windows, a single
+    "theoretical arrival time" (TAT) per resource is advanced by 1 / max_tps on
+    every grant. This spaces requests evenly (no bursts at second rollover) and
+    lets the Lua script return the exact time until the next free slot, so
+    callers sleep precisely once instead of polling with backoff.
+
+    With fair=True (default) a blocked caller reserves the next slot in the
+    same atomic call. Slots are handed out in the order requests reach Redis,
+    which makes the TAT a FIFO ticket queue shared by all workers.
+
+    max_tps is a ceiling: when AdaptiveRateController has stored a lower
+    effective rate for the resource, the script spaces slots by that rate.
+    """
+
+    # Lua script for atomic GCRA check-and-reserve.
+    # Returns {code, wait_ms}: 1 = allowed now, 2 = slot reserved (wait first),
+    # 0 = blocked (nothing reserved, next slot in wait_ms)
+    LUA_GCRA = """
+    local key = KEYS[1]
+    local interval = tonumber(ARGV[1])
+    local tolerance = tonumber(ARGV[2])
+    local reserve = tonumber(ARGV[3])
+    local max_wait = tonumber(ARGV[4])
+
+    -- Effective rate set by the adaptive controller (never above max_tps)
+    local rate = tonumber(redis.call('GET', KEYS[2]))
+    if rate and rate > 0 then
+        local adaptive = math.floor(1000 / rate)
+        if adaptive > interval then
+            tolerance = math.floor(tolerance * adaptive / interval)
+            interval = adaptive
+        end
+    end
+
+    local time = redis.call('TIME')
+    local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+    local tat = tonumber(redis.call('GET', key))
+    if not tat or tat < now then
+        tat = now
+    end
+
+    local wait = tat - tolerance - now
+    if wait < 0 then
+        wait = 0
+    end
+
+    if wait > 0 and (reserve == 0 or wait > max_wait) then
+        return {0, wait}  -- blocked
+    end
+
+    local new_tat = tat + interval
+    redis.call('SET', key, new_tat, 'PX', new_tat - now + interval)
+
+    if wait > 0 then
+        return {2, wait}  -- reserved (queued)
+    end
+    return {1, 0}  -- allowed now
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional["aioredis.Redis[str]"] = None,
+        max_tps: float = settings.naver_max_tps,
+        burst: int = settings.naver_gcra_burst,
+        fair: bool = True,
+        max_wait: float = settings.naver_rate_limit_max_wait,
+    ) -> None:
+        """
+        Initialize rate limiter.
+
+        Args:
+            redis_client: Redis client (if None, creates new one)
+            max_tps: Sustained transactions per second (default: 2)
+            burst: Requests allowed back-to-back after idle (default: 1 = evenly spaced)
+            fair: Reserve slots in FIFO order when blocked (default: True)
+            max_wait: Longest wait in seconds a caller will queue for (default: 60)
+        """
+        self.redis = redis_client or aioredis.from_url(
+            settings.redis_url, decode_responses=True
+        )
+        self.max_tps = max_tps
+        self.burst = max(1, burst)
+        self.fair = fair
+        self.max_wait = max_wait
+        self.interval_ms = int(1000 / max_tps)
+        self.tolerance_ms = (self.burst - 1) * self.interval_ms
+        self._lua_script_sha: Optional[str] = None
+
+    @staticmethod
+    def _key(resource_id: str) -> str:
+        """Redis key holding the theoretical arrival time (ms)."""
+        return f"{resource_id}:gcra:tat"
+
+    @staticmethod
+    def rate_key(resource_id: str) -> str:
+        """Redis key holding the adaptive effective rate (TPS)."""
+        return f"{resource_id}:gcra:rate"
+
+    async def _ensure_lua_script(self) -> str:
+        """Ensure Lua script is loaded into Redis and return SHA."""
+        if self._lua_script_sha is None:
+            self._lua_script_sha = await self.redis.script_load(self.LUA_GCRA)  # type: ignore[no-untyped-call]
+        return self._lua_script_sha
+
+    async def reserve(
+        self,
+        resource_id: str = "naver_api",
+        reserve: bool = True,
+        max_wait: Optional[float] = None,
+    ) -> Tuple[int, float]:
+        """
+        Run the GCRA script once.
+
+        Args:
+            resource_id: Identifier for the resource (default: "naver_api")
+            reserve: Reserve the next slot if none is free right now
+            max_wait: Reject reservations further out than this (seconds)
+
+        Returns:
+            (code, wait_seconds) where code is 1 (allowed now), 2 (reserved,
+            sleep wait_seconds first) or 0 (blocked, next slot in wait_seconds)
+
+        Raises:
+            ConnectionError: If Redis is unavailable
+            Exception: If Lua script execution fails
+        """
+        max_wait = self.max_wait if max_wait is None else max_wait
+
+        try:
+            script_sha = await self._ensure_lua_script()
+
+            code, wait_ms = await self.redis.evalsha(  # type: ignore[no-untyped-call]
+                script_sha,
+                2,  # number of keys
+                self._key(resource_id),
+                self.rate_key(resource_id),
+                str(self.interval_ms),
+                str(self.tolerance_ms),
+                "1" if reserve else "0",
+                str(int(max_wait * 1000)),
+            )
+
+            record_rate_limit("gcra", int(code))
+            return int(code), int(wait_ms) / 1000
+
+        except ConnectionError:
+            raise
+        except aioredis.RedisError as e:
+            raise ConnectionError(f"Redis connection error: {e}") from e
+        except Exception as e:
+            raise Exception(f"Rate limiter error: {e}") from e
+
+    async def acquire(self, resource_id: str = "naver_api") -> bool:
+        """
+        Take a slot only if one is free right now (never reserves).
+
+        Args:
+            resource_id: Identifier for the resource (default: "naver_api")
+
+        Returns:
+            True if request is allowed, False if rate limited
+        """
+        code, _ = await self.reserve(resource_id, reserve=False)
+        return code > 0
+
+    async def acquire_with_wait(
+        self,
+        resource_id: str = "naver_api",
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Acquire a slot, sleeping exactly until it is due.
+
+        In fair mode one script call reserves the slot and the caller sleeps
+        once. Otherwise the caller sleeps until the reported next slot and
+        tries again, up to max_retries times.
+
+        Args:
+            resource_id: Identifier for the resource
+            max_retries: Attempts in non-fair mode (default: 3)
+            backoff: Unused; kept for NaverRateLimiter compatibility
+            timeout: Longest acceptable wait in seconds (default: max_wait)
+
+        Returns:
+            True if acquired, False if the wait would exceed timeout
+        """
+        if self.fair:
+            code, wait = await self.reserve(resource_id, reserve=True, max_wait=timeout)
+            if code == 0:
+                return False
+            if wait > 0:
+                await asyncio.sleep(wait)
+            return True
+
+        for _ in range(max_retries):
+            code, wait = await self.reserve(resource_id, reserve=False)
+            if code > 0:
+                return True
+            await asyncio.sleep(wait)
+
+        return False
+
+    async def reset(self, resource_id: str = "naver_api") -> None:
+        """
+        Reset rate limit (for testing purposes).
+
+        Args:
+            resource_id: Identifier for the resource
+        """
+        await self.redis.delete(self._key(resource_id))
+
+    async def close(self) -> None:
+        """Close Redis connection."""
+        await self.redis.close()
+
+
+class AdaptiveRateController:
+    """
+    AIMD control of the effective Naver rate shared by all workers.
+
+    A 429 cuts the rate by decrease_factor and a response slower than
+    latency_threshold by latency_decrease_factor; each quiet
+    increase_interval adds increase_step, probing back toward max_tps.
+    Changes go through one Lua script with a cooldown, so a burst of 429s
+    from requests already in flight counts as one congestion signal instead
+    of collapsing the rate to min_tps. GCRARateLimiter reads the stored rate
+    on every acquire.
+
+    Adjustments are best effort: a Redis error is logged and never fails the
+    Naver call that reported it.
+    """
+
+    # Returns the effective rate (as a string) after the adjustment
+    LUA_ADJUST = """
+    local key = KEYS[1]
+    local stamp_key = KEYS[2]
+    local decrease = ARGV[1] == 'decrease'
+    local amount = tonumber(ARGV[2])
+    local min_tps = tonumber(ARGV[3])
+    local max_tps = tonumber(ARGV[4])
+    local cooldown = tonumber(ARGV[5])
+
+    local time = redis.call('TIME')
+    local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+    local rate = tonumber(redis.call('GET', key)) or max_tps
+    local last = tonumber(redis.call('GET', stamp_key)) or 0
+    if now - last < cooldown or (not decrease and rate >= max_tps) then
+        return tostring(rate)
+    end
+
+    if decrease then
+        rate = math.max(min_tps, rate * amount)
+    else
+        rate = math.min(max_tps, rate + amount)
+    end
+    redis.call('SET', key, tostring(rate))
+    redis.call('SET', stamp_key, now)
+    return tostring(rate)
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional["aioredis.Redis[str]"] = None,
+        resource_id: str = "naver_api",
+        max_tps: float = settings.naver_max_tps,
+        min_tps: float = settings.naver_min_tps,
+        increase_step: float = settings.naver_rate_increase_step,
+        increase_interval: float = settings.naver_rate_increase_interval,
+        decrease_factor: float = settings.naver_rate_decrease_factor,
+        decrease_cooldown: float = settings.naver_rate_decrease_cooldown,
+        latency_threshold: float = settings.naver_latency_threshold,
+        latency_decrease_factor: float = settings.naver_latency_decrease_factor,
+    ) -> None:
+        """
+        Initialize controller.
+
+        Args:
+            redis_client: Redis client (if None, creates new one)
+            resource_id: Rate-limited resource (default: "naver_api")
+            max_tps: Ceiling the rate probes back to (default: 2)
+            min_tps: Floor for decreases (default: 0.2)
+            increase_step: TPS added per probe (default: 0.1)
+            increase_interval: Seconds between probes (default: 10)
+            decrease_factor: Rate multiplier on 429 (default: 0.5)
+            decrease_cooldown: Seconds during which further decreases are ignored (default: 2)
+            latency_threshold: Response seconds treated as congestion (default: 2)
+            latency_decrease_factor: Rate multiplier on slow responses (default: 0.8)
+        """
+        self.redis = redis_client or aioredis.from_url(
+            settings.redis_url, decode_responses=True
+        )
+        self.resource_id = resource_id
+        self.max_tps = max_tps
+        self.min_tps = min_tps
+        self.increase_step = increase_step
+        self.increase_interval = increase_interval
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        self.latency_threshold = latency_threshold
+        self.latency_decrease_factor = latency_decrease_factor
+        self._lua_script_sha: Optional[str] = None
+        self._next_probe = 0.0
+
+    async def _ensure_lua_script(self) -> str:
+        """Ensure Lua script is loaded into Redis and return SHA."""
+        if self._lua_script_sha is None:
+            self._lua_script_sha = await self.redis.script_load(self.LUA_ADJUST)  # type: ignore[no-untyped-call]
+        return self._lua_script_sha
+
+    async def _adjust(self, decrease: bool, amount: float, cooldown: float) -> Optional[float]:
+        """Run the AIMD script; returns the new rate, or None on Redis errors."""
+        try:
+            script_sha = await self._ensure_lua_script()
+            rate = await self.redis.evalsha(  # type: ignore[no-untyped-call]
+                script_sha,
+                2,  # number of keys
+                GCRARateLimiter.rate_key(self.resource_id),
+                f"{self.resource_id}:gcra:rate_changed_at",
+                "decrease" if decrease else "increase",
+                str(amount),
+                str(self.min_tps),
+                str(self.max_tps),
+                str(int(cooldown * 1000)),
+            )
+            return float(rate)
+        except Exception as e:
+            logger.warning(f"Adaptive rate adjustment failed: {e}")
+            return None
+
+    async def on_throttled(self) -> Optional[float]:
+        """
+        Report a 429 from Naver (multiplicative decrease).
+
+        Returns:
+            Effective rate after the adjustment (None if Redis failed)
+        """
+        rate = await self._adjust(True, self.decrease_factor, self.decrease_cooldown)
+        logger.warning(f"Naver throttled us; effective rate now {rate} TPS")
+        self._next_probe = time.monotonic() + self.increase_interval
+        return rate
+
+    async def on_response(self, latency: float) -> Optional[float]:
+        """
+        Report a successful response and its latency.
+
+        Slow responses decrease the rate; otherwise the rate is probed upward
+        at most once per increase_interval per process.
+
+        Args:
+            latency: Response time in seconds
+
+        Returns:
+            Effective rate after an adjustment, or None if none was attempted
+        """
+        if latency > self.latency_threshold:
+            return await self._adjust(True, self.latency_decrease_factor, self.decrease_cooldown)
+
+        now = time.monotonic()
+        if now < self._next_probe:
+            return None
+        self._next_probe = now + self.increase_interval
+        return await self._adjust(False, self.increase_step, self.increase_interval)
+
+    async def current_rate(self) -> float:
+        """Effective rate in TPS (max_tps until the first adjustment)."""
+        rate = await self.redis.get(GCRARateLimiter.rate_key(self.resource_id))
+        return float(rate) if rate else float(self.max_tps)
+
+    async def reset(self) -> None:
+        """Restore the full rate (for testing purposes)."""
+        await self.redis.delete(
+            GCRARateLimiter.rate_key(self.resource_id),
+            f"{self.resource_id}:gcra:rate_changed_at",
+        )
+
+
+RateLimiter = Union[NaverRateLimiter, GCRARateLimiter]
+
+
+def create_rate_limiter(redis_client: Optional["aioredis.Redis[str]"] = None) -> RateLimiter:
+    """
+    Create the Naver rate limiter selected by settings.naver_rate_limiter.
+
+    Args:
+        redis_client: Redis client (if None, the limiter creates its own)
+
+    Returns:
+        GCRARateLimiter for "gcra", NaverRateLimiter for "window"
+    """
+    if settings.naver_rate_limiter == "window":
+        return NaverRateLimiter(redis_client=redis_client)
+    return GCRARateLimiter(redis_client=redis_client)
+
+
+def create_rate_controller(rate_limiter: RateLimiter) -> Optional[AdaptiveRateController]:
+    """
+    Create the adaptive controller for a rate limiter.
+
+    Args:
+        rate_limiter: Limiter whose Redis connection the controller shares
+
+    Returns:
+        AdaptiveRateController, or None when disabled or the limiter is the
+        fixed-window one (which has no adjustable rate)
+    """
+    if not settings.naver_adaptive_rate_enabled or not isinstance(rate_limiter, GCRARateLimiter):
+        return None
+    return AdaptiveRateController(redis_client=rate_limiter.redis)
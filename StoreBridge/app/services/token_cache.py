@@ -0,0 +1,179 @@
+"""Shared OAuth token cache backed by Redis."""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Optional, Tuple, TypeGuard
+
+import redis.asyncio as aioredis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+TokenFetcher = Callable[[], Awaitable[Tuple[str, float]]]
+
+
+@dataclass
+class CachedToken:
+    """OAuth token with its refresh and expiry times (epoch seconds)."""
+
+    access_token: str
+    refresh_at: float
+    expires_at: float
+
+    @property
+    def is_expired(self) -> bool:
+        return time.time() >= self.expires_at
+
+    @property
+    def needs_refresh(self) -> bool:
+        return time.time() >= self.refresh_at
+
+
+class NaverTokenCache:
+    """
+    Naver OAuth token cache shared by every worker.
+
+    The token is stored in Redis with its expiry. When it reaches
+    refresh_fraction of its lifetime, exactly one worker (holding a short
+    Redis lock) fetches a new one; the others keep using the still-valid
+    token, or wait for the refresher if there is none.
+    """
+
+    TOKEN_KEY = "naver:oauth:token"
+    LOCK_KEY = "naver:oauth:token:lock"
+
+    # Lua script: delete key only if it still holds the expected value
+    LUA_COMPARE_AND_DELETE = """
+    if redis.call('GET', KEYS[1]) == ARGV[1] then
+        return redis.call('DEL', KEYS[1])
+    end
+    return 0
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional["aioredis.Redis[str]"] = None,
+        refresh_fraction: float = settings.naver_token_refresh_fraction,
+        lock_timeout: float = 10.0,
+        wait_timeout: float = 15.0,
+        poll_interval: float = 0.1,
+    ) -> None:
+        """
+        Initialize token cache.
+
+        Args:
+            redis_client: Redis client (if None, creates new one)
+            refresh_fraction: Refresh after this fraction of the lifetime (default: 0.8)
+            lock_timeout: Refresh lock TTL in seconds (default: 10)
+            wait_timeout: Longest wait for another worker's refresh (default: 15)
+            poll_interval: Poll interval while waiting in seconds (default: 0.1)
+        """
+        self.redis = redis_client or aioredis.from_url(settings.redis_url, decode_responses=True)
+        self.refresh_fraction = refresh_fraction
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+
+    async def get_token(self, fetch: TokenFetcher, rejected: Optional[str] = None) -> CachedToken:
+        """
+        Get a valid token, refreshing it (single-flight) when due.
+
+        Args:
+            fetch: Coroutine returning (access_token, expires_in_seconds)
+            rejected: Token the API just rejected (401); never returned again
+
+        Returns:
+            CachedToken
+
+        Raises:
+            TimeoutError: If no token becomes available within wait_timeout
+        """
+        cached = await self._load()
+        if self._usable(cached, rejected) and not cached.needs_refresh:
+            return cached
+
+        lock_value = str(uuid.uuid4())
+        if await self.redis.set(
+            self.LOCK_KEY, lock_value, nx=True, px=int(self.lock_timeout * 1000)
+        ):
+            try:
+                # Another worker may have refreshed just before we took the lock
+                cached = await self._load()
+                if self._usable(cached, rejected) and not cached.needs_refresh:
+                    return cached
+                return await self._refresh(fetch)
+            finally:
+                await self.redis.eval(self.LUA_COMPARE_AND_DELETE, 1, self.LOCK_KEY, lock_value)  # type: ignore[no-untyped-call]
+
+        # Someone else is refreshing; a still-valid token is good enough meanwhile
+        if self._usable(cached, rejected):
+            return cached
+
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            cached = await self._load()
+            if self._usable(cached, rejected):
+                return cached
+
+        raise TimeoutError("Timed out waiting for Naver OAuth token refresh")
+
+    async def invalidate(self, access_token: str) -> None:
+        """
+        Drop the cached token if it is still the given one.
+
+        Args:
+            access_token: Token the API rejected
+        """
+        cached = await self._load()
+        if cached is not None and cached.access_token == access_token:
+            await self.redis.delete(self.TOKEN_KEY)
+
+    async def _refresh(self, fetch: TokenFetcher) -> CachedToken:
+        """Fetch a new token and store it with its expiry."""
+        access_token, expires_in = await fetch()
+        now = time.time()
+        token = CachedToken(
+            access_token=access_token,
+            refresh_at=now + expires_in * self.refresh_fraction,
+            expires_at=now + expires_in,
+        )
+        await self.redis.set(
+            self.TOKEN_KEY,
+            json.dumps(
+                {
+                    "access_token": token.access_token,
+                    "refresh_at": token.refresh_at,
+                    "expires_at": token.expires_at,
+                }
+            ),
+            px=max(1, int(expires_in * 1000)),
+        )
+        logger.info("Shared OAuth token refreshed")
+        return token
+
+    async def _load(self) -> Optional[CachedToken]:
+        """Read the cached token from Redis."""
+        raw = await self.redis.get(self.TOKEN_KEY)
+        if not raw:
+            return None
+        try:
+            return CachedToken(**json.loads(raw))
+        except (ValueError, TypeError):
+            logger.warning("Ignoring malformed cached OAuth token")
+            return None
+
+    @staticmethod
+    def _usable(cached: Optional[CachedToken], rejected: Optional[str]) -> TypeGuard[CachedToken]:
+        """Token exists, has not expired and was not just rejected."""
+        return cached is not None and not cached.is_expired and cached.access_token != rejected
+
+    async def close(self) -> None:
+        """Close Redis connection."""
+        await self.redis.close()
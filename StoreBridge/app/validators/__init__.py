@@ -1,6 +1,15 @@
 """Validators."""
 
-from app.validators.forbidden_word_validator import ForbiddenWordValidator
+from app.validators.forbidden_word_validator import (
+    ForbiddenWordAutomaton,
+    ForbiddenWordValidator,
+    forbidden_words,
+)
 from app.validators.product_validator import ProductValidator
 
-__all__ = ["ForbiddenWordValidator", "ProductValidator"]
+__all__ = [
+    "ForbiddenWordAutomaton",
+    "ForbiddenWordValidator",
+    "ProductValidator",
+    "forbidden_words",
+]
@@ -1,8 +1,29 @@
 """Forbidden word validator."""
 
-import re
-from dataclasses import dataclass
-from typing import List
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import ForbiddenWord
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WordMatch:
+    """Forbidden word found in a text."""
+
+    word: str
+    start: int
+    end: int
 
 
 @dataclass
@@ -11,6 +32,172 @@ class ValidationResult:
 
     is_valid: bool
     errors: List[str]
+    matches: List[WordMatch] = field(default_factory=list)
+
+
+def _fold(text: str) -> str:
+    """
+    Lowercase text one character at a time.
+
+    Characters whose lowercase form is longer (e.g. 'İ') are kept as-is, so
+    positions in the folded text are positions in the original text.
+    """
+    return "".join(c if len(lower := c.lower()) != 1 else lower for c in text)
+
+
+class ForbiddenWordAutomaton:
+    """
+    Aho–Corasick automaton over a forbidden word dictionary.
+
+    Built once per dictionary; scans a text in a single pass regardless of
+    how many words the dictionary holds. Matching is case-insensitive.
+    """
+
+    def __init__(self, words: Sequence[str]) -> None:
+        """
+        Build the automaton.
+
+        Args:
+            words: Forbidden words (order is kept for reporting)
+        """
+        self.words: List[str] = list(dict.fromkeys(word for word in words if word))
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        for index, word in enumerate(self.words):
+            state = 0
+            for char in _fold(word):
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = next_state
+            self._output[state] += (index,)
+
+        # Breadth-first failure links; outputs include those of the fail state
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def find_all(self, text: str) -> List[WordMatch]:
+        """
+        Find every occurrence of every word.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Matches ordered by end position
+        """
+        matches: List[WordMatch] = []
+        goto, fail, output, words = self._goto, self._fail, self._output, self.words
+        state = 0
+
+        for position, char in enumerate(_fold(text)):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                word = words[index]
+                matches.append(WordMatch(word, position + 1 - len(word), position + 1))
+
+        return matches
+
+
+@lru_cache(maxsize=8)
+def get_automaton(words: Tuple[str, ...]) -> ForbiddenWordAutomaton:
+    """Build (once per process) the automaton for a dictionary."""
+    return ForbiddenWordAutomaton(words)
+
+
+class ForbiddenWordDictionary:
+    """
+    Process-wide forbidden word dictionary.
+
+    Starts with the built-in defaults and is reloaded from the forbidden_words
+    table at most every reload_interval seconds, so policy updates take effect
+    without restarting workers. The automaton is rebuilt only when the table
+    changed.
+    """
+
+    def __init__(
+        self,
+        words: Sequence[str],
+        reload_interval: float = settings.forbidden_words_reload_interval,
+    ) -> None:
+        """
+        Initialize dictionary.
+
+        Args:
+            words: Initial (fallback) words
+            reload_interval: Seconds between database checks (default: 300)
+        """
+        self.default_words = tuple(words)
+        self.reload_interval = reload_interval
+        self.automaton = get_automaton(self.default_words)
+        # (active word count, latest updated_at) of the loaded table
+        self._version: Optional[Tuple[int, Optional[datetime]]] = None
+        self._checked_at: Optional[float] = None
+
+    def set_words(self, words: Sequence[str]) -> None:
+        """Replace the dictionary (empty falls back to the defaults)."""
+        self.automaton = get_automaton(tuple(words) or self.default_words)
+
+    async def reload(self, db: AsyncSession, force: bool = False) -> bool:
+        """
+        Reload the dictionary from the database if it changed.
+
+        Args:
+            db: Database session
+            force: Check now even if reload_interval has not passed
+
+        Returns:
+            True if the dictionary was replaced
+        """
+        now = time.monotonic()
+        if not force and self._checked_at is not None:
+            if now - self._checked_at < self.reload_interval:
+                return False
+        self._checked_at = now
+
+        version = await self._load_version(db)
+        if version == self._version:
+            return False
+
+        result = await db.execute(
+            select(ForbiddenWord.word)
+            .where(ForbiddenWord.is_active.is_(True))
+            .order_by(ForbiddenWord.id)
+        )
+        words = list(result.scalars())
+        self.set_words(words)
+        self._version = version
+        logger.info(f"Forbidden word dictionary reloaded: {len(self.automaton.words)} words")
+        return True
+
+    @staticmethod
+    async def _load_version(db: AsyncSession) -> Tuple[int, Optional[datetime]]:
+        """Active word count and latest update of the table (changes on every edit)."""
+        result = await db.execute(
+            select(
+                func.count().filter(ForbiddenWord.is_active.is_(True)),
+                func.max(ForbiddenWord.updated_at),
+            )
+        )
+        count, updated_at = result.one()
+        return count, updated_at
 
 
 class ForbiddenWordValidator:
@@ -41,9 +228,20 @@ class ForbiddenWordValidator:
         Initialize validator.
 
         Args:
-            forbidden_words: List of forbidden words (default: use DEFAULT_FORBIDDEN_WORDS)
+            forbidden_words: List of forbidden words (default: the process-wide
+                dictionary, which starts as DEFAULT_FORBIDDEN_WORDS)
         """
-        self.forbidden_words = forbidden_words or self.DEFAULT_FORBIDDEN_WORDS
+        self._automaton = get_automaton(tuple(forbidden_words)) if forbidden_words else None
+
+    @property
+    def automaton(self) -> ForbiddenWordAutomaton:
+        """Automaton in use (the shared dictionary's current one by default)."""
+        return self._automaton or forbidden_words.automaton
+
+    @property
+    def forbidden_words(self) -> List[str]:
+        """Words being checked."""
+        return self.automaton.words
 
     def validate(self, text: str) -> ValidationResult:
         """
@@ -53,20 +251,20 @@ class ForbiddenWordValidator:
             text: Text to validate
 
         Returns:
-            ValidationResult with is_valid flag and error list
+            ValidationResult with is_valid flag, error list and match positions
         """
         if not text:
             return ValidationResult(is_valid=True, errors=[])
 
-        errors = []
+        automaton = self.automaton
+        matches = automaton.find_all(text)
 
-        for word in self.forbidden_words:
-            # Case-insensitive search
-            if re.search(re.escape(word), text, re.IGNORECASE):
-                errors.append(f"Forbidden word detected: '{word}'")
+        # One error per word, in dictionary order
+        found: Set[str] = {match.word for match in matches}
+        errors = [f"Forbidden word detected: '{word}'" for word in automaton.words if word in found]
 
         is_valid = len(errors) == 0
-        return ValidationResult(is_valid=is_valid, errors=errors)
+        return ValidationResult(is_valid=is_valid, errors=errors, matches=matches)
 
     def validate_product(self, name: str, description: str) -> ValidationResult:
         """
@@ -85,4 +283,12 @@ class ForbiddenWordValidator:
         all_errors = name_result.errors + desc_result.errors
         is_valid = len(all_errors) == 0
 
-        return ValidationResult(is_valid=is_valid, errors=all_errors)
+        return ValidationResult(
+            is_valid=is_valid,
+            errors=all_errors,
+            matches=name_result.matches + desc_result.matches,
+        )
+
+
+# Shared by every validator in the process
+forbidden_words = ForbiddenWordDictionary(ForbiddenWordValidator.DEFAULT_FORBIDDEN_WORDS)
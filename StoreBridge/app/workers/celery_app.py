@@ -1,5 +1,7 @@
 """Celery application configuration."""
 
+from typing import List
+
 from celery import Celery
 
 from app.config import settings
@@ -20,8 +22,8 @@ celery_app.conf.update(
     timezone="Asia/Seoul",
     enable_utc=True,
     task_track_started=True,
-    task_time_limit=1800,  # 30 minutes max per task
-    task_soft_time_limit=1500,  # 25 minutes soft limit
+    task_time_limit=settings.celery_task_time_limit,  # 30 minutes max per task
+    task_soft_time_limit=settings.celery_task_soft_time_limit,  # 25 minutes soft limit
     worker_prefetch_multiplier=1,  # One task at a time for rate limiting
     worker_max_tasks_per_child=100,  # Restart worker after 100 tasks (prevent memory leaks)
     task_acks_late=True,  # Acknowledge tasks after completion
@@ -33,6 +35,46 @@ celery_app.conf.update(
 # Task routing (optional - for multiple queues)
 celery_app.conf.task_routes = {
     "app.workers.tasks.import_products_task": {"queue": "import"},
+    "app.workers.tasks.sync_products_task": {"queue": "import"},
     "app.workers.tasks.register_product_task": {"queue": "register"},
+    "app.workers.tasks.register_products_batch_task": {"queue": "register"},
     "app.workers.tasks.update_job_status_task": {"queue": "default"},
+    "app.workers.tasks.flush_job_counters_task": {"queue": "default"},
+    "app.workers.tasks.relay_outbox_task": {"queue": "default"},
+    "app.workers.tasks.recover_stale_registrations_task": {"queue": "default"},
+}
+
+# Registration queue per job priority (JobConfig.priority); workers consume
+# all three (-Q register.urgent,register.high,register) or run dedicated lanes
+REGISTRATION_QUEUES = {
+    "urgent": "register.urgent",
+    "high": "register.high",
+    "normal": "register",
+}
+
+
+def registration_queue(priority: str) -> str:
+    """Celery queue for a job priority's registration batches."""
+    return REGISTRATION_QUEUES.get(priority, REGISTRATION_QUEUES["normal"])
+
+
+def celery_queues() -> List[str]:
+    """Every queue the workers consume (for queue depth metrics)."""
+    return ["import", *REGISTRATION_QUEUES.values(), "default"]
+
+
+# Periodic tasks (celery beat)
+celery_app.conf.beat_schedule = {
+    "flush-job-counters": {
+        "task": "app.workers.tasks.flush_job_counters_task",
+        "schedule": settings.job_counters_flush_interval,
+    },
+    "relay-outbox": {
+        "task": "app.workers.tasks.relay_outbox_task",
+        "schedule": settings.outbox_relay_interval,
+    },
+    "recover-stale-registrations": {
+        "task": "app.workers.tasks.recover_stale_registrations_task",
+        "schedule": settings.registration_recovery_interval,
+    },
 }
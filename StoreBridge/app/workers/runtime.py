@@ -0,0 +1,170 @@
+"""Per-process runtime shared by all Celery tasks in a worker."""
+
+import asyncio
+import logging
+import os
+from collections.abc import Coroutine
+from typing import Any, Optional, TypeVar, Union
+
+import httpx
+import redis.asyncio as aioredis
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.connectors.naver_client import NaverClient
+from app.database import close_db, get_session_factory
+from app.services.catalog_crawler import SharedRequestPacer
+from app.services.category_resolver import CategoryResolver
+from app.services.domeggook_cache import DomeggookResponseCache
+from app.services.job_counters import JobCounters
+from app.services.job_events import JobEventPublisher
+from app.services.metrics import mark_process_dead, start_metrics_server
+from app.services.naver_dispatcher import NaverDispatchClient
+from app.services.quota_ledger import QuotaLedger
+from app.services.rate_limiter import RateLimiter, create_rate_limiter
+from app.services.token_cache import NaverTokenCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WorkerRuntime:
+    """
+    Long-lived resources for one worker process.
+
+    Celery tasks are synchronous, so each one used to call asyncio.run(),
+    creating a new event loop and new connections per task while the async
+    engine pool stayed bound to whichever loop touched it first. The runtime
+    keeps one event loop, one async engine (via app.database), one Redis
+    client, one warm NaverClient and one pooled HTTP client for image
+    downloads for the lifetime of the process.
+    """
+
+    def __init__(self) -> None:
+        """Create the event loop and shared clients."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.redis: aioredis.Redis[str] = aioredis.from_url(
+            settings.redis_url, decode_responses=True
+        )
+        self.rate_limiter: RateLimiter = create_rate_limiter(self.redis)
+        self.token_cache = NaverTokenCache(redis_client=self.redis)
+        self.events = JobEventPublisher(redis_client=self.redis)
+        self.counters = JobCounters(redis_client=self.redis)
+        self.quota = QuotaLedger(redis_client=self.redis)
+        self.domeggook_pacer = SharedRequestPacer(redis_client=self.redis)
+        self.domeggook_cache: Optional[DomeggookResponseCache] = (
+            DomeggookResponseCache(redis_client=self.redis)
+            if settings.domeggook_cache_enabled
+            else None
+        )
+        # Image downloads keep their connections alive across products and batches
+        self.image_http_client = httpx.AsyncClient(timeout=30.0, follow_redirects=True)
+        self._naver_client: Optional[NaverClient] = None
+        self._category_resolver: Optional[CategoryResolver] = None
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Session factory bound to the process-wide async engine."""
+        return get_session_factory()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine to completion on the worker's event loop.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Coroutine result
+        """
+        return self.loop.run_until_complete(coro)
+
+    def naver_client(self, priority: str = "normal") -> Union[NaverClient, NaverDispatchClient]:
+        """
+        Get the shared Naver client.
+
+        Args:
+            priority: Dispatcher lane for the calls (urgent, high, normal)
+
+        Returns:
+            NaverDispatchClient when the dispatcher is enabled, otherwise a
+            long-lived NaverClient (which has no lanes; only the dispatcher
+            shares rate limit slots by priority). Callers must not close it.
+        """
+        if settings.naver_dispatcher_enabled:
+            return NaverDispatchClient(redis_client=self.redis, priority=priority)
+
+        if self._naver_client is None:
+            self._naver_client = NaverClient(
+                rate_limiter=self.rate_limiter,
+                token_cache=self.token_cache,
+                quota=self.quota.usage("naver"),
+            )
+        return self._naver_client
+
+    def category_resolver(self) -> CategoryResolver:
+        """
+        Get the shared category resolver.
+
+        Returns:
+            CategoryResolver whose in-process cache lives as long as the worker
+        """
+        if self._category_resolver is None:
+            self._category_resolver = CategoryResolver(
+                redis_client=self.redis, naver_client=self.naver_client()
+            )
+        return self._category_resolver
+
+    def close(self) -> None:
+        """Dispose of the engine, clients and event loop."""
+        try:
+            self.run(self.image_http_client.aclose())
+            if self._naver_client is not None:
+                self.run(self._naver_client.close())
+            else:
+                self.run(self.redis.close())
+            self.run(close_db())
+        finally:
+            self.loop.close()
+
+
+_runtime: Optional[WorkerRuntime] = None
+
+
+def get_runtime() -> WorkerRuntime:
+    """Get the worker runtime, creating it on first use (e.g. solo pool, eager mode)."""
+    global _runtime
+    if _runtime is None:
+        _runtime = WorkerRuntime()
+    return _runtime
+
+
+@worker_init.connect
+def start_worker_metrics(**kwargs: Any) -> None:
+    """Serve the worker's metrics on settings.prometheus_port from the main process."""
+    try:
+        start_metrics_server(settings.prometheus_port)
+    except OSError as e:
+        logger.warning(f"Metrics server not started: {e}")
+
+
+@worker_process_init.connect
+def init_worker_runtime(**kwargs: Any) -> None:
+    """Create the runtime in each freshly forked worker process."""
+    global _runtime
+    _runtime = WorkerRuntime()
+    logger.info("Worker runtime initialized")
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_runtime(**kwargs: Any) -> None:
+    """Release the runtime's connections when the worker process exits."""
+    global _runtime
+    if _runtime is not None:
+        _runtime.close()
+        _runtime = None
+        logger.info("Worker runtime closed")
+    mark_process_dead(os.getpid())
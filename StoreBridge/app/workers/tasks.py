@@ -2,35 +2,77 @@
 
 import logging
 import uuid
-from datetime import datetime, timezone
-from typing import Any, Dict, List
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.connectors.domeggook_client import DomeggookClient
-from app.connectors.naver_client import NaverClient
+from app.connectors.naver_client import NaverClient, NaverRateLimitError
 from app.models import Job, JobStatus, Product, ProductRegistration, State
+from app.services.catalog_crawler import CatalogPage, DomeggookCatalogCrawler
+from app.services.category_resolver import ResolvedCategory
+from app.services.image_pipeline import ImagePipeline, ImageResult
+from app.services.job_counters import (
+    FINAL_STATES,
+    WRITE_FAILED_FIELD,
+    JobCounters,
+    Transition,
+    summarize,
+)
+from app.services.job_events import JobEventPublisher
+from app.services.metrics import REGISTRATION_TRANSITIONS
+from app.services.naver_dispatcher import NaverDispatchClient
 from app.services.option_mapper import OptionMapper
+from app.services.outbox import relay_outbox, stage_task
+from app.services.pipeline import BatchWriter, Stage, StagePipeline
+from app.services.product_sync import PayloadBuilder, ProductSyncEngine, SyncResult
+from app.services.product_writer import ProductBulkWriter, ProductCopyWriter, WriteResult
+from app.services.quota_ledger import QuotaLedger
+from app.validators.forbidden_word_validator import forbidden_words
 from app.validators.product_validator import ProductValidator
-from app.workers.celery_app import celery_app
+from app.workers.celery_app import celery_app, registration_queue
+from app.workers.runtime import get_runtime
 
 logger = logging.getLogger(__name__)
 
-# Create async engine for database
-engine = create_async_engine(settings.database_url, echo=False, pool_pre_ping=True)
-async_session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
 
 def get_async_session() -> AsyncSession:
-    """Get async database session."""
-    return async_session_maker()
+    """Get async database session from the worker's pooled engine."""
+    return get_runtime().session_factory()
+
+
+def _events() -> JobEventPublisher:
+    """Job event publisher sharing the worker's Redis connection."""
+    return get_runtime().events
+
+
+def _counters() -> JobCounters:
+    """Job counters sharing the worker's Redis connection."""
+    return get_runtime().counters
+
+
+def _quota() -> QuotaLedger:
+    """Daily quota ledger sharing the worker's Redis connection."""
+    return get_runtime().quota
+
+
+def _domeggook_client(job_id: str) -> DomeggookClient:
+    """Create a Domeggook client counting its calls against the job's quota reservation."""
+    return DomeggookClient(
+        cache=get_runtime().domeggook_cache, quota=_quota().usage("domeggook", job_id)
+    )
+
+
+def _naver_client(priority: str = "normal") -> Union[NaverClient, NaverDispatchClient]:
+    """Get the worker's shared Naver client (routed through the dispatcher when enabled)."""
+    return get_runtime().naver_client(priority)
 
 
 @celery_app.task(bind=True, name="app.workers.tasks.import_products_task")
-def import_products_task(self, job_id: str) -> Dict[str, Any]:
+def import_products_task(self: Any, job_id: str) -> Dict[str, Any]:
     """
     Import products from Domeggook and queue for registration.
 
@@ -40,17 +82,15 @@ def import_products_task(self, job_id: str) -> Dict[str, Any]:
     Returns:
         Task result with statistics
     """
-    import asyncio
-
     logger.info(f"Starting import job: {job_id}")
 
     try:
-        result = asyncio.run(_import_products_async(job_id))
+        result = get_runtime().run(_import_products_async(job_id))
         logger.info(f"Import job {job_id} completed: {result}")
         return result
     except Exception as e:
         logger.error(f"Import job {job_id} failed: {e}", exc_info=True)
-        asyncio.run(_mark_job_failed(job_id, str(e)))
+        get_runtime().run(_mark_job_failed(job_id, str(e)))
         raise
 
 
@@ -64,93 +104,204 @@ async def _import_products_async(job_id: str) -> Dict[str, Any]:
 
         if not job:
             raise ValueError(f"Job not found: {job_id}")
+        if not await _claim_job(db, job):
+            # Duplicate delivery (the outbox relay is at-least-once)
+            logger.info(f"Import job {job_id} already {job.status.value}; skipping")
+            return {"job_id": job_id, "skipped": True}
+        await _events().status(job_id, JobStatus.RUNNING)
 
-        # Update job status to RUNNING
-        job.status = JobStatus.RUNNING
-        job.started_at = datetime.now(timezone.utc)
-        await db.commit()
+        # Warm the category cache once for every registration of this job
+        await get_runtime().category_resolver().preload_all(db)
 
         try:
             # Extract config
             config = job.config
             source = config.get("source", "domeggook")
-            filter_config = config.get("filter", {})
-            limit = config.get("limit", 100)
+            limit = config.get("limit")
             auto_register = config.get("auto_register", True)
+            priority = config.get("priority", "normal")
+
+            # Upsert products page by page as the crawl streams them in
+            total_count = 0
+            # Registration batches are staged in the outbox in each chunk's transaction;
+            # ingest="copy" loads large catalogs through COPY + one merge per chunk
+            writer_class = (
+                ProductCopyWriter if config.get("ingest") == "copy" else ProductBulkWriter
+            )
+            writer = writer_class(
+                db,
+                job_id=uuid.UUID(job_id),
+                on_pending=(
+                    lambda session, ids: _stage_registrations(session, ids, priority)
+                    if auto_register
+                    else None
+                ),
+            )
+            write_result = WriteResult()
+
+            async with _domeggook_client(job_id) as client:
+                crawler = DomeggookCatalogCrawler(client, pacer=get_runtime().domeggook_pacer)
+                pages = _crawl_catalog(crawler, config)
+
+                async for page in pages:
+                    if page.page == 1:
+                        # Update job total count from the first page
+                        total_count = (
+                            page.total_count if limit is None else min(page.total_count, limit)
+                        )
+                        job.total_count = total_count
+                        await db.commit()
+                        await _events().status(job_id, JobStatus.RUNNING, total_count)
+
+                    chunk_result = await writer.add(page.items)
+                    write_result.merge(chunk_result)
+                    await _handle_written(job_id, chunk_result, auto_register)
+                    await _relay_outbox(db)
+
+            chunk_result = await writer.flush()
+            write_result.merge(chunk_result)
+            await _handle_written(job_id, chunk_result, auto_register)
+            await _relay_outbox(db)
+
+            success_count = write_result.success_count
+            failed_count = write_result.failed_count
+            error_summary = write_result.error_summary
+
+            if crawler.truncated:
+                error_summary["CRAWL_TRUNCATED"] = 1
 
-            # Fetch products from Domeggook
-            async with DomeggookClient() as client:
-                response = await client.get_item_list(
-                    page=1,
-                    page_size=min(limit, 100),
-                    category=filter_config.get("category"),
-                    keyword=filter_config.get("keyword"),
-                    price_min=filter_config.get("price_min"),
-                    price_max=filter_config.get("price_max"),
-                )
+            # Update job statistics
+            job.success_count = success_count
+            job.failed_count = failed_count
+            job.error_summary = error_summary
+            job.status = JobStatus.COMPLETED
+            job.completed_at = datetime.now(timezone.utc)
+            await db.commit()
+            await _events().status(job_id, JobStatus.COMPLETED)
+            # Registrations still in flight keep the Naver reservation; the
+            # counter flush releases it once they are done
+            in_flight = 0
+            if auto_register:
+                _, _, in_flight = summarize(await _counters().get(job_id))
+            await _quota().release(job_id, ["domeggook"] if in_flight else None)
 
-            items = response.get("items", [])
-            total_count = len(items)
+            return {
+                "job_id": job_id,
+                "total_count": total_count,
+                "success_count": success_count,
+                "failed_count": failed_count,
+                "error_summary": error_summary,
+            }
 
-            # Update job total count
-            job.total_count = total_count
+        except Exception as e:
+            job.status = JobStatus.FAILED
+            job.completed_at = datetime.now(timezone.utc)
+            job.error_summary = {"error": str(e)}
             await db.commit()
+            await _events().status(job_id, JobStatus.FAILED)
+            await _quota().release(job_id)
+            raise
 
-            # Process each product
-            success_count = 0
-            failed_count = 0
-            error_summary: Dict[str, int] = {}
 
-            for item in items[:limit]:
-                try:
-                    # Create Product record
-                    product = Product(
-                        domeggook_item_id=item.get("item_id", str(uuid.uuid4())),
-                        name=item.get("item_name", "Unknown"),
-                        price=item.get("price", 0),
-                        category=item.get("category"),
-                        images=item.get("images", []),
-                        options={"raw": item.get("options", [])},
-                        raw_data=item,
-                    )
-                    db.add(product)
-                    await db.flush()
-
-                    # Create ProductRegistration record
-                    registration = ProductRegistration(
-                        product_id=product.id,
-                        job_id=uuid.UUID(job_id),
-                        state=State.PENDING,
-                        seller_product_code=f"DG-{product.domeggook_item_id}",
-                    )
-                    db.add(registration)
-                    await db.commit()
+def _crawl_catalog(
+    crawler: DomeggookCatalogCrawler, config: Dict[str, Any]
+) -> AsyncIterator[CatalogPage]:
+    """Start crawling the catalog pages selected by a job config."""
+    filter_config = config.get("filter") or {}
+    return crawler.iter_pages(
+        limit=config.get("limit"),
+        category=filter_config.get("category"),
+        keyword=filter_config.get("keyword"),
+        price_min=filter_config.get("price_min"),
+        price_max=filter_config.get("price_max"),
+    )
 
-                    success_count += 1
 
-                    # Queue registration task if auto_register
-                    if auto_register:
-                        register_product_task.delay(str(product.id))
+@celery_app.task(bind=True, name="app.workers.tasks.sync_products_task")
+def sync_products_task(self: Any, job_id: str) -> Dict[str, Any]:
+    """
+    Sync prices or inventory of registered products to Naver.
 
-                except Exception as e:
-                    logger.error(f"Failed to process product {item.get('item_id')}: {e}")
-                    failed_count += 1
-                    error_type = type(e).__name__
-                    error_summary[error_type] = error_summary.get(error_type, 0) + 1
+    Args:
+        job_id: Job UUID string (type SYNC_PRICE or SYNC_INVENTORY)
 
-            # Update job statistics
-            job.success_count = success_count
-            job.failed_count = failed_count
+    Returns:
+        Task result with statistics
+    """
+    logger.info(f"Starting sync job: {job_id}")
+
+    try:
+        result = get_runtime().run(_sync_products_async(job_id))
+        logger.info(f"Sync job {job_id} completed: {result}")
+        return result
+    except Exception as e:
+        logger.error(f"Sync job {job_id} failed: {e}", exc_info=True)
+        get_runtime().run(_mark_job_failed(job_id, str(e)))
+        raise
+
+
+async def _sync_products_async(job_id: str) -> Dict[str, Any]:
+    """Async implementation of price/inventory sync."""
+    async with get_async_session() as db:
+        stmt = select(Job).where(Job.id == uuid.UUID(job_id))
+        result = await db.execute(stmt)
+        job = result.scalar_one_or_none()
+
+        if not job:
+            raise ValueError(f"Job not found: {job_id}")
+        if not await _claim_job(db, job):
+            logger.info(f"Sync job {job_id} already {job.status.value}; skipping")
+            return {"job_id": job_id, "skipped": True}
+        await _events().status(job_id, JobStatus.RUNNING)
+
+        try:
+            limit = job.config.get("limit")
+            priority = job.config.get("priority", "normal")
+            engine = ProductSyncEngine(
+                db, _naver_client(priority), job.type, _sync_payload_builder(db, priority)
+            )
+            sync_result = SyncResult()
+
+            # Re-crawl and push only the products whose fingerprint changed
+            async with _domeggook_client(job_id) as client:
+                crawler = DomeggookCatalogCrawler(client, pacer=get_runtime().domeggook_pacer)
+                async for page in _crawl_catalog(crawler, job.config):
+                    if page.page == 1:
+                        job.total_count = (
+                            page.total_count if limit is None else min(page.total_count, limit)
+                        )
+                        await db.commit()
+                        await _events().status(job_id, JobStatus.RUNNING, job.total_count)
+
+                    page_result = await engine.sync(page.items)
+                    sync_result.merge(page_result)
+                    await _events().progress(
+                        job_id,
+                        success=page_result.unchanged_count + page_result.updated_count,
+                        failed=page_result.failed_count,
+                        errors=page_result.error_summary,
+                    )
+
+            error_summary = sync_result.error_summary
+            if crawler.truncated:
+                error_summary["CRAWL_TRUNCATED"] = 1
+
+            job.success_count = sync_result.unchanged_count + sync_result.updated_count
+            job.failed_count = sync_result.failed_count
             job.error_summary = error_summary
             job.status = JobStatus.COMPLETED
             job.completed_at = datetime.now(timezone.utc)
             await db.commit()
+            await _events().status(job_id, JobStatus.COMPLETED)
+            await _quota().release(job_id)
 
             return {
                 "job_id": job_id,
-                "total_count": total_count,
-                "success_count": success_count,
-                "failed_count": failed_count,
+                "checked_count": sync_result.checked_count,
+                "updated_count": sync_result.updated_count,
+                "unchanged_count": sync_result.unchanged_count,
+                "skipped_count": sync_result.skipped_count,
+                "failed_count": sync_result.failed_count,
                 "error_summary": error_summary,
             }
 
@@ -159,9 +310,111 @@ async def _import_products_async(job_id: str) -> Dict[str, Any]:
             job.completed_at = datetime.now(timezone.utc)
             job.error_summary = {"error": str(e)}
             await db.commit()
+            await _events().status(job_id, JobStatus.FAILED)
+            await _quota().release(job_id)
             raise
 
 
+async def _handle_written(job_id: str, written: WriteResult, auto_register: bool) -> None:
+    """
+    Count written products and publish progress.
+
+    With auto_register a product counts as done once its registration
+    finishes, so its registration state (or its write failure) is counted
+    here; otherwise writing it is the job.
+    """
+    if auto_register:
+        counters = await _counters().increment(
+            {
+                uuid.UUID(job_id): {
+                    **written.registration_states,
+                    WRITE_FAILED_FIELD: written.failed_count,
+                }
+            }
+        )
+        # A redelivered import finds its own registrations already past PENDING
+        success, failed, _ = summarize(written.registration_states)
+        errors = dict(written.error_summary)
+        if failed:
+            errors[State.MANUAL_REVIEW.value] = errors.get(State.MANUAL_REVIEW.value, 0) + failed
+        await _events().progress(
+            job_id,
+            success=success,
+            failed=written.failed_count + failed,
+            errors=errors,
+            counters=counters.get(job_id),
+        )
+    else:
+        await _events().progress(
+            job_id,
+            success=written.success_count,
+            failed=written.failed_count,
+            errors=written.error_summary,
+        )
+
+
+async def _claim_job(db: AsyncSession, job: Job) -> bool:
+    """
+    Move a PENDING job to RUNNING, unless another delivery of its task got there first.
+
+    The conditional UPDATE is the claim: of two deliveries running at once
+    (the outbox relay is at-least-once), only one sees the row come back.
+
+    Returns:
+        Whether this task runs the job
+    """
+    started_at = datetime.now(timezone.utc)
+    result = await db.execute(
+        update(Job)
+        .where(Job.id == job.id, Job.status == JobStatus.PENDING)
+        .values(status=JobStatus.RUNNING, started_at=started_at)
+        .returning(Job.id)
+        .execution_options(synchronize_session=False)
+    )
+    claimed = result.scalar_one_or_none() is not None
+    await db.commit()
+    if claimed:
+        job.status = JobStatus.RUNNING
+        job.started_at = started_at
+    else:
+        await db.refresh(job)
+    return claimed
+
+
+def _stage_registrations(
+    db: AsyncSession,
+    product_ids: List[Any],
+    priority: str = "normal",
+    countdown: Optional[int] = None,
+) -> None:
+    """
+    Stage batch registration tasks of registration_batch_size products each.
+
+    The tasks are written to the outbox in the caller's transaction and reach
+    the broker after it commits. Batches go to the job priority's own queue,
+    so an urgent job's batches do not wait behind every batch of a bulk import.
+    """
+    batch_size = settings.registration_batch_size
+    for start in range(0, len(product_ids), batch_size):
+        batch = product_ids[start : start + batch_size]
+        stage_task(
+            db,
+            register_products_batch_task.name,
+            [[str(product_id) for product_id in batch], priority],
+            queue=registration_queue(priority),
+            countdown=countdown,
+        )
+
+
+async def _relay_outbox(db: AsyncSession) -> None:
+    """Publish staged tasks right away; the periodic relay retries what this misses."""
+    try:
+        await relay_outbox(db)
+    except Exception as e:
+        logger.warning(f"Outbox relay failed, leaving tasks to the periodic relay: {e}")
+        await db.rollback()
+
+
 async def _mark_job_failed(job_id: str, error_message: str) -> None:
     """Mark job as failed."""
     async with get_async_session() as db:
@@ -174,10 +427,201 @@ async def _mark_job_failed(job_id: str, error_message: str) -> None:
             job.completed_at = datetime.now(timezone.utc)
             job.error_summary = {"error": error_message}
             await db.commit()
+            await _quota().release(job_id)
+
+
+def _raw_options(product: Product) -> List[str]:
+    """Raw Domeggook option strings stored on a product."""
+    return product.options.get("raw", []) if product.options else []
+
+
+def _validation_payload(product: Product) -> Dict[str, Any]:
+    """Build the ProductValidator input for a product."""
+    return {
+        "name": product.name,
+        "price": product.price,
+        "description": product.raw_data.get("description", ""),
+        "images": product.images,
+        "category": product.category,
+        "options": _raw_options(product),
+    }
+
+
+def _source_images(product: Product) -> List[str]:
+    """Source image URLs sent to Naver (Naver accepts up to 10)."""
+    return product.images[:10]
+
+
+async def _upload_images(
+    db: AsyncSession, products: List[Product], priority: str = "normal"
+) -> Optional[ImageResult]:
+    """
+    Move the products' images to the Naver CDN.
+
+    Returns:
+        ImageResult, or None when the image pipeline is disabled
+    """
+    if not settings.image_pipeline_enabled:
+        return None
+    pipeline = ImagePipeline(
+        db, _naver_client(priority), http_client=get_runtime().image_http_client
+    )
+    return await pipeline.process([url for p in products for url in _source_images(p)])
+
+
+def _set_naver_images(
+    payload: Dict[str, Any], product: Product, images: Optional[ImageResult]
+) -> None:
+    """
+    Point the payload at the product's Naver CDN images.
+
+    Raises:
+        ValueError: If none of the product's images could be uploaded
+    """
+    if images is None:
+        return
+    naver_urls = images.resolve(_source_images(product))
+    if product.images and not naver_urls:
+        raise ValueError(f"No images could be uploaded: {images.failed_urls}")
+    payload["originProduct"]["images"] = [{"url": url} for url in naver_urls]
+
+
+async def _resolve_categories(
+    db: AsyncSession, products: List[Product]
+) -> Dict[str, Optional[ResolvedCategory]]:
+    """
+    Resolve the products' Naver categories through the shared resolver cache.
+
+    Required attributes of mapped categories are fetched from Naver (cached)
+    when the mapping does not store them.
+    """
+    resolver = get_runtime().category_resolver()
+    resolved = await resolver.preload(db, [product.category for product in products])
+    for category in resolved.values():
+        if category is not None and category.required_attributes is None:
+            try:
+                category.required_attributes = await resolver.get_attributes(
+                    category.naver_category_id
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to get attributes for category {category.naver_category_id}: {e}"
+                )
+    return resolved
+
+
+def _category_errors(category: Optional[ResolvedCategory]) -> List[str]:
+    """Validation errors for required category attributes without a default."""
+    if category is None:
+        return []
+    return [f"Missing required attribute: '{name}'" for name in category.missing_attributes()]
+
+
+def _build_naver_product(
+    product: Product,
+    registration: ProductRegistration,
+    option_mapper: OptionMapper,
+    category: Optional[ResolvedCategory] = None,
+) -> Dict[str, Any]:
+    """
+    Build the Naver register_product payload for a product.
+
+    Images are the Domeggook URLs; _set_naver_images swaps in the CDN URLs.
+    Unmapped categories fall back to naver_default_category_id.
+
+    Raises:
+        ValueError: If the product's options cannot be parsed
+    """
+    parsed_options = option_mapper.parse(_raw_options(product))
+    naver_options = option_mapper.to_naver_format(parsed_options)
+    category_id = category.naver_category_id if category else settings.naver_default_category_id
+    attributes = category.default_attributes if category else {}
+    stock_quantity = product.raw_data.get("stock_quantity")
+
+    return {
+        "originProduct": {
+            "name": product.name[:100],  # Naver has 100 char limit
+            "salePrice": product.price,
+            "categoryId": category_id,
+            "images": [{"url": url} for url in _source_images(product)],
+            "detailContent": product.raw_data.get("description", ""),
+            "saleType": "NEW",
+            "saleStartDate": datetime.now(timezone.utc).isoformat(),
+            "sellerProductCode": registration.seller_product_code,
+            **({"stockQuantity": stock_quantity} if stock_quantity is not None else {}),
+            **({"attributes": attributes} if attributes else {}),
+            **naver_options,
+        }
+    }
+
+
+def _sync_payload_builder(db: AsyncSession, priority: str = "normal") -> PayloadBuilder:
+    """
+    Build sync updates with the registration payload builder.
+
+    Images resolve through the image pipeline, which finds a registered
+    product's images in image_assets without uploading them again.
+    """
+    option_mapper = OptionMapper()
+
+    async def build(product: Product, registration: ProductRegistration) -> Dict[str, Any]:
+        categories = await _resolve_categories(db, [product])
+        payload = _build_naver_product(
+            product, registration, option_mapper, categories.get(product.category or "")
+        )
+        _set_naver_images(payload, product, await _upload_images(db, [product], priority))
+        return payload
+
+    return build
+
+
+def _is_throttled(error: Exception) -> bool:
+    """Whether a Naver call failed because Naver (or our limiter) is shedding load."""
+    return getattr(error, "status_code", None) == 429
+
+
+async def _record_transitions(transitions: List[Transition]) -> None:
+    """
+    Count committed registration state transitions in the job counters and
+    metrics, and publish one progress event per job for registrations that
+    finished, carrying the job's counters as of this update.
+
+    Args:
+        transitions: Transitions just committed
+    """
+    if not transitions:
+        return
+    counters = await _counters().record(transitions)
+
+    per_job: Dict[uuid.UUID, Dict[str, Any]] = {}
+    for transition in transitions:
+        REGISTRATION_TRANSITIONS.labels(transition.to_state.value).inc()
+        if transition.job_id is None or transition.to_state not in FINAL_STATES:
+            continue
+        counts = per_job.setdefault(transition.job_id, {"success": 0, "failed": 0, "errors": {}})
+        if transition.to_state == State.COMPLETED:
+            counts["success"] += 1
+        else:
+            counts["failed"] += 1
+            errors = counts["errors"]
+            errors[transition.error_type] = errors.get(transition.error_type, 0) + 1
+
+    for job_id, counts in per_job.items():
+        await _events().progress(job_id, **counts, counters=counters.get(str(job_id)))
+
+
+async def _set_state(
+    db: AsyncSession, registration: ProductRegistration, state: State, error_type: str = ""
+) -> None:
+    """Commit one registration's state change and record the transition."""
+    transition = Transition(registration.job_id, registration.state, state, error_type)
+    registration.state = state
+    await db.commit()
+    await _record_transitions([transition])
 
 
 @celery_app.task(bind=True, name="app.workers.tasks.register_product_task")
-def register_product_task(self, product_id: str) -> Dict[str, Any]:
+def register_product_task(self: Any, product_id: str) -> Dict[str, Any]:
     """
     Register a single product to Naver Smart Store.
 
@@ -187,19 +631,23 @@ def register_product_task(self, product_id: str) -> Dict[str, Any]:
     Returns:
         Task result with registration status
     """
-    import asyncio
-
     logger.info(f"Starting product registration: {product_id}")
 
     try:
-        result = asyncio.run(_register_product_async(product_id))
-        logger.info(f"Product {product_id} registered: {result}")
-        return result
+        result = get_runtime().run(_register_product_async(product_id))
     except Exception as e:
         logger.error(f"Product {product_id} registration failed: {e}", exc_info=True)
-        asyncio.run(_mark_registration_failed(product_id, str(e)))
+        get_runtime().run(_mark_registration_failed(product_id, str(e)))
         raise
 
+    if result["status"] == "retrying":
+        # Already RETRYING in the database; the retry budget is tracked there
+        logger.info(f"Product {product_id} registration retrying in {result['retry_in']}s")
+        raise self.retry(countdown=result["retry_in"], max_retries=None)
+
+    logger.info(f"Product {product_id} registered: {result}")
+    return result
+
 
 async def _register_product_async(product_id: str) -> Dict[str, Any]:
     """Async implementation of product registration."""
@@ -212,77 +660,56 @@ async def _register_product_async(product_id: str) -> Dict[str, Any]:
         if not product:
             raise ValueError(f"Product not found: {product_id}")
 
-        stmt = select(ProductRegistration).where(
-            ProductRegistration.product_id == uuid.UUID(product_id)
+        registration_result = await db.execute(
+            select(ProductRegistration).where(
+                ProductRegistration.product_id == uuid.UUID(product_id)
+            )
         )
-        result = await db.execute(stmt)
-        registration = result.scalar_one_or_none()
+        registration = registration_result.scalar_one_or_none()
 
         if not registration:
             raise ValueError(f"Registration not found for product: {product_id}")
 
         try:
             # Update state to VALIDATED
-            registration.state = State.VALIDATED
-            await db.commit()
+            await _set_state(db, registration, State.VALIDATED)
 
             # Validate product
+            await forbidden_words.reload(db)
             validator = ProductValidator()
-            validation_result = validator.validate(
-                {
-                    "name": product.name,
-                    "price": product.price,
-                    "description": product.raw_data.get("description", ""),
-                    "images": product.images,
-                    "category": product.category,
-                    "options": product.options.get("raw", []) if product.options else [],
-                }
-            )
+            validation_result = validator.validate(_validation_payload(product))
+            category = (await _resolve_categories(db, [product])).get(product.category or "")
+            errors = validation_result.errors + _category_errors(category)
 
-            if not validation_result.is_valid:
+            if errors:
                 # Move to manual review
-                registration.state = State.MANUAL_REVIEW
-                registration.error_message = "; ".join(validation_result.errors)
-                await db.commit()
+                registration.error_message = "; ".join(errors)
+                await _set_state(db, registration, State.MANUAL_REVIEW, State.MANUAL_REVIEW.value)
                 return {
                     "product_id": product_id,
                     "status": "manual_review",
-                    "errors": validation_result.errors,
+                    "errors": errors,
                 }
 
-            # Parse options
-            option_mapper = OptionMapper()
-            raw_options = product.options.get("raw", []) if product.options else []
-            parsed_options = option_mapper.parse(raw_options)
-            naver_options = option_mapper.to_naver_format(parsed_options)
-
-            # Prepare Naver product data
-            naver_product_data = {
-                "originProduct": {
-                    "name": product.name[:100],  # Naver has 100 char limit
-                    "salePrice": product.price,
-                    "categoryId": "50000000",  # TODO: Category mapping
-                    "images": [{"url": url} for url in product.images[:10]],
-                    "detailContent": product.raw_data.get("description", ""),
-                    "saleType": "NEW",
-                    "saleStartDate": datetime.now(timezone.utc).isoformat(),
-                    "sellerProductCode": registration.seller_product_code,
-                    **naver_options,
-                }
-            }
+            # Parse options and prepare Naver product data
+            naver_product_data = _build_naver_product(
+                product, registration, OptionMapper(), category
+            )
+
+            # Upload images to the Naver CDN
+            await _set_state(db, registration, State.UPLOADING)
+            images = await _upload_images(db, [product])
+            _set_naver_images(naver_product_data, product, images)
 
             # Update state to REGISTERING
-            registration.state = State.REGISTERING
-            await db.commit()
+            await _set_state(db, registration, State.REGISTERING)
 
             # Register to Naver
-            async with NaverClient() as naver_client:
-                naver_response = await naver_client.register_product(naver_product_data)
+            naver_response = await _naver_client().register_product(naver_product_data)
 
             # Update registration with Naver product ID
-            registration.state = State.COMPLETED
             registration.naver_product_id = naver_response.get("originProductNo")
-            await db.commit()
+            await _set_state(db, registration, State.COMPLETED)
 
             return {
                 "product_id": product_id,
@@ -291,22 +718,30 @@ async def _register_product_async(product_id: str) -> Dict[str, Any]:
             }
 
         except Exception as e:
+            registration.error_message = str(e)
+            if _is_throttled(e):
+                # Throttled: retry soon without using up one of the product's retries
+                await _set_state(db, registration, State.RETRYING)
+                return {
+                    "product_id": product_id,
+                    "status": "retrying",
+                    "retry_in": settings.registration_throttle_retry_delay,
+                }
+
             # Increment retry count
             registration.retry_count += 1
-
             if registration.retry_count >= 3:
                 # Max retries reached, move to FAILED
-                registration.state = State.FAILED
-                registration.error_message = str(e)
-            else:
-                # Move to RETRYING
-                registration.state = State.RETRYING
-                registration.error_message = str(e)
-                # Re-queue task with exponential backoff
-                self.retry(countdown=60 * (2**registration.retry_count), max_retries=3)
+                await _set_state(db, registration, State.FAILED, type(e).__name__)
+                raise
 
-            await db.commit()
-            raise
+            # Move to RETRYING; the task re-queues itself with exponential backoff
+            await _set_state(db, registration, State.RETRYING)
+            return {
+                "product_id": product_id,
+                "status": "retrying",
+                "retry_in": 60 * (2**registration.retry_count),
+            }
 
 
 async def _mark_registration_failed(product_id: str, error_message: str) -> None:
@@ -318,16 +753,374 @@ async def _mark_registration_failed(product_id: str, error_message: str) -> None
         result = await db.execute(stmt)
         registration = result.scalar_one_or_none()
 
-        if registration:
+        if registration and registration.state != State.FAILED:
+            transition = Transition(registration.job_id, registration.state, State.FAILED)
             registration.state = State.FAILED
             registration.error_message = error_message
             await db.commit()
+            await _record_transitions([transition])
+
+
+@celery_app.task(bind=True, name="app.workers.tasks.register_products_batch_task")
+def register_products_batch_task(
+    self: Any, product_ids: List[str], priority: str = "normal"
+) -> Dict[str, Any]:
+    """
+    Register a group of products to Naver Smart Store.
+
+    Args:
+        product_ids: Product UUID strings
+        priority: Job priority (urgent, high, normal) for Naver rate limit slots
+
+    Returns:
+        Task result with per-status counts
+    """
+    logger.info(f"Starting batch registration: {len(product_ids)} products")
+
+    try:
+        result = get_runtime().run(_register_products_batch_async(product_ids, priority))
+        logger.info(f"Batch registration finished: {result}")
+        return result
+    except Exception as e:
+        logger.error(f"Batch registration failed: {e}", exc_info=True)
+        raise
+
+
+async def _register_products_batch_async(
+    product_ids: List[str], priority: str = "normal"
+) -> Dict[str, Any]:
+    """
+    Async implementation of batch registration.
+
+    Products and registrations are loaded with two queries, then flow one by
+    one through a pipeline of bounded queues, so the Naver sink registers a
+    product while the next ones are still being validated or having their
+    images uploaded:
+
+    1. prepare: validate and map options (CPU-bound, one worker)
+    2. images: move the product's images to the Naver CDN
+    3. register: registration_batch_concurrency calls waiting on the shared
+       Naver rate limiter
+
+    State changes from all stages are group-committed with bulk UPDATEs.
+    Failures are committed at the end, together with their staged retry.
+    """
+    ids = [uuid.UUID(product_id) for product_id in product_ids]
+
+    async with get_async_session() as db:
+        result = await db.execute(select(Product).where(Product.id.in_(ids)))
+        products = {product.id: product for product in result.scalars()}
+
+        registration_result = await db.execute(
+            select(ProductRegistration).where(ProductRegistration.product_id.in_(ids))
+        )
+        registrations = {reg.product_id: reg for reg in registration_result.scalars()}
+
+        pending: List[ProductRegistration] = []
+        for product_id in ids:
+            product = products.get(product_id)
+            registration = registrations.get(product_id)
+            if product is None or registration is None or registration.state not in (
+                State.PENDING,
+                State.VALIDATED,
+                State.RETRYING,
+            ):
+                # Missing rows or already handled (e.g. redelivered message)
+                continue
+            pending.append(registration)
+
+        await forbidden_words.reload(db)
+        validator = ProductValidator()
+        option_mapper = OptionMapper()
+        categories = await _resolve_categories(db, [products[reg.product_id] for reg in pending])
+        naver_client = _naver_client(priority)
+
+        counts = {"completed": 0, "manual_review": 0}
+        # (registration, state it failed in, error)
+        failures: List[Tuple[ProductRegistration, State, Exception]] = []
+        # Naver calls per job, drawn from the jobs' quota reservations
+        naver_calls: Dict[str, int] = {}
+
+        def count_naver_calls(registration: ProductRegistration, calls: int) -> None:
+            if registration.job_id is not None and calls:
+                job_id = str(registration.job_id)
+                naver_calls[job_id] = naver_calls.get(job_id, 0) + calls
+
+        async def write(changes: List[Tuple[Dict[str, Any], Transition]]) -> None:
+            await _write_registration_changes(db, changes)
+
+        async with BatchWriter(write) as writer:
+
+            async def prepare(
+                registration: ProductRegistration,
+            ) -> Optional[Tuple[ProductRegistration, Dict[str, Any]]]:
+                product = products[registration.product_id]
+                validation_result = validator.validate(_validation_payload(product))
+                category = categories.get(product.category or "")
+                errors = validation_result.errors + _category_errors(category)
+                if not errors:
+                    try:
+                        payload = _build_naver_product(
+                            product, registration, option_mapper, category
+                        )
+                        writer.add(
+                            (
+                                {"id": registration.id, "state": State.UPLOADING},
+                                Transition(
+                                    registration.job_id, registration.state, State.UPLOADING
+                                ),
+                            )
+                        )
+                        return registration, payload
+                    except ValueError as e:
+                        errors.append(str(e))
+
+                counts["manual_review"] += 1
+                writer.add(
+                    (
+                        {
+                            "id": registration.id,
+                            "state": State.MANUAL_REVIEW,
+                            "error_message": "; ".join(errors),
+                        },
+                        Transition(
+                            registration.job_id,
+                            registration.state,
+                            State.MANUAL_REVIEW,
+                            State.MANUAL_REVIEW.value,
+                        ),
+                    )
+                )
+                return None
+
+            async def upload(
+                item: Tuple[ProductRegistration, Dict[str, Any]],
+            ) -> Optional[Tuple[ProductRegistration, Dict[str, Any]]]:
+                registration, payload = item
+                product = products[registration.product_id]
+                try:
+                    # Own session: the writer commits on db concurrently
+                    async with get_async_session() as image_db:
+                        images = await _upload_images(image_db, [product], priority)
+                except NaverRateLimitError as e:
+                    # Throttled like a registration call: retried without using a retry
+                    failures.append((registration, State.UPLOADING, e))
+                    return None
+                if images is not None:
+                    count_naver_calls(registration, images.uploaded_count)
+                try:
+                    _set_naver_images(payload, product, images)
+                except ValueError as e:
+                    failures.append((registration, State.UPLOADING, e))
+                    return None
+
+                writer.add(
+                    (
+                        {"id": registration.id, "state": State.REGISTERING},
+                        Transition(registration.job_id, State.UPLOADING, State.REGISTERING),
+                    )
+                )
+                return item
+
+            async def register(item: Tuple[ProductRegistration, Dict[str, Any]]) -> None:
+                registration, payload = item
+                count_naver_calls(registration, 1)
+                try:
+                    response = await naver_client.register_product(payload)
+                except Exception as e:
+                    failures.append((registration, State.REGISTERING, e))
+                    return
+
+                counts["completed"] += 1
+                writer.add(
+                    (
+                        {
+                            "id": registration.id,
+                            "state": State.COMPLETED,
+                            "naver_product_id": response.get("originProductNo"),
+                            "error_message": None,
+                        },
+                        Transition(registration.job_id, State.REGISTERING, State.COMPLETED),
+                    )
+                )
+
+            await StagePipeline(
+                [
+                    Stage("prepare", prepare),
+                    Stage("images", upload, settings.registration_image_concurrency),
+                    Stage("register", register, settings.registration_batch_concurrency),
+                ]
+            ).run(pending)
+
+        changes: List[Tuple[Dict[str, Any], Transition]] = []
+        retry_ids: List[str] = []
+        throttled_ids: List[str] = []
+        max_retry_count = 0
+
+        for registration, from_state, error in failures:
+            if _is_throttled(error):
+                # Naver is shedding load, not rejecting the product: retry soon at
+                # the adapted rate without using up one of its retries
+                retry_count = registration.retry_count
+                state = State.RETRYING
+                throttled_ids.append(str(registration.product_id))
+            else:
+                retry_count = registration.retry_count + 1
+                state = State.FAILED if retry_count >= 3 else State.RETRYING
+                if state == State.RETRYING:
+                    retry_ids.append(str(registration.product_id))
+                    max_retry_count = max(max_retry_count, retry_count)
+            changes.append(
+                (
+                    {
+                        "id": registration.id,
+                        "state": state,
+                        "retry_count": retry_count,
+                        "error_message": str(error),
+                    },
+                    Transition(registration.job_id, from_state, state, type(error).__name__),
+                )
+            )
+
+        # Re-queue failures as one batch with exponential backoff, committed
+        # together with their RETRYING state
+        if retry_ids:
+            _stage_registrations(db, retry_ids, priority, countdown=60 * (2**max_retry_count))
+        if throttled_ids:
+            _stage_registrations(
+                db, throttled_ids, priority, countdown=settings.registration_throttle_retry_delay
+            )
+        if changes:
+            await _write_registration_changes(db, changes)
+        if retry_ids or throttled_ids:
+            await _relay_outbox(db)
+        await _quota().draw("naver", naver_calls)
+
+    return {
+        "requested": len(product_ids),
+        "completed": counts["completed"],
+        "manual_review": counts["manual_review"],
+        "retrying": len(retry_ids),
+        "throttled": len(throttled_ids),
+        "failed": len(failures) - len(retry_ids) - len(throttled_ids),
+        "skipped": len(product_ids) - len(pending),
+    }
+
+
+async def _write_registration_changes(
+    db: AsyncSession, changes: List[Tuple[Dict[str, Any], Transition]]
+) -> None:
+    """
+    Commit registration state changes with bulk UPDATEs and record the transitions.
+
+    Several changes to one registration collapse into one row whose later
+    values win, so a batch can hold a registration's whole progress.
+
+    Args:
+        db: Session
+        changes: (UPDATE row keyed by registration id, transition) in order
+    """
+    rows: Dict[uuid.UUID, Dict[str, Any]] = {}
+    for row, _ in changes:
+        rows.setdefault(row["id"], {}).update(row)
+
+    # executemany needs the same columns in every row
+    by_columns: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for row in rows.values():
+        by_columns.setdefault(tuple(sorted(row)), []).append(row)
+
+    bulk_update = update(ProductRegistration).execution_options(synchronize_session=False)
+    for group in by_columns.values():
+        await db.execute(bulk_update, group)
+    await db.commit()
+    await _record_transitions([transition for _, transition in changes])
+
+
+@celery_app.task(name="app.workers.tasks.recover_stale_registrations_task")
+def recover_stale_registrations_task() -> Dict[str, Any]:
+    """
+    Send registrations stuck in UPLOADING or REGISTERING back to registration.
+
+    A batch commits UPLOADING and REGISTERING before the work is done, so a
+    worker that crashes (or a batch whose final write fails) leaves its rows
+    in a state no batch selects. Scheduled every registration_recovery_interval
+    seconds by Celery beat.
+
+    Returns:
+        Numbers of registrations retried and failed
+    """
+    try:
+        return get_runtime().run(_recover_stale_registrations_async())
+    except Exception as e:
+        logger.error(f"Failed to recover stale registrations: {e}", exc_info=True)
+        raise
+
+
+async def _recover_stale_registrations_async() -> Dict[str, Any]:
+    """Async implementation of the stale registration recovery."""
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=settings.registration_stale_after)
+
+    async with get_async_session() as db:
+        result = await db.execute(
+            select(ProductRegistration)
+            .where(
+                ProductRegistration.state.in_([State.UPLOADING, State.REGISTERING]),
+                ProductRegistration.updated_at < stale_before,
+            )
+            .with_for_update(skip_locked=True)
+        )
+        registrations = list(result.scalars())
+        if not registrations:
+            return {"retrying": 0, "failed": 0}
+
+        job_ids = {reg.job_id for reg in registrations if reg.job_id is not None}
+        job_result = await db.execute(select(Job).where(Job.id.in_(job_ids)))
+        priorities: Dict[Optional[uuid.UUID], str] = {
+            job.id: job.config.get("priority", "normal") for job in job_result.scalars()
+        }
+
+        changes: List[Tuple[Dict[str, Any], Transition]] = []
+        # Product ids to retry per priority
+        retry_ids: Dict[str, List[str]] = {}
+        for registration in registrations:
+            # Counts as a failed attempt, so a product that keeps crashing its
+            # worker ends up FAILED
+            retry_count = registration.retry_count + 1
+            state = State.FAILED if retry_count >= 3 else State.RETRYING
+            if state == State.RETRYING:
+                priority = priorities.get(registration.job_id, "normal")
+                retry_ids.setdefault(priority, []).append(str(registration.product_id))
+            changes.append(
+                (
+                    {
+                        "id": registration.id,
+                        "state": state,
+                        "retry_count": retry_count,
+                        "error_message": f"Stuck in {registration.state.value}",
+                    },
+                    Transition(registration.job_id, registration.state, state, "StaleRegistration"),
+                )
+            )
+
+        for priority, product_ids in retry_ids.items():
+            _stage_registrations(db, product_ids, priority)
+        await _write_registration_changes(db, changes)
+        if retry_ids:
+            await _relay_outbox(db)
+
+    retrying = sum(len(product_ids) for product_ids in retry_ids.values())
+    logger.warning(f"Recovered {len(changes)} stale registrations ({retrying} retrying)")
+    return {"retrying": retrying, "failed": len(changes) - retrying}
 
 
 @celery_app.task(name="app.workers.tasks.update_job_status_task")
 def update_job_status_task(job_id: str) -> Dict[str, Any]:
     """
-    Update job status by checking all registrations.
+    Reconcile a job's counters with its registrations.
+
+    Progress is normally tracked by the Redis job counters; this recounts
+    from product_registrations (one GROUP BY) to repair counters that missed
+    an update, e.g. after a Redis outage.
 
     Args:
         job_id: Job UUID string
@@ -335,12 +1128,10 @@ def update_job_status_task(job_id: str) -> Dict[str, Any]:
     Returns:
         Updated job statistics
     """
-    import asyncio
-
     logger.info(f"Updating job status: {job_id}")
 
     try:
-        result = asyncio.run(_update_job_status_async(job_id))
+        result = get_runtime().run(_update_job_status_async(job_id))
         return result
     except Exception as e:
         logger.error(f"Failed to update job status {job_id}: {e}", exc_info=True)
@@ -348,7 +1139,7 @@ def update_job_status_task(job_id: str) -> Dict[str, Any]:
 
 
 async def _update_job_status_async(job_id: str) -> Dict[str, Any]:
-    """Async implementation of job status update."""
+    """Async implementation of job status reconciliation."""
     from sqlalchemy import func
 
     async with get_async_session() as db:
@@ -361,7 +1152,7 @@ async def _update_job_status_async(job_id: str) -> Dict[str, Any]:
             raise ValueError(f"Job not found: {job_id}")
 
         # Count registrations by state
-        stmt = (
+        count_result = await db.execute(
             select(
                 ProductRegistration.state,
                 func.count(ProductRegistration.id).label("count"),
@@ -369,35 +1160,114 @@ async def _update_job_status_async(job_id: str) -> Dict[str, Any]:
             .where(ProductRegistration.job_id == uuid.UUID(job_id))
             .group_by(ProductRegistration.state)
         )
-        result = await db.execute(stmt)
-        state_counts = {row.state: row.count for row in result}
-
-        # Calculate success/failed counts
-        success_count = state_counts.get(State.COMPLETED, 0)
-        failed_count = state_counts.get(State.FAILED, 0)
-        manual_review_count = state_counts.get(State.MANUAL_REVIEW, 0)
+        # Row.count is the tuple method, so unpack the rows instead
+        state_counts = {state.value: count for state, count in count_result.tuples()}
+        await _counters().reset(job_id, state_counts)
 
         # Update job
+        success_count, failed_count, pending_count = summarize(state_counts)
         job.success_count = success_count
-        job.failed_count = failed_count + manual_review_count
+        job.failed_count = failed_count
 
         # Check if all registrations are complete
-        pending_count = sum(
-            state_counts.get(state, 0)
-            for state in [State.PENDING, State.VALIDATED, State.UPLOADING, State.REGISTERING, State.RETRYING]
-        )
-
         if pending_count == 0:
             job.status = JobStatus.COMPLETED
             job.completed_at = datetime.now(timezone.utc)
 
         await db.commit()
+        if pending_count == 0:
+            await _events().status(job_id, JobStatus.COMPLETED)
+            await _quota().release(job_id)
 
         return {
             "job_id": job_id,
             "status": job.status.value,
             "success_count": success_count,
             "failed_count": failed_count,
-            "manual_review_count": manual_review_count,
-            "state_counts": {state.value: count for state, count in state_counts.items()},
+            "manual_review_count": state_counts.get(State.MANUAL_REVIEW.value, 0),
+            "state_counts": state_counts,
         }
+
+
+@celery_app.task(name="app.workers.tasks.flush_job_counters_task")
+def flush_job_counters_task() -> Dict[str, Any]:
+    """
+    Write the Redis job counters of recently updated jobs to the jobs table.
+
+    Scheduled every job_counters_flush_interval seconds by Celery beat.
+
+    Returns:
+        Number of jobs flushed
+    """
+    try:
+        return get_runtime().run(_flush_job_counters_async())
+    except Exception as e:
+        logger.error(f"Failed to flush job counters: {e}", exc_info=True)
+        raise
+
+
+async def _flush_job_counters_async() -> Dict[str, Any]:
+    """Async implementation of the job counter flush."""
+    counters = _counters()
+    job_ids = await counters.pop_dirty()
+    if not job_ids:
+        return {"flushed": 0}
+
+    try:
+        rows = []
+        drained = []
+        for job_id, state_counts in zip(job_ids, await counters.get_many(job_ids), strict=True):
+            success_count, failed_count, pending_count = summarize(state_counts)
+            rows.append(
+                {
+                    "id": uuid.UUID(job_id),
+                    "success_count": success_count,
+                    "failed_count": failed_count,
+                }
+            )
+            if pending_count == 0:
+                drained.append(uuid.UUID(job_id))
+
+        async with get_async_session() as db:
+            await db.execute(update(Job).execution_options(synchronize_session=False), rows)
+            await db.commit()
+
+            # Imports whose last registration just finished return their
+            # unused Naver reservation
+            if drained:
+                result = await db.execute(
+                    select(Job.id).where(Job.id.in_(drained), Job.status == JobStatus.COMPLETED)
+                )
+                for finished_id in result.scalars():
+                    await _quota().release(str(finished_id), ["naver"])
+    except Exception:
+        # Flush them next time
+        await counters.mark_dirty(job_ids)
+        raise
+
+    return {"flushed": len(rows)}
+
+
+@celery_app.task(name="app.workers.tasks.relay_outbox_task")
+def relay_outbox_task() -> Dict[str, Any]:
+    """
+    Publish Celery tasks left in the outbox.
+
+    Scheduled every outbox_relay_interval seconds by Celery beat. Producers
+    relay right after committing, so this mostly picks up tasks whose
+    producer died or could not reach the broker.
+
+    Returns:
+        Number of tasks published
+    """
+    try:
+        return get_runtime().run(_relay_outbox_async())
+    except Exception as e:
+        logger.error(f"Failed to relay outbox: {e}", exc_info=True)
+        raise
+
+
+async def _relay_outbox_async() -> Dict[str, Any]:
+    """Async implementation of the outbox relay."""
+    async with get_async_session() as db:
+        return {"published": await relay_outbox(db)}
@@ -0,0 +1 @@
+"""Load-test harness for the import/registration pipeline."""
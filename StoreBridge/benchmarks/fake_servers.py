@@ -0,0 +1,234 @@
+"""Local stand-ins for the Domeggook and Naver APIs."""
+
+import asyncio
+import itertools
+import random
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Tuple
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+
+# Limits of the real APIs
+DOMEGGOOK_MAX_RPM = 180
+NAVER_MAX_TPS = 2
+
+CATEGORIES = ["패션의류", "생활용품", "디지털/가전", "식품"]
+
+
+class SlidingWindow:
+    """Reject calls beyond `limit` within the trailing `window` seconds."""
+
+    def __init__(self, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self.calls: Deque[float] = deque()
+
+    def allow(self) -> bool:
+        now = time.monotonic()
+        while self.calls and now - self.calls[0] >= self.window:
+            self.calls.popleft()
+        if len(self.calls) >= self.limit:
+            return False
+        self.calls.append(now)
+        return True
+
+
+@dataclass
+class ServerStats:
+    """What a fake server saw, per endpoint."""
+
+    latencies: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    statuses: Dict[str, Dict[int, int]] = field(
+        default_factory=lambda: defaultdict(lambda: defaultdict(int))
+    )
+    started_at: float = field(default_factory=time.monotonic)
+
+    def record(self, endpoint: str, status: int, latency: float) -> None:
+        self.latencies[endpoint].append(latency)
+        self.statuses[endpoint][status] += 1
+
+    def count(self, status: int) -> int:
+        return sum(by_status.get(status, 0) for by_status in self.statuses.values())
+
+    def accepted(self, exclude: Tuple[str, ...] = ()) -> int:
+        """Calls that passed the rate limit (any status but 429)."""
+        return sum(
+            count
+            for endpoint, by_status in self.statuses.items()
+            if endpoint not in exclude
+            for status, count in by_status.items()
+            if status != 429
+        )
+
+
+@dataclass
+class FaultConfig:
+    """Latency and error injection for a fake server."""
+
+    latency: float = 0.1  # seconds, jittered by +-50%
+    throttle_rate: float = 0.0  # probability of an injected 429
+    error_rate: float = 0.0  # probability of an injected 500
+
+    async def delay(self) -> None:
+        if self.latency > 0:
+            await asyncio.sleep(self.latency * random.uniform(0.5, 1.5))
+
+    def injected_status(self) -> int:
+        roll = random.random()
+        if roll < self.throttle_rate:
+            return 429
+        if roll < self.throttle_rate + self.error_rate:
+            return 500
+        return 200
+
+
+def _instrument(app: FastAPI, stats: ServerStats) -> None:
+    """Record each response's status and service time under its route template."""
+
+    @app.middleware("http")
+    async def record(request: Request, call_next: Any) -> Response:
+        started = time.monotonic()
+        response = await call_next(request)
+        route = getattr(request.scope.get("route"), "path", request.url.path)
+        stats.record(route, response.status_code, time.monotonic() - started)
+        return response
+
+
+def create_domeggook_app(
+    item_count: int,
+    run_id: str,
+    image_base_url: str,
+    faults: FaultConfig,
+    max_rpm: int = DOMEGGOOK_MAX_RPM,
+) -> Tuple[FastAPI, ServerStats]:
+    """
+    Fake Domeggook OpenAPI serving a catalog of item_count generated items.
+
+    Item IDs carry run_id so every benchmark run imports new products.
+
+    Returns:
+        (app, stats)
+    """
+    app = FastAPI()
+    stats = ServerStats()
+    limiter = SlidingWindow(max_rpm, 60.0)
+    _instrument(app, stats)
+
+    def item(index: int) -> Dict[str, Any]:
+        return {
+            "item_id": f"BENCH-{run_id}-{index}",
+            "item_name": f"벤치마크 면 티셔츠 {index}",
+            "price": 10000 + (index % 50) * 100,
+            "category": CATEGORIES[index % len(CATEGORIES)],
+            "images": [f"{image_base_url}/images/{index % 64}.jpg"],
+            "description": "벤치마크용 상품 설명입니다.",
+            "options": ["블랙-S", "블랙-M", "화이트-S", "화이트-M"],
+            "stock_quantity": 100,
+        }
+
+    async def guarded(payload: Any) -> Response:
+        if not limiter.allow():
+            return JSONResponse({"error": "rate limit exceeded"}, status_code=429)
+        await faults.delay()
+        status = faults.injected_status()
+        if status != 200:
+            return JSONResponse({"error": "injected"}, status_code=status)
+        return JSONResponse(payload() if callable(payload) else payload)
+
+    @app.get("/getItemList")
+    async def get_item_list(page: int = 1, page_size: int = 100) -> Response:
+        start = (page - 1) * page_size
+        indexes = range(start, min(start + page_size, item_count))
+        return await guarded(
+            lambda: {"total_count": item_count, "items": [item(i) for i in indexes]}
+        )
+
+    @app.get("/getItemView")
+    async def get_item_view(item_id: str) -> Response:
+        return await guarded(lambda: {"item": item(int(item_id.rsplit("-", 1)[-1]))})
+
+    @app.get("/getCategoryList")
+    async def get_category_list() -> Response:
+        categories = [{"id": str(i), "name": name} for i, name in enumerate(CATEGORIES)]
+        return await guarded({"categories": categories})
+
+    @app.get("/images/{name}")
+    async def image(name: str) -> Response:
+        # Image CDN, not the OpenAPI: no rate limit; distinct bytes per name
+        body = b"\xff\xd8\xff\xe0" + name.encode() + bytes(2048) + b"\xff\xd9"
+        return Response(body, media_type="image/jpeg")
+
+    return app, stats
+
+
+def create_naver_app(
+    faults: FaultConfig, max_tps: int = NAVER_MAX_TPS
+) -> Tuple[FastAPI, ServerStats]:
+    """
+    Fake Naver Commerce API enforcing max_tps across all endpoints but OAuth.
+
+    Returns:
+        (app, stats)
+    """
+    app = FastAPI()
+    stats = ServerStats()
+    limiter = SlidingWindow(max_tps, 1.0)
+    product_numbers = itertools.count(10_000_000)
+
+    _instrument(app, stats)
+
+    async def guarded(payload: Any) -> Response:
+        if not limiter.allow():
+            return JSONResponse({"code": "GW.RATE_LIMIT"}, status_code=429)
+        await faults.delay()
+        status = faults.injected_status()
+        if status != 200:
+            return JSONResponse({"code": "INJECTED"}, status_code=status)
+        return JSONResponse(payload() if callable(payload) else payload)
+
+    @app.post("/oauth2.0/token")
+    async def token() -> Response:
+        return JSONResponse({"access_token": "bench-token", "expires_in": 10800})
+
+    @app.post("/v2/products")
+    async def register_product() -> Response:
+        return await guarded(lambda: {"originProductNo": next(product_numbers)})
+
+    @app.get("/v2/products/{product_id}")
+    async def get_product(product_id: str) -> Response:
+        return await guarded({"originProductNo": product_id})
+
+    @app.put("/v2/products/{product_id}")
+    async def update_product(product_id: str) -> Response:
+        return await guarded({"originProductNo": product_id})
+
+    @app.delete("/v2/products/{product_id}")
+    async def delete_product(product_id: str) -> Response:
+        return await guarded({})
+
+    @app.get("/v1/categories/{category_id}/attributes")
+    async def category_attributes(category_id: str) -> Response:
+        return await guarded({"requiredAttributes": []})
+
+    @app.post("/v1/product-images/upload")
+    async def upload_image() -> Response:
+        return await guarded(
+            lambda: {"imageUrl": f"https://shop-phinf.example.com/{next(product_numbers)}.jpg"}
+        )
+
+    return app, stats
+
+
+async def serve(app: FastAPI, port: int) -> uvicorn.Server:
+    """Start app on localhost:port in the running event loop."""
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="off")
+    )
+    asyncio.get_running_loop().create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+    return server
@@ -0,0 +1,342 @@
+"""
+Drive a full IMPORT job against local Domeggook/Naver stand-ins and report
+sustained throughput.
+
+Needs the Redis and Postgres from docker-compose.yml (tables created with
+create_tables.py). Starts the fake APIs in-process and Celery (worker, beat
+and optionally the Naver dispatcher) as subprocesses pointed at them, creates
+the job through the API app and waits until every product has finished
+registering.
+
+    python -m benchmarks.run_import --products 500 --naver-throttle-rate 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from benchmarks.fake_servers import (
+    DOMEGGOOK_MAX_RPM,
+    NAVER_MAX_TPS,
+    FaultConfig,
+    ServerStats,
+    create_domeggook_app,
+    create_naver_app,
+    serve,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+WORKER_QUEUES = "import,register.urgent,register.high,register,default"
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--products", type=int, default=200, help="Products to import")
+    parser.add_argument("--priority", default="normal", choices=["normal", "high", "urgent"])
+    parser.add_argument("--concurrency", type=int, default=4, help="Celery worker processes")
+    parser.add_argument("--dispatcher", action="store_true", help="Run the Naver dispatcher")
+    parser.add_argument("--no-images", action="store_true", help="Disable the image pipeline")
+    parser.add_argument("--domeggook-port", type=int, default=18081)
+    parser.add_argument("--naver-port", type=int, default=18082)
+    parser.add_argument("--metrics-port", type=int, default=19090)
+    parser.add_argument("--domeggook-latency", type=float, default=0.2, help="Seconds")
+    parser.add_argument("--naver-latency", type=float, default=0.3, help="Seconds")
+    parser.add_argument("--naver-throttle-rate", type=float, default=0.0, help="Injected 429s")
+    parser.add_argument("--naver-error-rate", type=float, default=0.0, help="Injected 500s")
+    parser.add_argument("--timeout", type=float, default=3600.0, help="Seconds to wait")
+    parser.add_argument("--json", dest="json_path", help="Also write the report to this file")
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get(
+            "DATABASE_URL", "postgresql+asyncpg://storebridge@localhost:5432/storebridge"
+        ),
+    )
+    parser.add_argument(
+        "--redis-url", default=os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+    )
+    return parser.parse_args(argv)
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile (q in 0..100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def histogram_quantile(buckets: List[Tuple[float, float]], q: float) -> Optional[float]:
+    """Quantile from cumulative (upper_bound, count) buckets, as PromQL computes it."""
+    if not buckets or buckets[-1][1] == 0:
+        return None
+    rank = q / 100 * buckets[-1][1]
+    lower, below = 0.0, 0.0
+    for upper, count in buckets:
+        if count >= rank:
+            if math.isinf(upper):
+                return lower
+            return lower + (upper - lower) * (rank - below) / max(count - below, 1e-9)
+        lower, below = upper, count
+    return None
+
+
+def scrape_latencies(metrics_url: str) -> Dict[str, Dict[str, Optional[float]]]:
+    """p50/p99 per external endpoint and for DB commits from the worker's /metrics."""
+    from prometheus_client.parser import text_string_to_metric_families
+
+    try:
+        text = httpx.get(metrics_url, timeout=5.0).text
+    except httpx.HTTPError:
+        return {}
+
+    series: Dict[str, Dict[float, float]] = {}
+    for family in text_string_to_metric_families(text):
+        for sample in family.samples:
+            if not sample.name.endswith("_bucket"):
+                continue
+            if sample.name.startswith("storebridge_external_call_duration_seconds"):
+                labels = sample.labels
+                stage = f"{labels['service']} {labels['method']} {labels['endpoint']}"
+            elif sample.name.startswith("storebridge_db_commit_duration_seconds"):
+                stage = "db commit"
+            else:
+                continue
+            # Merge outcomes (and processes) of the same stage
+            series.setdefault(stage, {})
+            bound = float(sample.labels["le"])
+            series[stage][bound] = series[stage].get(bound, 0) + sample.value
+
+    return {
+        stage: {
+            "p50": histogram_quantile(sorted(by_bound.items()), 50),
+            "p99": histogram_quantile(sorted(by_bound.items()), 99),
+        }
+        for stage, by_bound in series.items()
+    }
+
+
+def worker_env(args: argparse.Namespace, metrics_dir: str) -> Dict[str, str]:
+    """Environment pointing StoreBridge at the fake APIs and local stores."""
+    return {
+        **os.environ,
+        "DATABASE_URL": args.database_url,
+        "REDIS_URL": args.redis_url,
+        "CELERY_BROKER_URL": args.redis_url,
+        "CELERY_RESULT_BACKEND": args.redis_url,
+        "DOMEGGOOK_API_URL": f"http://127.0.0.1:{args.domeggook_port}",
+        "NAVER_API_URL": f"http://127.0.0.1:{args.naver_port}",
+        "NAVER_MAX_TPS": str(NAVER_MAX_TPS),
+        "DOMEGGOOK_MAX_RPM": str(DOMEGGOOK_MAX_RPM),
+        "NAVER_DISPATCHER_ENABLED": "true" if args.dispatcher else "false",
+        "IMAGE_PIPELINE_ENABLED": "false" if args.no_images else "true",
+        "PROMETHEUS_PORT": str(args.metrics_port),
+        "PROMETHEUS_MULTIPROC_DIR": metrics_dir,
+    }
+
+
+def start_processes(args: argparse.Namespace, env: Dict[str, str]) -> List[subprocess.Popen]:
+    """Start the Celery worker, beat and (optionally) the Naver dispatcher."""
+    celery = [sys.executable, "-m", "celery", "-A", "app.workers.celery_app"]
+    schedule = os.path.join(tempfile.mkdtemp(prefix="storebridge-beat-"), "schedule")
+    commands = [
+        [
+            *celery,
+            "worker",
+            "--loglevel=warning",
+            f"--concurrency={args.concurrency}",
+            "-Q",
+            WORKER_QUEUES,
+        ],
+        [*celery, "beat", "--loglevel=warning", "--schedule", schedule],
+    ]
+    if args.dispatcher:
+        commands.append([sys.executable, "-m", "app.services.naver_dispatcher"])
+    return [subprocess.Popen(command, cwd=ROOT, env=env) for command in commands]
+
+
+async def stage_latencies(job_id: str) -> Dict[str, Dict[str, Optional[float]]]:
+    """p50/p99 of per-product stages from database timestamps."""
+    from sqlalchemy import select
+
+    from app.database import get_session_factory
+    from app.models import Job, Product, ProductRegistration, State
+
+    async with get_session_factory()() as db:
+        job = await db.get(Job, uuid.UUID(job_id))
+        rows = (
+            await db.execute(
+                select(Product.created_at, ProductRegistration.updated_at)
+                .join(ProductRegistration, ProductRegistration.product_id == Product.id)
+                .where(
+                    ProductRegistration.job_id == job.id,
+                    ProductRegistration.state == State.COMPLETED,
+                )
+            )
+        ).all()
+
+    stages = {
+        "import (job created -> product stored)": [
+            (created - job.created_at).total_seconds() for created, _ in rows
+        ],
+        "registration (product stored -> registered)": [
+            (registered - created).total_seconds() for created, registered in rows
+        ],
+        "end to end (job created -> registered)": [
+            (registered - job.created_at).total_seconds() for _, registered in rows
+        ],
+    }
+    return {
+        stage: {"p50": percentile(values, 50), "p99": percentile(values, 99)}
+        for stage, values in stages.items()
+    }
+
+
+async def wait_for_job(client: httpx.AsyncClient, job_id: str, timeout: float) -> Dict[str, Any]:
+    """Poll the job until crawling is done and every registration finished."""
+    deadline = time.monotonic() + timeout
+    while True:
+        job = (await client.get(f"/v1/jobs/{job_id}")).json()["data"]
+        stats = job["statistics"]
+        done = stats["success_count"] + stats["failed_count"]
+        if job["status"] in ("FAILED", "CANCELLED"):
+            return job
+        if job["status"] == "COMPLETED" and done >= stats["total_count"]:
+            return job
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Job {job_id} not finished after {timeout}s: {stats}")
+        print(f"  {job['status']}: {done}/{stats['total_count']}", flush=True)
+        await asyncio.sleep(2.0)
+
+
+def utilization(
+    stats: ServerStats, per_second: float, elapsed: float, exclude: Tuple[str, ...] = ()
+) -> float:
+    """Share of the API's rate limit the run actually used."""
+    return round(stats.accepted(exclude) / (per_second * elapsed), 3) if elapsed > 0 else 0.0
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run one benchmark and return its report."""
+    metrics_dir = tempfile.mkdtemp(prefix="storebridge-bench-")
+    env = worker_env(args, metrics_dir)
+    # The API app reads settings at import time
+    os.environ.update({k: v for k, v in env.items() if k != "PROMETHEUS_MULTIPROC_DIR"})
+    from app.main import app
+
+    run_id = uuid.uuid4().hex[:8]
+    domeggook_url = f"http://127.0.0.1:{args.domeggook_port}"
+    domeggook, domeggook_stats = create_domeggook_app(
+        args.products, run_id, domeggook_url, FaultConfig(latency=args.domeggook_latency)
+    )
+    naver, naver_stats = create_naver_app(
+        FaultConfig(
+            latency=args.naver_latency,
+            throttle_rate=args.naver_throttle_rate,
+            error_rate=args.naver_error_rate,
+        )
+    )
+    servers = [await serve(domeggook, args.domeggook_port), await serve(naver, args.naver_port)]
+    processes = start_processes(args, env)
+
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://api") as client:
+            started = time.monotonic()
+            response = await client.post(
+                "/v1/jobs",
+                json={
+                    "type": "IMPORT",
+                    "config": {
+                        "source": "domeggook",
+                        "limit": args.products,
+                        "auto_register": True,
+                        "priority": args.priority,
+                    },
+                },
+            )
+            response.raise_for_status()
+            job_id = response.json()["data"]["job_id"]
+            print(f"Job {job_id}: importing {args.products} products (run {run_id})")
+
+            job = await wait_for_job(client, job_id, args.timeout)
+            elapsed = time.monotonic() - started
+
+        stats = job["statistics"]
+        report = {
+            "products": args.products,
+            "job_status": job["status"],
+            "registered": stats["success_count"],
+            "failed": stats["failed_count"],
+            "elapsed_seconds": round(elapsed, 1),
+            "products_per_minute": round(stats["success_count"] / elapsed * 60, 1),
+            "rate_limit_utilization": {
+                "naver": utilization(
+                    naver_stats, NAVER_MAX_TPS, elapsed, exclude=("/oauth2.0/token",)
+                ),
+                "domeggook": utilization(
+                    domeggook_stats, DOMEGGOOK_MAX_RPM / 60, elapsed, exclude=("/images/{name}",)
+                ),
+            },
+            "naver_429s": naver_stats.count(429),
+            "domeggook_429s": domeggook_stats.count(429),
+            "stage_latency_seconds": await stage_latencies(job_id),
+            "call_latency_seconds": scrape_latencies(
+                f"http://127.0.0.1:{args.metrics_port}/metrics"
+            ),
+        }
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait(timeout=30)
+        for server in servers:
+            server.should_exit = True
+
+    return report
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Print a report as text."""
+
+    def fmt(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.3f}s"
+
+    print()
+    print(
+        f"Registered {report['registered']}/{report['products']} products "
+        f"({report['failed']} failed) in {report['elapsed_seconds']}s"
+    )
+    print(f"Throughput: {report['products_per_minute']} products/minute")
+    utilization = report["rate_limit_utilization"]
+    print(
+        f"Rate limit utilization: Naver {utilization['naver']:.0%} "
+        f"({report['naver_429s']} x 429), Domeggook {utilization['domeggook']:.0%} "
+        f"({report['domeggook_429s']} x 429)"
+    )
+    for title, key in (("Stage", "stage_latency_seconds"), ("Call", "call_latency_seconds")):
+        print(f"\n{title:<48} {'p50':>9} {'p99':>9}")
+        for stage, quantiles in sorted(report[key].items()):
+            print(f"{stage:<48} {fmt(quantiles['p50']):>9} {fmt(quantiles['p99']):>9}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    report = asyncio.run(run(args))
+    print_report(report)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
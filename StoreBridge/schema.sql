@@ -33,7 +33,8 @@ CREATE TABLE IF NOT EXISTS jobs (
 
 CREATE INDEX IF NOT EXISTS idx_jobs_type ON jobs(type);
 CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
-CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs(created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_created_at_id ON jobs(created_at, id)
+    INCLUDE (type, status, total_count, success_count, failed_count);
 
 CREATE TABLE IF NOT EXISTS product_registrations (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -70,3 +71,34 @@ CREATE TABLE IF NOT EXISTS category_mappings (
 
 CREATE INDEX IF NOT EXISTS idx_category_mappings_domeggook ON category_mappings(domeggook_category);
 CREATE INDEX IF NOT EXISTS idx_category_mappings_active ON category_mappings(is_active, domeggook_category);
+
+CREATE TABLE IF NOT EXISTS image_assets (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    source_url TEXT UNIQUE NOT NULL,
+    content_hash VARCHAR(64) NOT NULL,
+    naver_url TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_image_assets_content_hash ON image_assets(content_hash);
+
+CREATE TABLE IF NOT EXISTS forbidden_words (
+    id SERIAL PRIMARY KEY,
+    word VARCHAR(200) UNIQUE NOT NULL,
+    reason VARCHAR(200),
+    is_active BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Celery tasks staged in the same transaction as the state change (relayed by beat)
+CREATE TABLE IF NOT EXISTS task_outbox (
+    id BIGSERIAL PRIMARY KEY,
+    task_name VARCHAR(200) NOT NULL,
+    args JSONB NOT NULL DEFAULT '[]',
+    queue VARCHAR(100),
+    countdown INTEGER,
+    available_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
@@ -1,5 +1,6 @@
 """Simple E2E tests for core functionality (without Celery/DB)."""
 
+import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -40,8 +41,11 @@ class TestSimpleProductFlow:
         }
 
         mock_domeggook_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"item": domeggook_product}
+        mock_response = httpx.Response(
+            200,
+            json={"item": domeggook_product},
+            request=httpx.Request("GET", "https://openapi.domeggook.com/getItemView"),
+        )
         mock_domeggook_client.get.return_value = mock_response
 
         client = DomeggookClient(api_key="test_key")
@@ -6,6 +6,12 @@ import httpx
 
 from app.connectors.domeggook_client import DomeggookClient
 
+REQUEST = httpx.Request("GET", "https://openapi.domeggook.com")
+
+
+def json_response(payload):
+    return httpx.Response(200, json=payload, request=REQUEST)
+
 
 class TestDomeggookClientIntegration:
     """Integration tests for DomeggookClient with mocked HTTP responses."""
@@ -15,19 +21,20 @@ class TestDomeggookClientIntegration:
         """상품 리스트 가져오기 성공."""
         # Create mock client
         mock_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "total_count": 100,
-            "items": [
-                {
-                    "item_id": "DG-001",
-                    "item_name": "테스트 상품",
-                    "price": 10000,
-                    "category": "패션의류",
-                    "image_url": "https://example.com/image.jpg",
-                }
-            ],
-        }
+        mock_response = json_response(
+            {
+                "total_count": 100,
+                "items": [
+                    {
+                        "item_id": "DG-001",
+                        "item_name": "테스트 상품",
+                        "price": 10000,
+                        "category": "패션의류",
+                        "image_url": "https://example.com/image.jpg",
+                    }
+                ],
+            }
+        )
         mock_client.get.return_value = mock_response
 
         client = DomeggookClient(api_key="test_key")
@@ -44,16 +51,17 @@ class TestDomeggookClientIntegration:
     async def test_get_item_view_success(self):
         """상품 상세 정보 조회 성공."""
         mock_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "item": {
-                "item_id": "DG-001",
-                "item_name": "테스트 상품",
-                "price": 10000,
-                "images": ["https://example.com/1.jpg"],
-                "options": ["블랙-S", "블랙-M"],
+        mock_response = json_response(
+            {
+                "item": {
+                    "item_id": "DG-001",
+                    "item_name": "테스트 상품",
+                    "price": 10000,
+                    "images": ["https://example.com/1.jpg"],
+                    "options": ["블랙-S", "블랙-M"],
+                }
             }
-        }
+        )
         mock_client.get.return_value = mock_response
 
         client = DomeggookClient(api_key="test_key")
@@ -90,10 +98,7 @@ class TestDomeggookClientIntegration:
         euc_kr_data = '{"item": {"item_name": "한글상품"}}'.encode("euc-kr")
 
         mock_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.json.side_effect = Exception("UTF-8 decode failed")
-        mock_response.content = euc_kr_data
-        mock_client.get.return_value = mock_response
+        mock_client.get.return_value = httpx.Response(200, content=euc_kr_data, request=REQUEST)
 
         client = DomeggookClient(api_key="test_key")
         client._client = mock_client
@@ -103,6 +108,53 @@ class TestDomeggookClientIntegration:
         assert result["success"] is True
         assert result["item"]["item_name"] == "한글상품"
 
+    def test_charset_is_sniffed_once_per_client(self, monkeypatch):
+        """charset이 없는 응답은 첫 응답에서 한 번만 판별."""
+        client = DomeggookClient(api_key="test_key")
+        body = '{"items": [{"item_name": "한글상품"}]}'.encode("euc-kr")
+        sniff = MagicMock(wraps=DomeggookClient._sniff_charset)
+        monkeypatch.setattr(DomeggookClient, "_sniff_charset", sniff)
+
+        for _ in range(3):
+            data = client._decode_response(httpx.Response(200, content=body, request=REQUEST))
+
+        assert data["items"][0]["item_name"] == "한글상품"
+        assert sniff.call_count == 1
+
+    def test_declared_charset_wins(self):
+        """Content-Type에 charset이 있으면 그대로 사용."""
+        client = DomeggookClient(api_key="test_key")
+        response = httpx.Response(
+            200,
+            content='{"item": {"item_name": "한글상품"}}'.encode("euc-kr"),
+            headers={"Content-Type": "application/json; charset=EUC-KR"},
+            request=REQUEST,
+        )
+
+        assert client._decode_response(response)["item"]["item_name"] == "한글상품"
+        assert client._charset is None
+
+    def test_charset_switch_is_detected(self):
+        """서버 인코딩이 바뀌면 다시 판별."""
+        client = DomeggookClient(api_key="test_key")
+        utf8 = '{"item": {"item_name": "상품"}}'.encode()
+        euc_kr = '{"item": {"item_name": "한글상품"}}'.encode("euc-kr")
+
+        client._decode_response(httpx.Response(200, content=utf8, request=REQUEST))
+        data = client._decode_response(httpx.Response(200, content=euc_kr, request=REQUEST))
+
+        assert data["item"]["item_name"] == "한글상품"
+        assert client._charset == "cp949"
+
+    def test_stdlib_json_without_orjson(self, monkeypatch):
+        """orjson이 없으면 표준 json으로 파싱."""
+        monkeypatch.setattr("app.connectors.domeggook_client.orjson", None)
+        client = DomeggookClient(api_key="test_key")
+
+        data = client._decode_response(json_response({"item": {"item_name": "상품"}}))
+
+        assert data["item"]["item_name"] == "상품"
+
     @pytest.mark.asyncio
     async def test_context_manager_closes_client(self):
         """Context manager가 client를 올바르게 종료."""
@@ -0,0 +1,158 @@
+"""ProductCopyWriter integration tests against a real PostgreSQL.
+
+Set TEST_DATABASE_URL (default: DATABASE_URL) to a database the tests may
+create schemas in; they are skipped when it cannot be reached.
+"""
+
+import os
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.config import settings
+from app.models import Base, Product, ProductRegistration, State
+from app.services.product_writer import ProductBulkWriter, ProductCopyWriter
+
+DATABASE_URL = os.environ.get("TEST_DATABASE_URL", settings.database_url).replace(
+    "postgresql://", "postgresql+asyncpg://", 1
+)
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """Sessions on a throwaway schema holding the app's tables."""
+    schema = f"test_{uuid.uuid4().hex[:12]}"
+    engine = create_async_engine(
+        DATABASE_URL,
+        poolclass=NullPool,
+        connect_args={"timeout": 5, "server_settings": {"search_path": f"{schema},public"}},
+    )
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            await conn.execute(text(f"CREATE SCHEMA {schema}"))
+    except Exception as e:
+        await engine.dispose()
+        pytest.skip(f"PostgreSQL not available: {e}")
+
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await engine.dispose()
+
+
+def items(count, start=0):
+    return [
+        {
+            "item_id": f"DG-{i}",
+            "item_name": f"상품 {i}",
+            "price": 1000 + i,
+            "category": "의류",
+            "images": [f"https://example.com/{i}.jpg"],
+            "options": ["S", "M"],
+        }
+        for i in range(start, start + count)
+    ]
+
+
+async def registrations(db):
+    result = await db.execute(
+        select(ProductRegistration).order_by(ProductRegistration.seller_product_code)
+    )
+    return list(result.scalars())
+
+
+@pytest.mark.integration
+class TestProductCopyWriterPostgres:
+    """Run COPY + merge on PostgreSQL."""
+
+    @pytest.mark.asyncio
+    async def test_copy_and_merge_matches_upserts(self, session_factory):
+        """COPY 병합 결과가 upsert 경로와 같은 products/등록 행을 만듦."""
+        job_id = uuid.uuid4()
+        staged = []
+        async with session_factory() as db:
+            writer = ProductCopyWriter(
+                db, job_id=job_id, on_pending=lambda session, ids: staged.extend(ids)
+            )
+            result = await writer.write(items(3))
+
+            assert result.success_count == 3
+            assert result.registration_states == {"PENDING": 3}
+            product = (
+                await db.execute(select(Product).where(Product.domeggook_item_id == "DG-1"))
+            ).scalar_one()
+            assert (product.name, product.price, product.images) == (
+                "상품 1",
+                1001,
+                ["https://example.com/1.jpg"],
+            )
+            assert product.options == {"raw": ["S", "M"]}
+            assert product.raw_data["item_name"] == "상품 1"
+            rows = await registrations(db)
+            assert [r.seller_product_code for r in rows] == ["DG-DG-0", "DG-DG-1", "DG-DG-2"]
+            assert {(r.job_id, r.state, r.retry_count) for r in rows} == {
+                (job_id, State.PENDING, 0)
+            }
+            assert sorted(staged) == sorted(r.product_id for r in rows)
+
+            # The staging table was dropped with the chunk's transaction
+            assert (
+                await db.execute(text("SELECT to_regclass('product_ingest_staging')"))
+            ).scalar() is None
+
+    @pytest.mark.asyncio
+    async def test_reimport_resets_failed_and_keeps_completed(self, session_factory):
+        """재가져오기: FAILED는 새 작업의 PENDING으로, COMPLETED는 기존 작업 소유로 유지."""
+        old_job, new_job = uuid.uuid4(), uuid.uuid4()
+        async with session_factory() as db:
+            await ProductBulkWriter(db, job_id=old_job).write(items(2))
+            for code, state in (("DG-DG-0", State.FAILED), ("DG-DG-1", State.COMPLETED)):
+                await db.execute(
+                    update(ProductRegistration)
+                    .where(ProductRegistration.seller_product_code == code)
+                    .values(state=state, retry_count=3)
+                )
+            await db.commit()
+
+            updated = [{**item, "price": 5000} for item in items(2)]
+            result = await ProductCopyWriter(db, job_id=new_job).write(updated)
+
+            assert result.success_count == 2
+            assert result.registration_states == {"PENDING": 1}
+            failed, completed = await registrations(db)
+            assert (failed.job_id, failed.state, failed.retry_count) == (
+                new_job,
+                State.PENDING,
+                0,
+            )
+            assert (completed.job_id, completed.state, completed.retry_count) == (
+                old_job,
+                State.COMPLETED,
+                3,
+            )
+            prices = (await db.execute(select(Product.price))).scalars().all()
+            assert set(prices) == {5000}
+
+    @pytest.mark.asyncio
+    async def test_failed_copy_falls_back_to_upserts(self, session_factory):
+        """COPY가 거부한 chunk는 롤백 후 upsert로 재기록되어 불량 행만 실패."""
+        rows = items(4)
+        rows[2]["item_name"] = "x" * 501
+        async with session_factory() as db:
+            result = await ProductCopyWriter(db, job_id=uuid.uuid4(), upsert_chunk_size=2).write(
+                rows
+            )
+
+            assert result.success_count == 3
+            assert result.failed_count == 1
+            codes = [r.seller_product_code for r in await registrations(db)]
+            assert codes == ["DG-DG-0", "DG-DG-1", "DG-DG-3"]
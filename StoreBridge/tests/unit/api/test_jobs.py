@@ -0,0 +1,143 @@
+"""Job API unit tests."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.api import jobs
+from app.models import JobStatus, JobType
+from app.services.quota_ledger import QuotaLedger, QuotaStatus
+
+
+def job_row(created_at):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        type=JobType.IMPORT,
+        status=JobStatus.COMPLETED,
+        total_count=10,
+        success_count=9,
+        failed_count=1,
+        created_at=created_at,
+    )
+
+
+class FakeSession:
+    """AsyncSession stand-in returning projected rows."""
+
+    def __init__(self, rows, estimate=None):
+        self.rows = rows
+        self.estimate = estimate
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        if "pg_class" in str(stmt):
+            return SimpleNamespace(scalar=lambda: self.estimate)
+        limit = stmt._limit_clause.value
+        return SimpleNamespace(all=lambda: self.rows[:limit])
+
+
+async def list_jobs(db, **params):
+    defaults = {"type": None, "status": None, "cursor": None, "page_size": 2}
+    defaults["include_total"] = False
+    return (await jobs.list_jobs(**{**defaults, **params}, db=db))["data"]
+
+
+@pytest.mark.unit
+class TestListJobs:
+    """Test keyset pagination."""
+
+    def test_cursor_round_trip(self):
+        """커서 인코딩/디코딩 왕복."""
+        created_at = datetime(2025, 10, 16, 10, 0, tzinfo=timezone.utc)
+        job_id = uuid.uuid4()
+
+        assert jobs.decode_cursor(jobs.encode_cursor(created_at, job_id)) == (created_at, job_id)
+
+    def test_invalid_cursor_is_rejected(self):
+        """잘못된 커서는 400."""
+        with pytest.raises(HTTPException) as exc_info:
+            jobs.decode_cursor("not-a-cursor")
+
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_page_has_next_cursor_from_last_row(self):
+        """page_size + 1행으로 다음 페이지 여부 판단, 마지막 행이 커서."""
+        now = datetime.now(timezone.utc)
+        rows = [job_row(now - timedelta(minutes=i)) for i in range(3)]
+        db = FakeSession(rows)
+
+        data = await list_jobs(db)
+
+        assert [item["job_id"] for item in data["items"]] == [str(r.id) for r in rows[:2]]
+        assert data["pagination"]["has_more"] is True
+        assert jobs.decode_cursor(data["pagination"]["next_cursor"]) == (
+            rows[1].created_at,
+            rows[1].id,
+        )
+
+    @pytest.mark.asyncio
+    async def test_cursor_uses_keyset_without_offset_or_count(self):
+        """OFFSET/COUNT 없이 (created_at, id) 비교로 조회, JSONB 컬럼 미조회."""
+        db = FakeSession([])
+        cursor = jobs.encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+
+        data = await list_jobs(db, cursor=cursor)
+
+        sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+        assert "(jobs.created_at, jobs.id) < (" in sql
+        assert "OFFSET" not in sql and "count(" not in sql
+        assert "config" not in sql and "error_summary" not in sql
+        assert data["pagination"] == {"page_size": 2, "next_cursor": None, "has_more": False}
+
+    @pytest.mark.asyncio
+    async def test_total_estimate_from_statistics(self):
+        """include_total이면 테이블 통계로 대략적인 전체 건수."""
+        db = FakeSession([], estimate=-1)
+
+        data = await list_jobs(db, include_total=True)
+
+        assert data["pagination"]["total_estimate"] is None
+
+
+@pytest.mark.unit
+class TestQuotaAdmission:
+    """Test admitting jobs against the daily quota."""
+
+    @pytest.mark.asyncio
+    async def test_job_over_todays_quota_is_scheduled_for_tomorrow(self, redis_mock):
+        """오늘 할당량이 부족하면 다음 일자 시작 시각으로 예약."""
+        ledger = QuotaLedger(redis_client=redis_mock)
+        redis_mock.evalsha.side_effect = [2, 0]
+
+        not_before = await jobs._admit(ledger, "job-1", {"domeggook": 1, "naver": 500})
+
+        assert not_before == ledger.window_start(ledger.next_window(ledger.window()))
+
+    @pytest.mark.asyncio
+    async def test_job_over_both_windows_is_rejected(self, redis_mock):
+        """오늘과 내일 모두 부족하면 429."""
+        ledger = QuotaLedger(redis_client=redis_mock)
+        redis_mock.evalsha.side_effect = [2, 2]
+        ledger.status = AsyncMock(return_value={"naver": QuotaStatus(1000, 900, 50)})
+
+        with pytest.raises(HTTPException) as exc_info:
+            await jobs._admit(ledger, "job-1", {"domeggook": 1, "naver": 500})
+
+        assert exc_info.value.status_code == 429
+        assert "500 naver calls" in exc_info.value.detail
+        assert "only 50 of 1000" in exc_info.value.detail
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_admits_job(self, redis_mock):
+        """Redis 오류 시 할당량 확인 없이 즉시 실행."""
+        ledger = QuotaLedger(redis_client=redis_mock)
+        redis_mock.evalsha.side_effect = ConnectionError("down")
+
+        assert await jobs._admit(ledger, "job-1", {"naver": 1}) is None
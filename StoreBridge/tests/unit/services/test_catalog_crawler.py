@@ -0,0 +1,219 @@
+"""Catalog crawler unit tests."""
+
+import asyncio
+
+import pytest
+
+from app.services.catalog_crawler import (
+    DomeggookCatalogCrawler,
+    RequestPacer,
+    SharedRequestPacer,
+)
+
+
+class FakeDomeggookClient:
+    """In-memory stand-in for DomeggookClient.get_item_list."""
+
+    def __init__(self, total_count: int, fail_pages=None, delay: float = 0.0, cached_pages=()):
+        self.total_count = total_count
+        self.fail_pages = dict(fail_pages or {})
+        # Pages answered from the response cache, without a request
+        self.cached_pages = set(cached_pages)
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_item_list(self, page=1, page_size=100, before_request=None, **filters):
+        if page not in self.cached_pages and before_request is not None:
+            await before_request()
+        self.calls.append(page)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail_pages.get(page, 0) > 0:
+                self.fail_pages[page] -= 1
+                raise Exception("Rate limit exceeded")
+
+            start = (page - 1) * page_size
+            end = min(start + page_size, self.total_count)
+            items = [{"item_id": f"DG-{i}"} for i in range(start, end)]
+            return {"success": True, "total_count": self.total_count, "items": items}
+        finally:
+            self.in_flight -= 1
+
+
+async def collect(crawler, **kwargs):
+    return [page async for page in crawler.iter_pages(**kwargs)]
+
+
+@pytest.mark.unit
+class TestDomeggookCatalogCrawler:
+    """Test paginated catalog crawl."""
+
+    @pytest.fixture
+    def pacer(self):
+        return RequestPacer(max_rpm=600_000)
+
+    @pytest.mark.asyncio
+    async def test_walks_all_pages(self, pacer):
+        """전체 페이지 순회."""
+        client = FakeDomeggookClient(total_count=250)
+        crawler = DomeggookCatalogCrawler(client, page_size=100, pacer=pacer)
+
+        pages = await collect(crawler)
+
+        assert sorted(p.page for p in pages) == [1, 2, 3]
+        assert sum(len(p.items) for p in pages) == 250
+        assert crawler.calls_made == 3
+
+    @pytest.mark.asyncio
+    async def test_limit_trims_items_and_pages(self, pacer):
+        """limit 초과 아이템/페이지는 가져오지 않음."""
+        client = FakeDomeggookClient(total_count=10_000)
+        crawler = DomeggookCatalogCrawler(client, page_size=100, pacer=pacer)
+
+        pages = await collect(crawler, limit=250)
+
+        assert sum(len(p.items) for p in pages) == 250
+        assert sorted(client.calls) == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, pacer):
+        """동시 요청 수는 concurrency 이하."""
+        client = FakeDomeggookClient(total_count=2_000, delay=0.01)
+        crawler = DomeggookCatalogCrawler(client, page_size=100, concurrency=3, pacer=pacer)
+
+        pages = await collect(crawler)
+
+        assert len(pages) == 20
+        assert client.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_call_budget_truncates_crawl(self, pacer):
+        """일일 호출 한도를 넘으면 크롤링 중단."""
+        client = FakeDomeggookClient(total_count=1_000)
+        crawler = DomeggookCatalogCrawler(client, page_size=100, max_calls=4, pacer=pacer)
+
+        pages = await collect(crawler)
+
+        assert len(pages) == 4
+        assert crawler.truncated is True
+
+    @pytest.mark.asyncio
+    async def test_retries_count_against_the_budget(self, pacer):
+        """재시도도 호출 한도에 포함되어 한도를 넘지 않음."""
+        client = FakeDomeggookClient(total_count=300, fail_pages={2: 2})
+        crawler = DomeggookCatalogCrawler(
+            client, page_size=100, max_calls=3, concurrency=1, pacer=pacer, retry_backoff=0.001
+        )
+
+        pages = await collect(crawler)
+
+        assert [p.page for p in pages] == [1]
+        assert crawler.calls_made == 3
+        assert client.calls == [1, 2, 2]
+        assert crawler.truncated is True
+
+    @pytest.mark.asyncio
+    async def test_cached_pages_use_no_budget_or_pacing(self):
+        """캐시에서 받은 페이지는 호출 한도와 요청 간격을 쓰지 않음."""
+        client = FakeDomeggookClient(total_count=500, cached_pages={1, 2, 3})
+        pacer = RequestPacer(max_rpm=600_000)
+        waits = []
+        original_wait = pacer.wait
+
+        async def wait():
+            waits.append(1)
+            await original_wait()
+
+        pacer.wait = wait
+        crawler = DomeggookCatalogCrawler(client, page_size=100, max_calls=2, pacer=pacer)
+
+        pages = await collect(crawler)
+
+        assert sorted(p.page for p in pages) == [1, 2, 3, 4, 5]
+        assert crawler.calls_made == len(waits) == 2
+        assert crawler.truncated is False
+
+    @pytest.mark.asyncio
+    async def test_failed_page_is_retried(self, pacer):
+        """실패한 페이지는 재시도."""
+        client = FakeDomeggookClient(total_count=200, fail_pages={2: 1})
+        crawler = DomeggookCatalogCrawler(
+            client, page_size=100, pacer=pacer, retry_backoff=0.001
+        )
+
+        pages = await collect(crawler)
+
+        assert sum(len(p.items) for p in pages) == 200
+        assert client.calls.count(2) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_page_raises_after_max_retries(self, pacer):
+        """max_retries 초과 시 예외 발생."""
+        client = FakeDomeggookClient(total_count=200, fail_pages={2: 5})
+        crawler = DomeggookCatalogCrawler(
+            client, page_size=100, pacer=pacer, max_retries=2, retry_backoff=0.001
+        )
+
+        with pytest.raises(Exception, match="Rate limit exceeded"):
+            await collect(crawler)
+
+
+@pytest.mark.unit
+class TestRequestPacer:
+    """Test request pacing."""
+
+    @pytest.mark.asyncio
+    async def test_spaces_requests_evenly(self):
+        """요청 간격은 60 / max_rpm 초."""
+        pacer = RequestPacer(max_rpm=1200)  # 50ms interval
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        await asyncio.gather(*(pacer.wait() for _ in range(4)))
+        elapsed = loop.time() - start
+
+        assert elapsed >= 0.14
+
+
+@pytest.mark.unit
+class TestSharedRequestPacer:
+    """Test pacing shared through Redis."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_reserved_slot(self, redis_mock):
+        """Redis GCRA 슬롯을 예약하고 해당 시점까지 대기."""
+        redis_mock.evalsha.return_value = [2, 30]
+        pacer = SharedRequestPacer(redis_client=redis_mock, max_rpm=180)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        await pacer.wait()
+
+        assert loop.time() - start >= 0.025
+        args = redis_mock.evalsha.await_args.args
+        assert args[2] == "domeggook_api:gcra:tat"
+        assert args[4] == "333"  # 60 / 180 seconds apart
+
+    @pytest.mark.asyncio
+    async def test_queue_over_max_wait_retries(self, redis_mock):
+        """예약 한도를 넘는 대기열이면 기다린 뒤 다시 예약."""
+        redis_mock.evalsha.side_effect = [[0, 10], [1, 0]]
+        pacer = SharedRequestPacer(redis_client=redis_mock)
+
+        await pacer.wait()
+
+        assert redis_mock.evalsha.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_paces_locally(self, redis_mock):
+        """Redis 장애 시 프로세스 내 간격 조절로 대체."""
+        redis_mock.evalsha.side_effect = ConnectionError("down")
+        pacer = SharedRequestPacer(redis_client=redis_mock, max_rpm=600_000)
+
+        await pacer.wait()
+
+        assert redis_mock.evalsha.await_count == 1
@@ -0,0 +1,120 @@
+"""Category resolver unit tests."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.category_resolver import CategoryResolver, TTLCache
+
+
+def mapping_row(category, naver_id, required=None, defaults=None):
+    return SimpleNamespace(
+        domeggook_category=category,
+        naver_leaf_category_id=naver_id,
+        required_attributes=required,
+        default_attributes=defaults,
+    )
+
+
+@pytest.fixture
+def resolver_redis(redis_mock):
+    """Redis mock with an empty cache and a recording pipeline."""
+    redis_mock.mget = AsyncMock(side_effect=lambda keys: [None] * len(keys))
+    redis_mock.get = AsyncMock(return_value=None)
+    redis_mock.set = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis_mock.pipeline = MagicMock(return_value=pipe)
+    return redis_mock
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test in-process LRU cache."""
+
+    def test_evicts_least_recently_used(self):
+        """가장 오래 사용되지 않은 항목부터 제거."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == (True, 1)
+        assert cache.get("b") == (False, None)
+
+    def test_entries_expire(self):
+        """TTL이 지나면 만료."""
+        cache = TTLCache(maxsize=2, ttl=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") == (False, None)
+
+
+@pytest.mark.unit
+class TestCategoryResolver:
+    """Test two-level category mapping cache."""
+
+    @pytest.mark.asyncio
+    async def test_preload_uses_one_query_and_caches_locally(self, resolver_redis):
+        """여러 카테고리를 한 번의 쿼리로 조회 후 로컬 캐시."""
+        db = SimpleNamespace(
+            execute=AsyncMock(
+                return_value=[mapping_row("의류", "50000803"), mapping_row("의류", "50000999")]
+            )
+        )
+        resolver = CategoryResolver(redis_client=resolver_redis)
+
+        first = await resolver.preload(db, ["의류", "가방", "의류", None])
+        second = await resolver.preload(db, ["의류", "가방"])
+
+        assert first["의류"].naver_category_id == "50000803"  # highest confidence first
+        assert first["가방"] is None
+        assert second == first
+        assert db.execute.await_count == 1
+        assert resolver_redis.mget.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_skips_database(self, resolver_redis):
+        """Redis에 있으면 DB 조회 생략."""
+        resolver_redis.mget = AsyncMock(
+            return_value=[json.dumps({"naver_category_id": "50000803"}), json.dumps(None)]
+        )
+        db = SimpleNamespace(execute=AsyncMock())
+        resolver = CategoryResolver(redis_client=resolver_redis)
+
+        resolved = await resolver.preload(db, ["의류", "가방"])
+
+        assert resolved["의류"].naver_category_id == "50000803"
+        assert resolved["가방"] is None
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_attributes_are_fetched_once(self, resolver_redis):
+        """카테고리 속성은 한 번만 네이버에서 조회."""
+        naver = SimpleNamespace(
+            get_category_attributes=AsyncMock(
+                return_value={"categoryId": "50000803", "requiredAttributes": []}
+            )
+        )
+        resolver = CategoryResolver(redis_client=resolver_redis, naver_client=naver)
+
+        await resolver.get_attributes("50000803")
+        await resolver.get_attributes("50000803")
+
+        naver.get_category_attributes.assert_awaited_once_with("50000803")
+        resolver_redis.set.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_attributes_skip_naver(self, resolver_redis):
+        """Redis에 캐시된 속성은 네이버 호출 없이 사용."""
+        resolver_redis.get = AsyncMock(return_value=json.dumps({"requiredAttributes": []}))
+        naver = SimpleNamespace(get_category_attributes=AsyncMock())
+        resolver = CategoryResolver(redis_client=resolver_redis, naver_client=naver)
+
+        attributes = await resolver.get_attributes("50000803")
+
+        assert attributes == {"requiredAttributes": []}
+        naver.get_category_attributes.assert_not_awaited()
@@ -0,0 +1,164 @@
+"""Domeggook response cache unit tests."""
+
+import json
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.connectors.domeggook_client import DomeggookClient
+from app.services.domeggook_cache import DomeggookResponseCache
+
+ITEM = {"item": {"item_id": "DG-001", "item_name": "면 티셔츠", "price": 10000}}
+
+
+@pytest.fixture
+def store(redis_mock):
+    """Dict-backed Redis GET/SET."""
+    data = {}
+    redis_mock.get = AsyncMock(side_effect=lambda key: data.get(key))
+    redis_mock.set = AsyncMock(side_effect=lambda key, value, ex=None: data.__setitem__(key, value))
+    return data
+
+
+def make_client(redis_mock, handler):
+    """Domeggook client with a cache, answering requests with handler."""
+    client = DomeggookClient(
+        api_key="test_key",
+        api_url="https://openapi.domeggook.com",
+        cache=DomeggookResponseCache(redis_client=redis_mock),
+    )
+    client._client = httpx.AsyncClient(
+        base_url=client.api_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def expire(store):
+    """Make every cached entry stale."""
+    for key, raw in store.items():
+        store[key] = json.dumps({**json.loads(raw), "fresh_until": 0.0})
+
+
+@pytest.mark.unit
+class TestDomeggookResponseCache:
+    """Test cached Domeggook calls."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_response_is_served_without_a_call(self, redis_mock, store):
+        """신선한 응답은 API 호출 없이 반환 (일일 할당량 절약)."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=ITEM)
+
+        client = make_client(redis_mock, handler)
+
+        first = await client.get_item_view("DG-001")
+        second = await client.get_item_view("DG-001")
+
+        assert first == second
+        assert second["item"]["item_id"] == "DG-001"
+        assert len(requests) == 1
+        assert all("test_key" not in key for key in store)
+
+    @pytest.mark.asyncio
+    async def test_stale_response_is_revalidated_with_etag(self, redis_mock, store):
+        """만료된 응답은 ETag로 재검증하고 304면 캐시 본문 재사용."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=ITEM, headers={"ETag": '"v1"'})
+
+        client = make_client(redis_mock, handler)
+        await client.get_item_view("DG-001")
+        expire(store)
+
+        result = await client.get_item_view("DG-001")
+
+        assert result["item"]["item_name"] == "면 티셔츠"
+        assert [r.headers.get("If-None-Match") for r in requests] == [None, '"v1"']
+        # Fresh again after the 304
+        await client.get_item_view("DG-001")
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_item_is_negatively_cached(self, redis_mock, store):
+        """없는 상품(404)은 캐시해 다시 호출하지 않음."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(404)
+
+        client = make_client(redis_mock, handler)
+
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError) as error:
+                await client.get_item_view("DG-404")
+            assert error.value.response.status_code == 404
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_the_api(self, redis_mock):
+        """Redis 오류 시 캐시 없이 API 호출."""
+        redis_mock.get = AsyncMock(side_effect=ConnectionError("down"))
+        redis_mock.set = AsyncMock(side_effect=ConnectionError("down"))
+        client = make_client(redis_mock, lambda request: httpx.Response(200, json=ITEM))
+
+        result = await client.get_item_view("DG-001")
+
+        assert result["item"]["item_id"] == "DG-001"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "raw", ["{not json", json.dumps(["old", "format"]), json.dumps({"body": ITEM})]
+    )
+    async def test_unreadable_entry_is_dropped_as_a_miss(self, redis_mock, store, raw):
+        """손상되었거나 이전 형식인 항목은 삭제 후 미스로 처리하고 API 호출."""
+        key = DomeggookResponseCache.key("/getItemView", {"item_id": "DG-001"})
+        store[key] = raw
+        deleted = []
+        redis_mock.delete = AsyncMock(side_effect=lambda key: deleted.append(store.pop(key)))
+        client = make_client(redis_mock, lambda request: httpx.Response(200, json=ITEM))
+
+        result = await client.get_item_view("DG-001")
+
+        assert result["item"]["item_id"] == "DG-001"
+        assert deleted == [raw]
+        # Replaced by the fresh response
+        assert json.loads(store[key])["data"] == ITEM
+
+    @pytest.mark.asyncio
+    async def test_before_request_runs_only_for_real_calls(self, redis_mock, store):
+        """before_request 훅은 실제 HTTP 요청에만 호출 (캐시 적중 시 생략)."""
+        before_request = AsyncMock()
+        client = make_client(
+            redis_mock, lambda request: httpx.Response(200, json={"total_count": 0, "items": []})
+        )
+
+        await client.get_item_list(before_request=before_request)
+        await client.get_item_list(before_request=before_request)
+
+        before_request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_an_endpoint(self, redis_mock, store, monkeypatch):
+        """TTL이 0인 엔드포인트는 캐시하지 않음."""
+        monkeypatch.setattr("app.config.settings.domeggook_cache_item_list_ttl", 0)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"total_count": 0, "items": []})
+
+        client = make_client(redis_mock, handler)
+        await client.get_item_list()
+        await client.get_item_list()
+
+        assert len(requests) == 2
+        assert store == {}
@@ -0,0 +1,155 @@
+"""Image pipeline unit tests."""
+
+import hashlib
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.connectors.naver_client import NaverRateLimitError
+from app.services.image_pipeline import ImagePipeline
+from app.services.naver_dispatcher import NaverDispatchError
+
+
+class FakeSession:
+    """AsyncSession stand-in holding image_assets rows in memory."""
+
+    def __init__(self, assets=()):
+        self.assets = list(assets)
+        self.inserted = []
+        self.commit = AsyncMock()
+
+    async def execute(self, stmt):
+        if stmt.is_insert:
+            rows = stmt.compile().params
+            urls = [v for k, v in rows.items() if k.startswith("source_url")]
+            self.inserted.extend(urls)
+            return None
+
+        column = stmt.whereclause.left.key
+        values = stmt.whereclause.right.value
+        return [
+            SimpleNamespace(**asset) for asset in self.assets if asset.get(column) in values
+        ]
+
+
+def http_client(images):
+    """httpx client serving {url: bytes}; other URLs return 404."""
+
+    def handler(request):
+        content = images.get(str(request.url))
+        if content is None:
+            return httpx.Response(404)
+        return httpx.Response(200, content=content)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def naver_client():
+    client = SimpleNamespace()
+    client.upload_image = AsyncMock(
+        side_effect=lambda data, filename: {
+            "success": True,
+            "image_url": f"https://cdn.naver/{hashlib.sha256(data).hexdigest()[:8]}",
+        }
+    )
+    return client
+
+
+@pytest.mark.unit
+class TestImagePipeline:
+    """Test image download, dedup and upload."""
+
+    @pytest.mark.asyncio
+    async def test_identical_images_are_uploaded_once(self):
+        """같은 내용의 이미지는 URL이 달라도 한 번만 업로드."""
+        images = {f"https://dg.com/{i}.jpg": b"same-image" for i in range(5)}
+        db = FakeSession()
+        naver = naver_client()
+        pipeline = ImagePipeline(db, naver, http_client=http_client(images))
+
+        result = await pipeline.process(list(images))
+
+        assert naver.upload_image.await_count == 1
+        assert result.uploaded_count == 1
+        assert result.reused_count == 4
+        assert len(set(result.naver_urls.values())) == 1
+        assert sorted(db.inserted) == sorted(images)
+
+    @pytest.mark.asyncio
+    async def test_known_urls_are_not_downloaded(self):
+        """이미 등록된 URL은 다운로드/업로드 없이 재사용."""
+        db = FakeSession(
+            [{"source_url": "https://dg.com/a.jpg", "naver_url": "https://cdn.naver/a"}]
+        )
+        naver = naver_client()
+        pipeline = ImagePipeline(db, naver, http_client=http_client({}))
+
+        result = await pipeline.process(["https://dg.com/a.jpg"])
+
+        assert result.resolve(["https://dg.com/a.jpg"]) == ["https://cdn.naver/a"]
+        naver.upload_image.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_known_content_hash_skips_upload(self):
+        """다른 URL이라도 해시가 같으면 기존 CDN URL 재사용."""
+        content_hash = hashlib.sha256(b"logo").hexdigest()
+        db = FakeSession([{"content_hash": content_hash, "naver_url": "https://cdn.naver/logo"}])
+        naver = naver_client()
+        pipeline = ImagePipeline(
+            db, naver, http_client=http_client({"https://dg.com/new.jpg": b"logo"})
+        )
+
+        result = await pipeline.process(["https://dg.com/new.jpg"])
+
+        assert result.naver_urls == {"https://dg.com/new.jpg": "https://cdn.naver/logo"}
+        naver.upload_image.assert_not_awaited()
+        assert db.inserted == ["https://dg.com/new.jpg"]
+
+    @pytest.mark.asyncio
+    async def test_failed_downloads_are_reported(self):
+        """다운로드 실패 이미지는 결과에서 제외하고 실패로 기록."""
+        db = FakeSession()
+        pipeline = ImagePipeline(
+            db, naver_client(), http_client=http_client({"https://dg.com/ok.jpg": b"ok"})
+        )
+
+        result = await pipeline.process(["https://dg.com/ok.jpg", "https://dg.com/gone.jpg"])
+
+        assert result.resolve(["https://dg.com/gone.jpg", "https://dg.com/ok.jpg"]) == [
+            result.naver_urls["https://dg.com/ok.jpg"]
+        ]
+        assert "https://dg.com/gone.jpg" in result.failed_urls
+
+    @pytest.mark.asyncio
+    async def test_throttled_upload_is_raised_after_storing_uploads(self):
+        """업로드 429는 실패 이미지가 아닌 예외로 전달, 앞서 올린 이미지는 저장."""
+        images = {f"https://dg.com/{i}.jpg": f"image-{i}".encode() for i in range(3)}
+        db = FakeSession()
+        naver = naver_client()
+        naver.upload_image.side_effect = [
+            {"success": True, "image_url": "https://cdn.naver/0"},
+            NaverDispatchError("Rate limit exceeded", 429),
+            {"success": True, "image_url": "https://cdn.naver/2"},
+        ]
+        pipeline = ImagePipeline(db, naver, http_client=http_client(images), upload_concurrency=1)
+
+        with pytest.raises(NaverRateLimitError):
+            await pipeline.process(list(images))
+
+        # The upload after the 429 is not attempted
+        assert naver.upload_image.await_count == 2
+        assert db.inserted == ["https://dg.com/0.jpg"]
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_is_reported(self):
+        """업로드 오류(429 제외)는 해당 이미지만 실패로 기록."""
+        db = FakeSession()
+        naver = naver_client()
+        naver.upload_image.side_effect = httpx.ConnectError("connection reset")
+        pipeline = ImagePipeline(db, naver, http_client=http_client({"https://dg.com/a.jpg": b"a"}))
+
+        result = await pipeline.process(["https://dg.com/a.jpg"])
+
+        assert result.failed_urls == {"https://dg.com/a.jpg": "upload failed"}
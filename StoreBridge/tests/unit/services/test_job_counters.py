@@ -0,0 +1,113 @@
+"""Job counter unit tests."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models import State
+from app.services.job_counters import (
+    COUNTERS_KEY,
+    DIRTY_KEY,
+    VERSION_FIELD,
+    WRITE_FAILED_FIELD,
+    JobCounters,
+    Transition,
+    summarize,
+)
+
+
+@pytest.fixture
+def pipeline(redis_mock):
+    """Pipeline mock recording queued commands (replies end with one job's hash)."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[{}])
+    redis_mock.pipeline = MagicMock(return_value=pipe)
+    return pipe
+
+
+@pytest.mark.unit
+class TestJobCounters:
+    """Test HINCRBY-based job counters."""
+
+    @pytest.mark.asyncio
+    async def test_transitions_move_counts_in_one_round_trip(self, redis_mock, pipeline):
+        """상태 전이를 작업별로 합산해 한 번의 파이프라인으로 기록."""
+        job_id = uuid.uuid4()
+        counters = JobCounters(redis_client=redis_mock)
+
+        await counters.record(
+            [
+                Transition(job_id, State.PENDING, State.UPLOADING),
+                Transition(job_id, State.PENDING, State.UPLOADING),
+                Transition(job_id, State.PENDING, State.MANUAL_REVIEW),
+                Transition(None, State.PENDING, State.UPLOADING),
+            ]
+        )
+
+        key = COUNTERS_KEY.format(job_id=job_id)
+        increments = {c.args[1]: c.args[2] for c in pipeline.hincrby.call_args_list}
+        assert increments == {"PENDING": -3, "UPLOADING": 2, "MANUAL_REVIEW": 1, VERSION_FIELD: 1}
+        assert {c.args[0] for c in pipeline.hincrby.call_args_list} == {key}
+        pipeline.sadd.assert_called_once_with(DIRTY_KEY, str(job_id))
+        pipeline.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_update_returns_the_counts_it_produced(self, redis_mock, pipeline):
+        """같은 트랜잭션에서 증가 후 카운터와 버전을 읽어 반환."""
+        job_id = uuid.uuid4()
+        pipeline.execute.return_value = [1, 1, True, 1, {"COMPLETED": "4", VERSION_FIELD: "9"}]
+        counters = JobCounters(redis_client=redis_mock)
+
+        counts = await counters.increment({job_id: {"COMPLETED": 1}})
+
+        assert counts == {str(job_id): {"COMPLETED": 4, VERSION_FIELD: 9}}
+        pipeline.hgetall.assert_called_once_with(COUNTERS_KEY.format(job_id=job_id))
+        redis_mock.pipeline.assert_called_once_with(transaction=True)
+
+    @pytest.mark.asyncio
+    async def test_net_zero_changes_are_not_sent(self, redis_mock, pipeline):
+        """순변화가 없으면 Redis 호출 생략."""
+        counters = JobCounters(redis_client=redis_mock)
+
+        await counters.increment({uuid.uuid4(): {"PENDING": 0}})
+
+        pipeline.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_redis_error_does_not_fail_task(self, redis_mock, pipeline):
+        """Redis 오류는 작업을 실패시키지 않음 (재집계로 보정)."""
+        pipeline.execute.side_effect = ConnectionError("down")
+        counters = JobCounters(redis_client=redis_mock)
+
+        assert await counters.increment({uuid.uuid4(): {"COMPLETED": 1}}) == {}
+
+    @pytest.mark.asyncio
+    async def test_get_parses_counts(self, redis_mock):
+        """해시 값을 정수로 변환."""
+        redis_mock.hgetall = AsyncMock(return_value={"COMPLETED": "3", "FAILED": "1"})
+        counters = JobCounters(redis_client=redis_mock)
+
+        assert await counters.get("job-1") == {"COMPLETED": 3, "FAILED": 1}
+
+    @pytest.mark.asyncio
+    async def test_reset_replaces_counters(self, redis_mock, pipeline):
+        """재집계 결과로 상태 카운트를 원자적으로 교체하되 버전은 계속 증가."""
+        counters = JobCounters(redis_client=redis_mock)
+
+        await counters.reset("job-1", {"COMPLETED": 5})
+
+        key = COUNTERS_KEY.format(job_id="job-1")
+        cleared = pipeline.hdel.call_args.args
+        assert cleared[0] == key and set(cleared[1:]) == {state.value for state in State}
+        pipeline.hset.assert_called_once_with(key, "COMPLETED", 5)
+        pipeline.hincrby.assert_called_once_with(key, VERSION_FIELD, 1)
+        pipeline.delete.assert_not_called()
+        redis_mock.pipeline.assert_called_once_with(transaction=True)
+
+    def test_summarize(self):
+        """성공/실패(수동 검토 포함)/진행 중 집계."""
+        counts = {"COMPLETED": 5, "FAILED": 1, "MANUAL_REVIEW": 2, "RETRYING": 3, "PENDING": 4}
+
+        assert summarize(counts) == (5, 3, 7)
+        assert summarize({**counts, WRITE_FAILED_FIELD: 2, VERSION_FIELD: 8}) == (5, 5, 7)
@@ -0,0 +1,184 @@
+"""Job event unit tests."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.models import JobStatus
+from app.services.job_events import JobEventPublisher, JobProgress, channel, stream_job_events
+
+
+class FakePubSub:
+    """PubSub stand-in serving queued messages (None = timeout)."""
+
+    def __init__(self, events):
+        self.messages = [
+            None if event is None else {"type": "message", "data": json.dumps(event)}
+            for event in events
+        ]
+        self.unsubscribe = AsyncMock()
+        self.close = AsyncMock()
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=None):
+        return self.messages.pop(0)
+
+
+def parse(message):
+    event, data = message.strip().split("\n")
+    return event.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+
+@pytest.mark.unit
+class TestJobEventPublisher:
+    """Test event publishing."""
+
+    @pytest.mark.asyncio
+    async def test_progress_carries_counters(self, redis_mock):
+        """카운터 기반 작업의 진행 이벤트에 갱신 직후 카운터를 포함."""
+        publisher = JobEventPublisher(redis_client=redis_mock)
+
+        await publisher.progress("job-1", success=1, counters={"COMPLETED": 7, "version": 3})
+
+        event = json.loads(redis_mock.publish.await_args.args[1])
+        assert event["counters"] == {"COMPLETED": 7, "version": 3}
+
+    @pytest.mark.asyncio
+    async def test_publishes_progress_delta(self, redis_mock):
+        """진행 델타를 작업 채널로 발행."""
+        publisher = JobEventPublisher(redis_client=redis_mock)
+
+        await publisher.progress("job-1", success=3, failed=1, errors={"FAILED": 1})
+
+        key, message = redis_mock.publish.await_args.args
+        event = json.loads(message)
+        assert key == channel("job-1")
+        assert (event["success"], event["failed"], event["errors"]) == (3, 1, {"FAILED": 1})
+
+    @pytest.mark.asyncio
+    async def test_empty_progress_is_not_published(self, redis_mock):
+        """변화가 없으면 발행 생략."""
+        publisher = JobEventPublisher(redis_client=redis_mock)
+
+        await publisher.progress("job-1")
+
+        redis_mock.publish.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_redis_error_does_not_fail_task(self, redis_mock):
+        """Redis 오류는 작업을 실패시키지 않음."""
+        redis_mock.publish.side_effect = ConnectionError("down")
+        publisher = JobEventPublisher(redis_client=redis_mock)
+
+        await publisher.status("job-1", JobStatus.RUNNING)
+
+
+@pytest.mark.unit
+class TestJobProgress:
+    """Test progress reconstruction."""
+
+    def test_eta_from_observed_throughput(self):
+        """관측된 처리량으로 남은 시간 추정."""
+        started_at = datetime(2025, 10, 16, 10, 0, tzinfo=timezone.utc)
+        progress = JobProgress(
+            status="RUNNING", total_count=100, success_count=20, started_at=started_at
+        )
+
+        assert progress.estimated_remaining_seconds(started_at + timedelta(seconds=60)) == 240.0
+
+    def test_eta_unknown_before_first_result(self):
+        """처리 결과가 없으면 ETA 없음."""
+        progress = JobProgress(status="RUNNING", total_count=100)
+
+        assert progress.estimated_remaining_seconds() is None
+
+    def test_apply_accumulates_deltas(self):
+        """이벤트 델타를 누적."""
+        progress = JobProgress(status="PENDING")
+
+        progress.apply({"type": "status", "status": "RUNNING", "total_count": 4, "ts": 0})
+        progress.apply({"type": "progress", "success": 2, "failed": 1, "errors": {"X": 1}})
+        progress.apply({"type": "progress", "success": 0, "failed": 1, "errors": {"X": 1}})
+
+        assert progress.progress_percent == 100.0
+        assert progress.error_summary == {"X": 2}
+        assert progress.started_at == datetime.fromtimestamp(0, tz=timezone.utc)
+
+    def test_progress_already_in_snapshot_is_not_counted_twice(self):
+        """스냅샷에 이미 반영된 카운터 버전의 이벤트는 건너뜀."""
+        progress = JobProgress(status="RUNNING", total_count=10)
+        progress.set_counters({"COMPLETED": 3, "FAILED": 1, "version": 4})
+
+        progress.apply(
+            {
+                "type": "progress",
+                "success": 1,
+                "failed": 0,
+                "counters": {"COMPLETED": 3, "FAILED": 1, "version": 4},
+            }
+        )
+        assert (progress.success_count, progress.failed_count) == (3, 1)
+
+        progress.apply(
+            {
+                "type": "progress",
+                "success": 1,
+                "failed": 1,
+                "errors": {"X": 1},
+                "counters": {"COMPLETED": 4, "FAILED": 2, "version": 5},
+            }
+        )
+        assert (progress.success_count, progress.failed_count) == (4, 2)
+        assert progress.error_summary == {"X": 1}
+
+    def test_completed_import_waits_for_registrations(self):
+        """크롤링 완료 후에도 등록이 남아 있으면 종료되지 않음."""
+        progress = JobProgress(status="COMPLETED", total_count=10, success_count=4)
+
+        assert not progress.finished
+        progress.apply({"type": "progress", "success": 6, "failed": 0})
+        assert progress.finished
+
+
+@pytest.mark.unit
+class TestStreamJobEvents:
+    """Test SSE rendering."""
+
+    @pytest.mark.asyncio
+    async def test_streams_snapshot_then_deltas_until_finished(self):
+        """스냅샷 후 델타를 전송하고 작업 종료 시 구독 해제."""
+        pubsub = FakePubSub(
+            [
+                {"type": "progress", "success": 1, "failed": 0, "errors": {}, "ts": 1},
+                None,
+                {"type": "status", "status": "FAILED", "ts": 2},
+            ]
+        )
+        progress = JobProgress(status="RUNNING", total_count=2)
+
+        messages = [message async for message in stream_job_events(pubsub, progress)]
+
+        assert parse(messages[0]) == ("snapshot", progress_dict(0, "RUNNING"))
+        event, data = parse(messages[1])
+        assert event == "progress"
+        assert data["delta"]["success"] == 1
+        assert data["statistics"]["progress_percent"] == 50.0
+        assert messages[2] == ": keep-alive\n\n"
+        assert parse(messages[3])[1]["status"] == "FAILED"
+        pubsub.unsubscribe.assert_awaited_once()
+        pubsub.close.assert_awaited_once()
+
+
+def progress_dict(success, status):
+    return {
+        "status": status,
+        "statistics": {
+            "total_count": 2,
+            "success_count": success,
+            "failed_count": 0,
+            "progress_percent": success / 2 * 100,
+        },
+        "error_summary": {},
+        "estimated_remaining_seconds": None,
+    }
@@ -0,0 +1,108 @@
+"""Metrics unit tests."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from app.services.metrics import (
+    endpoint_label,
+    record_rate_limit,
+    refresh_shared_gauges,
+    render_metrics,
+    track_external_call,
+)
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def call_count(service, method, endpoint, outcome):
+    return sample(
+        "storebridge_external_call_duration_seconds_count",
+        service=service,
+        method=method,
+        endpoint=endpoint,
+        outcome=outcome,
+    )
+
+
+@pytest.mark.unit
+class TestExternalCalls:
+    """Test external call latency tracking."""
+
+    def test_identifiers_collapse_to_one_endpoint(self):
+        """경로의 상품 번호를 하나의 엔드포인트로 묶음."""
+        assert endpoint_label("/v2/products/origin-products/123") == (
+            "/v2/products/origin-products/{id}"
+        )
+        assert endpoint_label("/getItemList?page=2") == "/getItemList"
+
+    def test_successful_call_is_observed(self):
+        """성공한 호출 지연을 ok로 기록."""
+        before = call_count("naver", "GET", "/v1/test/{id}", "ok")
+
+        with track_external_call("naver", "get", "/v1/test/42"):
+            pass
+
+        assert call_count("naver", "GET", "/v1/test/{id}", "ok") == before + 1
+
+    def test_error_status_is_the_outcome(self):
+        """HTTP 오류는 상태 코드로 기록."""
+        request = httpx.Request("GET", "https://example.com/getItemView")
+        error = httpx.HTTPStatusError(
+            "throttled", request=request, response=httpx.Response(429, request=request)
+        )
+        before = call_count("domeggook", "GET", "/getItemView", "429")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            with track_external_call("domeggook", "GET", "/getItemView"):
+                raise error
+
+        assert call_count("domeggook", "GET", "/getItemView", "429") == before + 1
+
+
+@pytest.mark.unit
+class TestRateLimitDecisions:
+    """Test rate limiter outcome counters."""
+
+    def test_script_codes_map_to_outcomes(self):
+        """Lua 스크립트 반환 코드를 결과 라벨로 변환."""
+        name = "storebridge_rate_limit_decisions_total"
+        before = sample(name, limiter="window", outcome="burst")
+
+        record_rate_limit("window", 2)
+        record_rate_limit("gcra", 2)
+
+        assert sample(name, limiter="window", outcome="burst") == before + 1
+        assert sample(name, limiter="gcra", outcome="reserved") >= 1
+
+
+@pytest.mark.unit
+class TestSharedGauges:
+    """Test gauges refreshed at scrape time."""
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_and_effective_rate(self, redis_mock):
+        """큐 길이와 현재 허용 TPS를 게이지로 노출."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[7, 0, 3, 12, 1])
+        redis_mock.pipeline = MagicMock(return_value=pipe)
+        redis_mock.get.return_value = "1.5"
+
+        await refresh_shared_gauges(redis_mock)
+
+        assert sample("storebridge_celery_queue_depth", queue="register.urgent") == 0
+        assert sample("storebridge_celery_queue_depth", queue="register") == 12
+        assert sample("storebridge_naver_effective_tps") == 1.5
+        body, _ = render_metrics()
+        assert b"storebridge_celery_queue_depth" in body
+
+    @pytest.mark.asyncio
+    async def test_redis_error_keeps_previous_values(self, redis_mock):
+        """Redis 오류 시에도 스크레이프는 실패하지 않음."""
+        redis_mock.pipeline = MagicMock(side_effect=ConnectionError("down"))
+
+        await refresh_shared_gauges(redis_mock)
@@ -0,0 +1,256 @@
+"""Naver dispatcher unit tests."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from app.services.naver_dispatcher import (
+    NaverDispatchClient,
+    NaverDispatcher,
+    NaverDispatchError,
+    StrideScheduler,
+)
+
+
+@pytest.fixture
+def naver_client_mock():
+    """Naver client mock whose rate limiter always grants a slot."""
+    client = AsyncMock()
+    client.rate_limiter = AsyncMock()
+    client.rate_limiter.acquire_with_wait.return_value = True
+    client.token_refresh_in = MagicMock(return_value=None)
+    return client
+
+
+def queue_lengths(redis_mock, urgent=0, high=0, normal=0):
+    """Make the LLEN pipeline report the given queue lengths."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[urgent, high, normal])
+    redis_mock.pipeline = MagicMock(return_value=pipe)
+
+
+def pushed_reply(redis_mock):
+    """Decode the reply the dispatcher LPUSHed."""
+    key, raw = redis_mock.lpush.call_args.args
+    return key, json.loads(raw)
+
+
+@pytest.mark.unit
+class TestNaverDispatcher:
+    """Test dispatcher queue draining."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_request_without_second_rate_limit(
+        self, redis_mock, naver_client_mock
+    ):
+        """슬롯 확보 후 전송 (클라이언트에서 재차 rate limit 하지 않음)."""
+        raw = json.dumps({"id": "req-1", "method": "POST", "endpoint": "/v2/products", "data": {}})
+        queue_lengths(redis_mock, normal=1)
+        redis_mock.evalsha.return_value = [1, raw]
+        naver_client_mock._make_request.return_value = {"originProductNo": "123"}
+
+        dispatcher = NaverDispatcher(client=naver_client_mock, redis_client=redis_mock)
+        assert await dispatcher.dispatch_next() is True
+        for task in list(dispatcher._tasks):
+            await task
+
+        naver_client_mock._make_request.assert_called_once_with(
+            "POST", "/v2/products", data={}, params=None, rate_limit=False
+        )
+        key, reply = pushed_reply(redis_mock)
+        assert key == "naver:dispatch:reply:req-1"
+        assert reply == {"ok": True, "data": {"originProductNo": "123"}}
+        # Answered requests leave the processing list
+        redis_mock.lrem.assert_awaited_once_with("naver:dispatch:processing:normal", 1, raw)
+        assert dispatcher._in_flight._value == dispatcher.max_in_flight
+
+    @pytest.mark.asyncio
+    async def test_idle_dispatcher_waits_on_doorbell(self, redis_mock, naver_client_mock):
+        """대기 요청이 없으면 초인종 키에서 블로킹 대기 (슬롯 미사용)."""
+        queue_lengths(redis_mock)
+        redis_mock.blpop.return_value = None
+
+        dispatcher = NaverDispatcher(client=naver_client_mock, redis_client=redis_mock)
+        assert await dispatcher.dispatch_next() is False
+
+        assert redis_mock.blpop.call_args.args[0] == ["naver:dispatch:doorbell"]
+        naver_client_mock.rate_limiter.acquire_with_wait.assert_not_called()
+        assert dispatcher._in_flight._value == dispatcher.max_in_flight
+
+    @pytest.mark.asyncio
+    async def test_rate_slot_waits_for_in_flight_slot(self, redis_mock, naver_client_mock):
+        """동시 요청 한도가 차 있으면 rate limit 슬롯을 먼저 잡지 않음."""
+        queue_lengths(redis_mock, normal=1)
+        dispatcher = NaverDispatcher(
+            client=naver_client_mock, redis_client=redis_mock, max_in_flight=1
+        )
+        await dispatcher._in_flight.acquire()
+
+        waiting = asyncio.ensure_future(dispatcher.dispatch_next())
+        await asyncio.sleep(0.01)
+
+        naver_client_mock.rate_limiter.acquire_with_wait.assert_not_called()
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_urgent_request_is_claimed_first(self, redis_mock, naver_client_mock):
+        """슬롯 확보 시점에 대기 중인 urgent 요청을 먼저 가져감."""
+        urgent = json.dumps({"id": "u", "method": "GET", "endpoint": "/urgent"})
+        queue_lengths(redis_mock, urgent=1, normal=5)
+        redis_mock.evalsha.return_value = [1, urgent]
+
+        dispatcher = NaverDispatcher(client=naver_client_mock, redis_client=redis_mock)
+        priority, raw = await dispatcher._claim()
+
+        assert (priority, raw) == ("urgent", urgent)
+        keys = redis_mock.evalsha.call_args.args[2:]
+        assert keys[0] == "naver:dispatch:queue:urgent"
+        assert keys[3] == "naver:dispatch:processing:urgent"
+
+    @pytest.mark.asyncio
+    async def test_normal_lane_keeps_its_share(self, redis_mock, naver_client_mock):
+        """urgent가 계속 쌓여 있어도 normal 요청이 가중치만큼 전송 (기아 없음)."""
+        queue_lengths(redis_mock, urgent=100, normal=100)
+        redis_mock.evalsha.return_value = [1, json.dumps({"id": "r"})]
+
+        dispatcher = NaverDispatcher(
+            client=naver_client_mock,
+            redis_client=redis_mock,
+            weights={"urgent": 3, "high": 2, "normal": 1},
+        )
+        served = [(await dispatcher._claim())[0] for _ in range(8)]
+
+        assert served.count("normal") == 2
+        assert served.count("urgent") == 6
+
+    @pytest.mark.asyncio
+    async def test_requests_stay_queued_when_no_slot(self, redis_mock, naver_client_mock):
+        """슬롯을 얻지 못하면 요청을 가져오지 않고 큐에 남김."""
+        queue_lengths(redis_mock, high=1)
+        naver_client_mock.rate_limiter.acquire_with_wait.return_value = False
+
+        dispatcher = NaverDispatcher(client=naver_client_mock, redis_client=redis_mock)
+        assert await dispatcher.dispatch_next() is False
+
+        redis_mock.evalsha.assert_not_called()
+        assert dispatcher._in_flight._value == dispatcher.max_in_flight
+
+    @pytest.mark.asyncio
+    async def test_unanswered_requests_are_requeued_on_startup(
+        self, redis_mock, naver_client_mock
+    ):
+        """이전 디스패처가 응답하지 못한 요청은 시작 시 원래 큐 앞으로 복구."""
+        redis_mock.lmove.side_effect = ["r2", "r1", None, None, None]
+
+        dispatcher = NaverDispatcher(client=naver_client_mock, redis_client=redis_mock)
+
+        assert await dispatcher.recover() == 2
+        assert redis_mock.lmove.call_args_list[0].args == (
+            "naver:dispatch:processing:urgent",
+            "naver:dispatch:queue:urgent",
+            "RIGHT",
+            "LEFT",
+        )
+
+    @pytest.mark.asyncio
+    async def test_error_reply_carries_status_code(self, redis_mock, naver_client_mock):
+        """Naver 오류는 status_code와 함께 응답."""
+        response = MagicMock(status_code=429)
+        error = httpx.HTTPStatusError("Too Many Requests", request=MagicMock(), response=response)
+        naver_client_mock._make_request.side_effect = error
+
+        dispatcher = NaverDispatcher(client=naver_client_mock, redis_client=redis_mock)
+        await dispatcher._in_flight.acquire()
+        await dispatcher._execute(json.dumps({"id": "e", "method": "GET", "endpoint": "/x"}))
+
+        _, reply = pushed_reply(redis_mock)
+        assert reply["ok"] is False
+        assert reply["status_code"] == 429
+
+
+@pytest.mark.unit
+class TestStrideScheduler:
+    """Test weighted fair lane selection."""
+
+    def test_backlogged_lanes_share_by_weight(self):
+        """모든 레인이 밀려 있으면 가중치 비율로 배분."""
+        scheduler = StrideScheduler({"urgent": 8, "high": 3, "normal": 1})
+        served = []
+        for _ in range(120):
+            lane = scheduler.pick(["urgent", "high", "normal"])
+            scheduler.charge(lane)
+            served.append(lane)
+
+        assert (served.count("urgent"), served.count("high"), served.count("normal")) == (
+            80,
+            30,
+            10,
+        )
+
+    def test_idle_lane_does_not_bank_credit(self):
+        """유휴 레인은 복귀 시 현재 시점에서 시작 (몰아서 독점하지 않음)."""
+        scheduler = StrideScheduler({"urgent": 1, "high": 1, "normal": 1})
+        for _ in range(50):
+            scheduler.charge(scheduler.pick(["normal"]))
+
+        served = []
+        for _ in range(10):
+            lane = scheduler.pick(["urgent", "normal"])
+            scheduler.charge(lane)
+            served.append(lane)
+
+        assert served.count("urgent") == 6
+
+
+@pytest.mark.unit
+class TestNaverDispatchClient:
+    """Test worker-side dispatch client."""
+
+    @pytest.mark.asyncio
+    async def test_register_product_round_trip(self, redis_mock):
+        """요청을 큐에 넣고 응답을 기다림."""
+        reply = {"ok": True, "data": {"originProductNo": "999"}}
+        redis_mock.blpop.return_value = ("reply", json.dumps(reply))
+
+        client = NaverDispatchClient(redis_client=redis_mock, priority="urgent")
+        result = await client.register_product({"originProduct": {}})
+
+        assert result == {"success": True, "originProductNo": "999"}
+        queue, raw = redis_mock.rpush.call_args.args
+        assert queue == "naver:dispatch:queue:urgent"
+        assert json.loads(raw)["endpoint"] == "/v2/products"
+        redis_mock.lpush.assert_awaited_once_with("naver:dispatch:doorbell", "1")
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_is_raised(self, redis_mock):
+        """429 응답은 Rate limit 예외로 변환."""
+        reply = {"ok": False, "error": "Rate limit exceeded", "status_code": 429}
+        redis_mock.blpop.return_value = ("reply", json.dumps(reply))
+
+        client = NaverDispatchClient(redis_client=redis_mock)
+
+        with pytest.raises(NaverDispatchError, match="Rate limit exceeded"):
+            await client.get_product("1")
+
+    @pytest.mark.asyncio
+    async def test_timeout_when_dispatcher_does_not_reply(self, redis_mock):
+        """응답이 없으면 TimeoutError."""
+        redis_mock.blpop.return_value = None
+
+        client = NaverDispatchClient(redis_client=redis_mock, timeout=1)
+
+        with pytest.raises(TimeoutError):
+            await client.get_product("1")
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_shared_redis_open(self, redis_mock):
+        """외부에서 받은 Redis 연결은 닫지 않음."""
+        client = NaverDispatchClient(redis_client=redis_mock)
+
+        await client.close()
+
+        redis_mock.close.assert_not_called()
@@ -220,3 +220,17 @@ class TestOptionMapper:
 
         # None
         assert mapper._detect_separator(["블랙"]) is None
+
+    # ===== Caching =====
+
+    def test_parse_is_memoized_across_instances(self, mapper):
+        """같은 옵션 목록은 인스턴스가 달라도 한 번만 파싱."""
+        raw_options = ["블랙-S", "블랙-M", "화이트-S"]
+
+        assert mapper.parse(raw_options) is OptionMapper().parse(list(raw_options))
+
+    def test_inconsistent_separator_is_not_cached(self, mapper):
+        """오류는 캐시되지 않고 매번 발생."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Inconsistent separator"):
+                mapper.parse(["블랙-S", "화이트/M"])
@@ -0,0 +1,109 @@
+"""Task outbox unit tests."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models import OutboxMessage
+from app.services.outbox import relay_outbox, stage_task
+
+
+class FakeSession:
+    """AsyncSession stand-in serving outbox batches and recording deletes."""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.added = []
+        self.deleted = []
+        self.commit = AsyncMock()
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def execute(self, stmt):
+        if stmt.is_delete:
+            ids = stmt.whereclause.right.value
+            self.deleted.extend(ids)
+            return None
+        rows = self.batches.pop(0) if self.batches else []
+        return SimpleNamespace(scalars=lambda: iter(rows))
+
+
+def message(message_id, queue="register"):
+    return OutboxMessage(
+        id=message_id, task_name="app.workers.tasks.t", args=[message_id], queue=queue
+    )
+
+
+@pytest.mark.unit
+class TestStageTask:
+    """Test staging tasks in a transaction."""
+
+    def test_task_is_added_to_session(self):
+        """태스크를 세션 트랜잭션에 추가 (브로커 호출 없음)."""
+        db = FakeSession([])
+
+        stage_task(db, "app.workers.tasks.import_products_task", ["job-1"], countdown=5)
+
+        [staged] = db.added
+        assert (staged.task_name, staged.args, staged.countdown) == (
+            "app.workers.tasks.import_products_task",
+            ["job-1"],
+            5,
+        )
+
+
+@pytest.mark.unit
+class TestRelayOutbox:
+    """Test relaying staged tasks to the broker."""
+
+    @pytest.mark.asyncio
+    async def test_relays_in_batches_and_deletes_published(self):
+        """배치 단위로 발행하고 발행된 메시지 삭제."""
+        db = FakeSession([[message(1), message(2)], [message(3)]])
+        send = MagicMock()
+
+        published = await relay_outbox(db, send=send, batch_size=2)
+
+        assert published == 3
+        assert [c.args[1] for c in send.call_args_list] == [[1], [2], [3]]
+        assert db.deleted == [1, 2, 3]
+        assert db.commit.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_broker_failure_keeps_unsent_messages(self):
+        """브로커 오류 시 발행된 메시지만 삭제하고 나머지는 남김."""
+        db = FakeSession([[message(1), message(2)]])
+        send = MagicMock(side_effect=[None, ConnectionError("broker down")])
+
+        with pytest.raises(ConnectionError):
+            await relay_outbox(db, send=send, batch_size=10)
+
+        assert db.deleted == [1]
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_slow_broker_does_not_block_event_loop(self):
+        """느린 브로커는 스레드에서 대기하고 시간 초과 시 미발행 메시지를 남김."""
+        db = FakeSession([[message(1), message(2)]])
+        ticks = []
+
+        def send(task_name, args, queue, countdown):
+            if args == [2]:
+                time.sleep(0.3)
+
+        async def tick():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.ensure_future(tick())
+        with pytest.raises(TimeoutError):
+            await relay_outbox(db, send=send, batch_size=10, timeout=0.1)
+        ticker.cancel()
+
+        assert len(ticks) >= 5
+        assert db.deleted == [1]
@@ -0,0 +1,124 @@
+"""Staged pipeline unit tests."""
+
+import asyncio
+
+import pytest
+
+from app.services.pipeline import BatchWriter, Stage, StagePipeline
+
+
+@pytest.mark.unit
+class TestStagePipeline:
+    """Test bounded multi-stage pipelines."""
+
+    @pytest.mark.asyncio
+    async def test_stages_overlap(self):
+        """앞 단계가 끝나기 전에 다음 단계가 처리 시작."""
+        events = []
+
+        async def prepare(item):
+            events.append(("prepare", item))
+            return item
+
+        async def sink(item):
+            await asyncio.sleep(0)
+            events.append(("sink", item))
+
+        await StagePipeline([Stage("prepare", prepare), Stage("sink", sink)], queue_size=1).run(
+            range(5)
+        )
+
+        assert sorted(item for stage, item in events if stage == "sink") == list(range(5))
+        assert events.index(("sink", 0)) < events.index(("prepare", 4))
+
+    @pytest.mark.asyncio
+    async def test_full_queue_applies_backpressure(self):
+        """느린 단계 앞의 큐가 차면 앞 단계가 대기."""
+        prepared = []
+        release = asyncio.Event()
+
+        async def prepare(item):
+            prepared.append(item)
+            return item
+
+        async def sink(item):
+            await release.wait()
+
+        pipeline = StagePipeline([Stage("prepare", prepare), Stage("sink", sink)], queue_size=2)
+        run = asyncio.ensure_future(pipeline.run(range(10)))
+        await asyncio.sleep(0.01)
+
+        # One in the sink, two queued, one waiting to be queued
+        assert len(prepared) == 4
+        release.set()
+        await run
+        assert len(prepared) == 10
+
+    @pytest.mark.asyncio
+    async def test_dropped_items_skip_later_stages(self):
+        """None을 반환한 항목은 다음 단계로 넘기지 않음."""
+        sunk = []
+
+        async def keep_even(item):
+            return item if item % 2 == 0 else None
+
+        async def sink(item):
+            sunk.append(item)
+
+        await StagePipeline([Stage("filter", keep_even, 2), Stage("sink", sink, 3)]).run(range(6))
+
+        assert sorted(sunk) == [0, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_handler_error_cancels_pipeline(self):
+        """처리기 예외 시 모든 단계를 취소하고 예외 전파."""
+        blocked = asyncio.Event()
+
+        async def prepare(item):
+            if item == 1:
+                raise RuntimeError("database down")
+            return item
+
+        async def sink(item):
+            await blocked.wait()
+
+        with pytest.raises(RuntimeError, match="database down"):
+            await asyncio.wait_for(
+                StagePipeline([Stage("prepare", prepare), Stage("sink", sink)]).run(range(3)),
+                timeout=1,
+            )
+
+
+@pytest.mark.unit
+class TestBatchWriter:
+    """Test group-committed writes."""
+
+    @pytest.mark.asyncio
+    async def test_items_added_during_a_write_share_the_next_one(self):
+        """쓰기 중에 추가된 항목은 다음 한 번의 쓰기로 묶음."""
+        batches = []
+
+        async def write(items):
+            batches.append(items)
+            await asyncio.sleep(0.01)
+
+        async with BatchWriter(write) as writer:
+            writer.add(1)
+            await asyncio.sleep(0)
+            writer.add(2)
+            writer.add(3)
+
+        assert batches == [[1], [2, 3]]
+
+    @pytest.mark.asyncio
+    async def test_failed_write_surfaces_on_next_add(self):
+        """쓰기 실패는 다음 추가 시점에 예외로 전달."""
+
+        async def write(items):
+            raise ConnectionError("database down")
+
+        with pytest.raises(ConnectionError):
+            async with BatchWriter(write) as writer:
+                writer.add(1)
+                await asyncio.sleep(0.01)
+                writer.add(2)
@@ -0,0 +1,166 @@
+"""Differential product sync unit tests."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.models import JobType, Product, ProductRegistration
+from app.services.product_sync import ProductSyncEngine, fingerprint
+
+
+class FakeSession:
+    """AsyncSession stand-in returning registered products and recording updates."""
+
+    def __init__(self, stored):
+        self.stored = stored
+        self.updates = []
+        self.commit = AsyncMock()
+
+    async def execute(self, stmt, params=None):
+        if params is not None:
+            self.updates.extend(params)
+            return None
+        rows = []
+        for stored_item in self.stored:
+            product = Product(
+                id=uuid.uuid4(),
+                domeggook_item_id=stored_item["item_id"],
+                name=stored_item["item_name"],
+                price=stored_item["price"],
+                images=["https://example.com/1.jpg"],
+                options={"raw": stored_item["options"]},
+                raw_data=stored_item,
+            )
+            registration = ProductRegistration(
+                product_id=product.id,
+                naver_product_id=f"N-{stored_item['item_id']}",
+                seller_product_code=f"DG-{stored_item['item_id']}",
+            )
+            rows.append((product, registration))
+        return rows
+
+
+async def build_payload(product, registration):
+    """Full payload stand-in for the registration payload builder."""
+    return {
+        "originProduct": {
+            "name": product.name,
+            "salePrice": product.price,
+            "stockQuantity": product.raw_data.get("stock_quantity"),
+            "images": [{"url": url} for url in product.images],
+            "sellerProductCode": registration.seller_product_code,
+        }
+    }
+
+
+def item(item_id, price=10000, stock=5, options=None):
+    return {
+        "item_id": item_id,
+        "item_name": f"상품 {item_id}",
+        "price": price,
+        "stock_quantity": stock,
+        "options": options or [],
+    }
+
+
+@pytest.fixture
+def naver():
+    return SimpleNamespace(update_product=AsyncMock(return_value={"success": True}))
+
+
+@pytest.mark.unit
+class TestProductSyncEngine:
+    """Test fingerprint-driven sync."""
+
+    def test_fingerprint_only_covers_synced_fields(self):
+        """동기화 대상 필드만 지문에 반영."""
+        base = item("1")
+
+        assert fingerprint(base, ("price",)) == fingerprint({**base, "item_name": "x"}, ("price",))
+        assert fingerprint(base, ("price",)) != fingerprint({**base, "price": 9000}, ("price",))
+
+    @pytest.mark.asyncio
+    async def test_only_changed_prices_are_pushed(self, naver):
+        """가격이 바뀐 상품만 네이버 업데이트."""
+        db = FakeSession([item("1"), item("2"), item("3")])
+        engine = ProductSyncEngine(db, naver, JobType.SYNC_PRICE, build_payload)
+
+        result = await engine.sync([item("1"), item("2", price=12000), item("3", stock=0)])
+
+        naver.update_product.assert_awaited_once_with(
+            "N-2",
+            {
+                "originProduct": {
+                    "name": "상품 2",
+                    "salePrice": 12000,
+                    "stockQuantity": 5,
+                    "images": [{"url": "https://example.com/1.jpg"}],
+                    "sellerProductCode": "DG-2",
+                }
+            },
+        )
+        assert result.updated_count == 1
+        assert result.unchanged_count == 2
+        assert db.updates[0]["price"] == 12000
+        assert db.updates[0]["raw_data"]["price"] == 12000
+
+    @pytest.mark.asyncio
+    async def test_inventory_sync_watches_stock_and_options(self, naver):
+        """재고/옵션 변경만 재고 동기화 대상."""
+        db = FakeSession([item("1"), item("2")])
+        engine = ProductSyncEngine(db, naver, JobType.SYNC_INVENTORY, build_payload)
+
+        result = await engine.sync([item("1", price=1), item("2", stock=0)])
+
+        assert result.updated_count == 1
+        payload = naver.update_product.await_args.args[1]["originProduct"]
+        assert payload["stockQuantity"] == 0
+
+    @pytest.mark.asyncio
+    async def test_payload_build_error_fails_only_that_product(self, naver):
+        """전체 상품 페이로드를 만들 수 없으면 해당 상품만 실패 처리."""
+        db = FakeSession([item("1"), item("2")])
+
+        async def build(product, registration):
+            if product.domeggook_item_id == "1":
+                raise ValueError("Invalid option")
+            return await build_payload(product, registration)
+
+        engine = ProductSyncEngine(db, naver, JobType.SYNC_PRICE, build)
+
+        result = await engine.sync([item("1", price=1), item("2", price=2)])
+
+        assert (result.updated_count, result.failed_count) == (1, 1)
+        assert result.error_summary == {"ValueError": 1}
+        naver.update_product.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_update_keeps_stored_data(self, naver):
+        """업데이트 실패 시 저장 데이터를 유지해 다음 동기화에서 재시도."""
+        naver.update_product = AsyncMock(side_effect=RuntimeError("Rate limit exceeded"))
+        db = FakeSession([item("1")])
+        engine = ProductSyncEngine(db, naver, JobType.SYNC_PRICE, build_payload)
+
+        result = await engine.sync([item("1", price=500)])
+
+        assert result.failed_count == 1
+        assert result.error_summary == {"RuntimeError": 1}
+        assert db.updates == []
+
+    @pytest.mark.asyncio
+    async def test_unregistered_items_are_skipped(self, naver):
+        """등록되지 않은 상품은 건너뜀."""
+        db = FakeSession([item("1")])
+        engine = ProductSyncEngine(db, naver, JobType.SYNC_PRICE, build_payload)
+
+        result = await engine.sync([item("1"), item("99", price=1)])
+
+        assert result.skipped_count == 1
+        naver.update_product.assert_not_awaited()
+
+    def test_rejects_import_job_type(self, naver):
+        """IMPORT 작업 유형은 거부."""
+        with pytest.raises(ValueError):
+            ProductSyncEngine(FakeSession([]), naver, JobType.IMPORT, build_payload)
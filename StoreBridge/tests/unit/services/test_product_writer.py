@@ -0,0 +1,270 @@
+"""Bulk product writer unit tests."""
+
+import json
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.elements import TextClause
+
+from app.models import State
+from app.services.product_writer import (
+    ProductBulkWriter,
+    ProductCopyWriter,
+    product_row_from_item,
+)
+
+
+class FakeSession:
+    """Minimal AsyncSession stand-in that answers the two upsert statements."""
+
+    def __init__(self, registration_state=State.PENDING, fail_item_ids=(), owner=None):
+        self.statements = []
+        self.registration_state = registration_state
+        # Job keeping existing registrations (None: the writing job owns them)
+        self.owner = owner
+        self.fail_item_ids = set(fail_item_ids)
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        if stmt.table.name == "products":
+            item_ids = [v for k, v in params.items() if k.startswith("domeggook_item_id")]
+            if self.fail_item_ids & set(item_ids):
+                raise ValueError("check_price_non_negative")
+            return [SimpleNamespace(id=uuid.uuid4(), domeggook_item_id=i) for i in item_ids]
+
+        product_ids = [v for k, v in params.items() if k.startswith("product_id")]
+        job_ids = [v for k, v in params.items() if k.startswith("job_id")]
+        return [
+            SimpleNamespace(
+                product_id=pid, job_id=self.owner or job_id, state=self.registration_state
+            )
+            for pid, job_id in zip(product_ids, job_ids, strict=True)
+        ]
+
+
+class FakeCopySession(FakeSession):
+    """FakeSession that also serves COPY into the staging table and the merge."""
+
+    def __init__(self, copy_error=None, **kwargs):
+        super().__init__(**kwargs)
+        self.copies = []
+        self.copy_error = copy_error
+        self.merge_params = []
+
+    async def connection(self):
+        async def copy_records_to_table(table, records, columns):
+            if self.copy_error is not None:
+                raise self.copy_error
+            self.copies.append((table, columns, records))
+
+        driver = SimpleNamespace(copy_records_to_table=copy_records_to_table)
+        raw = SimpleNamespace(driver_connection=driver)
+        return SimpleNamespace(get_raw_connection=AsyncMock(return_value=raw))
+
+    async def execute(self, stmt, params=None):
+        if not isinstance(stmt, TextClause):
+            return await super().execute(stmt)
+        self.statements.append(stmt)
+        if params is None:
+            return None
+        self.merge_params.append(params)
+        _, _, records = self.copies[-1]
+        return [
+            SimpleNamespace(
+                product_id=record[0],
+                job_id=self.owner or params["job_id"],
+                state=self.registration_state.value,
+            )
+            for record in records
+        ]
+
+
+def items(count, start=0):
+    return [
+        {"item_id": f"DG-{i}", "item_name": f"상품 {i}", "price": 1000}
+        for i in range(start, start + count)
+    ]
+
+
+@pytest.mark.unit
+class TestProductBulkWriter:
+    """Test batched Product/ProductRegistration upserts."""
+
+    @pytest.mark.asyncio
+    async def test_upserts_on_unique_keys(self):
+        """domeggook_item_id, seller_product_code 기준 upsert."""
+        db = FakeSession()
+        writer = ProductBulkWriter(db, job_id=uuid.uuid4(), chunk_size=100)
+
+        await writer.write(items(3))
+
+        product_sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+        registration_sql = str(db.statements[1].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (domeggook_item_id) DO UPDATE" in product_sql
+        assert "RETURNING" in product_sql
+        assert "ON CONFLICT (seller_product_code) DO UPDATE" in registration_sql
+
+    @pytest.mark.asyncio
+    async def test_chunks_and_commits_once_per_chunk(self):
+        """chunk 단위로 2개 쿼리 + 1회 커밋."""
+        db = FakeSession()
+        writer = ProductBulkWriter(db, chunk_size=100)
+
+        result = await writer.write(items(250))
+
+        assert result.success_count == 250
+        assert len(result.pending_product_ids) == 250
+        assert len(db.statements) == 6
+        assert db.commit.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_add_buffers_until_chunk_is_full(self):
+        """add는 chunk가 찰 때까지 버퍼링, flush로 나머지 기록."""
+        db = FakeSession()
+        writer = ProductBulkWriter(db, chunk_size=100)
+
+        first = await writer.add(items(60))
+        second = await writer.add(items(60, start=60))
+        rest = await writer.flush()
+
+        assert first.success_count == 0
+        assert second.success_count == 100
+        assert rest.success_count == 20
+
+    @pytest.mark.asyncio
+    async def test_duplicate_items_in_chunk_are_deduped(self):
+        """같은 chunk 내 중복 아이템은 하나로 합침."""
+        db = FakeSession()
+        writer = ProductBulkWriter(db, chunk_size=100)
+
+        result = await writer.write(items(2) + items(2))
+
+        assert result.success_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bad_row_only_fails_itself(self):
+        """실패한 행만 실패로 집계 (chunk 분할 재시도)."""
+        db = FakeSession(fail_item_ids={"DG-3"})
+        writer = ProductBulkWriter(db, chunk_size=100)
+
+        result = await writer.write(items(8))
+
+        assert result.success_count == 7
+        assert result.failed_count == 1
+        assert result.error_summary == {"ValueError": 1}
+
+    @pytest.mark.asyncio
+    async def test_non_pending_registrations_are_not_requeued(self):
+        """이미 완료된 등록은 재등록 대상에서 제외."""
+        db = FakeSession(registration_state=State.COMPLETED)
+        writer = ProductBulkWriter(db, chunk_size=100)
+
+        result = await writer.write(items(5))
+
+        assert result.success_count == 5
+        assert result.pending_product_ids == []
+        assert result.registration_states == {"COMPLETED": 5}
+
+    @pytest.mark.asyncio
+    async def test_reimport_keeps_completed_registration_with_its_job(self):
+        """완료된 등록을 재가져오기해도 기존 작업 소유로 유지, 새 작업 집계 제외."""
+        old_job = uuid.uuid4()
+        db = FakeSession(registration_state=State.COMPLETED, owner=old_job)
+        writer = ProductBulkWriter(db, job_id=uuid.uuid4(), chunk_size=100)
+
+        result = await writer.write(items(2))
+
+        registration_sql = str(db.statements[1].compile(dialect=postgresql.dialect()))
+        assert "job_id = CASE WHEN" in registration_sql
+        assert result.success_count == 2
+        assert result.pending_product_ids == []
+        assert result.registration_states == {}
+
+    @pytest.mark.asyncio
+    async def test_pending_work_is_staged_before_each_commit(self):
+        """PENDING 등록 후속 작업은 해당 chunk 커밋 전에 적재."""
+        db = FakeSession(fail_item_ids={"DG-3"})
+        events = []
+        db.commit.side_effect = lambda: events.append("commit")
+        writer = ProductBulkWriter(
+            db, chunk_size=4, on_pending=lambda session, ids: events.append(len(ids))
+        )
+
+        await writer.write(items(4))
+
+        # The failing chunk is rolled back, then its halves stage and commit alone
+        assert events == [2, "commit", 1, "commit"]
+
+    def test_product_row_from_item(self):
+        """도매꾹 아이템 → products 행 변환."""
+        row = product_row_from_item(
+            {"item_id": "DG-1", "item_name": "티셔츠", "price": None, "options": ["S"]}
+        )
+
+        assert row["domeggook_item_id"] == "DG-1"
+        assert row["price"] == 0
+        assert row["options"] == {"raw": ["S"]}
+
+
+@pytest.mark.unit
+class TestProductCopyWriter:
+    """Test COPY + merge ingest."""
+
+    @pytest.mark.asyncio
+    async def test_chunk_is_copied_then_merged_in_one_statement(self):
+        """chunk마다 staging 테이블 COPY 후 한 문장으로 products/등록 병합."""
+        db = FakeCopySession()
+        job_id = uuid.uuid4()
+        staged = []
+        writer = ProductCopyWriter(
+            db, job_id=job_id, chunk_size=1000, on_pending=lambda session, ids: staged.extend(ids)
+        )
+
+        result = await writer.write(items(3) + items(1))
+
+        assert result.success_count == 3
+        assert result.registration_states == {"PENDING": 3}
+        assert len(staged) == 3
+        assert db.commit.call_count == 1
+        table, columns, records = db.copies[0]
+        assert table == "product_ingest_staging"
+        record = dict(zip(columns, records[0], strict=True))
+        assert record["seller_product_code"] == "DG-DG-0"
+        assert json.loads(record["raw_data"])["item_name"] == "상품 0"
+        create_sql, merge_sql = (str(stmt) for stmt in db.statements)
+        assert "ON COMMIT DROP" in create_sql
+        assert "ON CONFLICT (domeggook_item_id) DO UPDATE" in merge_sql
+        assert "ON CONFLICT (seller_product_code) DO UPDATE" in merge_sql
+        assert db.merge_params[0]["job_id"] == job_id
+
+    @pytest.mark.asyncio
+    async def test_reimport_keeps_completed_registration_with_its_job(self):
+        """COPY 병합도 완료된 등록은 기존 작업 소유로 유지 (upsert와 동일 규칙)."""
+        db = FakeCopySession(registration_state=State.COMPLETED, owner=uuid.uuid4())
+        writer = ProductCopyWriter(db, job_id=uuid.uuid4(), chunk_size=1000)
+
+        result = await writer.write(items(2))
+
+        merge_sql = str(db.statements[1])
+        assert "job_id = CASE WHEN r.state = :failed THEN EXCLUDED.job_id" in merge_sql
+        assert result.success_count == 2
+        assert result.pending_product_ids == []
+        assert result.registration_states == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_copy_falls_back_to_upserts(self):
+        """COPY 실패 시 롤백 후 upsert 경로로 재기록 (불량 행만 실패)."""
+        db = FakeCopySession(copy_error=ValueError("invalid input"), fail_item_ids={"DG-3"})
+        writer = ProductCopyWriter(db, chunk_size=1000, upsert_chunk_size=4)
+
+        result = await writer.write(items(8))
+
+        assert db.rollback.await_count >= 1
+        assert result.success_count == 7
+        assert result.failed_count == 1
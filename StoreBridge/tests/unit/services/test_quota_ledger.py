@@ -0,0 +1,94 @@
+"""Daily quota ledger unit tests."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models import JobType
+from app.services.quota_ledger import QuotaLedger, estimate_job_calls
+
+LIMITS = {"domeggook": 15000, "naver": 1000}
+
+
+@pytest.mark.unit
+class TestEstimateJobCalls:
+    """Test per-job call estimates."""
+
+    def test_import_with_auto_register(self, monkeypatch):
+        """자동 등록 가져오기는 페이지 수 + 상품당 등록/이미지 호출."""
+        monkeypatch.setattr("app.config.settings.domeggook_page_size", 100)
+        monkeypatch.setattr("app.config.settings.quota_images_per_product", 1.0)
+
+        estimate = estimate_job_calls(JobType.IMPORT, {"limit": 250, "auto_register": True})
+
+        assert estimate == {"domeggook": 3, "naver": 500}
+
+    def test_import_without_auto_register_skips_naver(self):
+        """수동 검토 가져오기는 네이버 호출 없음."""
+        estimate = estimate_job_calls(JobType.IMPORT, {"limit": 10, "auto_register": False})
+
+        assert estimate == {"domeggook": 1, "naver": 0}
+
+    def test_unbounded_job_uses_default_size(self, monkeypatch):
+        """limit이 없으면 기본 상품 수로 추정."""
+        monkeypatch.setattr("app.config.settings.quota_unbounded_job_items", 40)
+        monkeypatch.setattr("app.config.settings.domeggook_page_size", 100)
+
+        estimate = estimate_job_calls(JobType.SYNC_PRICE, {"limit": None})
+
+        assert estimate == {"domeggook": 1, "naver": 40}
+
+
+@pytest.mark.unit
+class TestQuotaLedger:
+    """Test the Redis-backed ledger."""
+
+    def test_window_follows_timezone(self):
+        """KST 자정 기준으로 일자 구분."""
+        ledger = QuotaLedger(redis_client=AsyncMock(), limits=LIMITS)
+
+        # 16:00 UTC is 01:00 the next day in Seoul
+        assert ledger.window(datetime.fromisoformat("2025-10-16T16:00:00+00:00")) == "2025-10-17"
+        assert ledger.window_start("2025-10-17").isoformat() == "2025-10-17T00:00:00+09:00"
+
+    @pytest.mark.asyncio
+    async def test_admit_returns_first_provider_without_budget(self, redis_mock):
+        """예산이 부족한 첫 공급자 반환, 충분하면 None."""
+        ledger = QuotaLedger(redis_client=redis_mock, limits=LIMITS)
+        estimate = {"domeggook": 3, "naver": 500}
+
+        redis_mock.evalsha.return_value = 2
+        assert await ledger.admit("job-1", estimate, "2025-10-16") == "naver"
+
+        redis_mock.evalsha.return_value = 0
+        assert await ledger.admit("job-1", estimate, "2025-10-16") is None
+        args = redis_mock.evalsha.await_args.args
+        assert args[1:4] == (2, "quota:domeggook:2025-10-16", "quota:naver:2025-10-16")
+        assert args[4] == "job:job-1"
+        assert args[6:] == (15000, 3, 1000, 500)
+        redis_mock.script_load.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_status_reports_remaining_budget(self, redis_mock):
+        """사용량과 예약량을 뺀 잔여 호출 수 계산."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[["1200", "300"], [None, None]])
+        redis_mock.pipeline = MagicMock(return_value=pipe)
+        ledger = QuotaLedger(redis_client=redis_mock, limits=LIMITS)
+
+        status = await ledger.status("2025-10-16")
+
+        assert status["domeggook"].remaining == 13500
+        assert status["naver"].used == 0
+        assert status["naver"].remaining == 1000
+
+    @pytest.mark.asyncio
+    async def test_record_ignores_redis_errors(self, redis_mock):
+        """Redis 오류로 API 호출이 실패하지 않음."""
+        redis_mock.evalsha.side_effect = ConnectionError("down")
+        usage = QuotaLedger(redis_client=redis_mock, limits=LIMITS).usage("naver", "job-1")
+
+        await usage.record()
+
+        redis_mock.evalsha.assert_awaited_once()
@@ -4,7 +4,11 @@ import asyncio
 
 import pytest
 
-from app.services.rate_limiter import NaverRateLimiter
+from app.services.rate_limiter import (
+    AdaptiveRateController,
+    GCRARateLimiter,
+    NaverRateLimiter,
+)
 
 
 @pytest.mark.unit
@@ -189,3 +193,171 @@ class TestNaverRateLimiter:
         await limiter.close()
 
         redis_mock.close.assert_called_once()
+
+
+@pytest.mark.unit
+class TestGCRARateLimiter:
+    """Test GCRA rate limiter (evenly spaced 2 TPS)."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_allowed_when_slot_free(self, redis_mock):
+        """빈 슬롯이 있으면 즉시 허용."""
+        redis_mock.evalsha.return_value = [1, 0]
+
+        limiter = GCRARateLimiter(redis_client=redis_mock, max_tps=2)
+        result = await limiter.acquire()
+
+        assert result is True
+
+    @pytest.mark.asyncio
+    async def test_acquire_does_not_reserve(self, redis_mock):
+        """acquire는 슬롯을 예약하지 않음 (reserve=0)."""
+        redis_mock.evalsha.return_value = [0, 300]
+
+        limiter = GCRARateLimiter(redis_client=redis_mock, max_tps=2)
+        result = await limiter.acquire()
+
+        assert result is False
+        args = redis_mock.evalsha.call_args.args
+        assert args[1:4] == (2, "naver_api:gcra:tat", "naver_api:gcra:rate")
+        assert args[4:7] == ("500", "0", "0")
+
+    @pytest.mark.asyncio
+    async def test_burst_sets_tolerance(self, redis_mock):
+        """burst 허용량은 (burst - 1) * interval."""
+        redis_mock.evalsha.return_value = [1, 0]
+
+        limiter = GCRARateLimiter(redis_client=redis_mock, max_tps=2, burst=3)
+        await limiter.acquire()
+
+        assert redis_mock.evalsha.call_args.args[5] == "1000"
+
+    @pytest.mark.asyncio
+    async def test_fair_acquire_sleeps_exactly_once(self, redis_mock, monkeypatch):
+        """fair 모드는 슬롯 예약 후 정확히 한 번만 대기."""
+        redis_mock.evalsha.return_value = [2, 250]
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        limiter = GCRARateLimiter(redis_client=redis_mock, max_tps=2)
+        result = await limiter.acquire_with_wait()
+
+        assert result is True
+        assert sleeps == [0.25]
+        assert redis_mock.evalsha.call_count == 1
+        assert redis_mock.evalsha.call_args.args[6] == "1"
+
+    @pytest.mark.asyncio
+    async def test_fair_acquire_fails_when_wait_exceeds_timeout(self, redis_mock):
+        """대기 시간이 timeout을 넘으면 예약 없이 실패."""
+        redis_mock.evalsha.return_value = [0, 90_000]
+
+        limiter = GCRARateLimiter(redis_client=redis_mock, max_tps=2)
+        result = await limiter.acquire_with_wait(timeout=5)
+
+        assert result is False
+        assert redis_mock.evalsha.call_args.args[7] == "5000"
+
+    @pytest.mark.asyncio
+    async def test_unfair_acquire_sleeps_until_next_slot(self, redis_mock, monkeypatch):
+        """non-fair 모드는 다음 슬롯까지 정확히 대기 후 재시도."""
+        redis_mock.evalsha.side_effect = [[0, 120], [1, 0]]
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        limiter = GCRARateLimiter(redis_client=redis_mock, max_tps=2, fair=False)
+        result = await limiter.acquire_with_wait(max_retries=3)
+
+        assert result is True
+        assert sleeps == [0.12]
+
+    @pytest.mark.asyncio
+    async def test_redis_connection_error_raises_exception(self, redis_mock):
+        """Redis 연결 오류 시 예외 발생."""
+        redis_mock.evalsha.side_effect = ConnectionError("Redis unavailable")
+
+        limiter = GCRARateLimiter(redis_client=redis_mock)
+
+        with pytest.raises(ConnectionError, match="Redis unavailable"):
+            await limiter.acquire()
+
+    @pytest.mark.asyncio
+    async def test_reset_deletes_tat_key(self, redis_mock):
+        """reset은 TAT 키 삭제."""
+        limiter = GCRARateLimiter(redis_client=redis_mock)
+
+        await limiter.reset()
+
+        redis_mock.delete.assert_called_once_with("naver_api:gcra:tat")
+
+
+@pytest.mark.unit
+class TestAdaptiveRateController:
+    """Test AIMD adjustment of the shared rate."""
+
+    @pytest.mark.asyncio
+    async def test_throttle_decreases_multiplicatively(self, redis_mock):
+        """429이면 감소 비율과 쿨다운으로 조정 스크립트 실행."""
+        redis_mock.evalsha.return_value = "1.0"
+
+        controller = AdaptiveRateController(
+            redis_client=redis_mock, decrease_factor=0.5, decrease_cooldown=2
+        )
+        rate = await controller.on_throttled()
+
+        assert rate == 1.0
+        args = redis_mock.evalsha.call_args.args
+        assert args[2] == "naver_api:gcra:rate"
+        assert args[4:6] == ("decrease", "0.5")
+        assert args[-1] == "2000"
+
+    @pytest.mark.asyncio
+    async def test_probe_is_throttled_per_process(self, redis_mock):
+        """정상 응답의 증가 시도는 increase_interval마다 한 번."""
+        redis_mock.evalsha.return_value = "1.1"
+
+        controller = AdaptiveRateController(redis_client=redis_mock, increase_interval=60)
+        first = await controller.on_response(0.1)
+        second = await controller.on_response(0.1)
+
+        assert (first, second) == (1.1, None)
+        assert redis_mock.evalsha.call_args.args[4] == "increase"
+        assert redis_mock.evalsha.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_response_decreases(self, redis_mock):
+        """지연이 임계값을 넘으면 완만하게 감소."""
+        redis_mock.evalsha.return_value = "1.6"
+
+        controller = AdaptiveRateController(
+            redis_client=redis_mock, latency_threshold=1.0, latency_decrease_factor=0.8
+        )
+        await controller.on_response(3.0)
+
+        assert redis_mock.evalsha.call_args.args[4:6] == ("decrease", "0.8")
+
+    @pytest.mark.asyncio
+    async def test_redis_error_does_not_fail_call(self, redis_mock):
+        """Redis 오류는 Naver 호출을 실패시키지 않음."""
+        redis_mock.evalsha.side_effect = ConnectionError("down")
+
+        controller = AdaptiveRateController(redis_client=redis_mock)
+
+        assert await controller.on_throttled() is None
+
+    @pytest.mark.asyncio
+    async def test_current_rate_defaults_to_ceiling(self, redis_mock):
+        """조정 전에는 max_tps."""
+        redis_mock.get.return_value = None
+
+        controller = AdaptiveRateController(redis_client=redis_mock, max_tps=2)
+
+        assert await controller.current_rate() == 2.0
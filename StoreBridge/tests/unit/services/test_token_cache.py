@@ -0,0 +1,105 @@
+"""Shared OAuth token cache unit tests."""
+
+import json
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.token_cache import NaverTokenCache
+
+
+def cached_token(token="cached", refresh_in=100.0, expires_in=200.0):
+    now = time.time()
+    return json.dumps(
+        {"access_token": token, "refresh_at": now + refresh_in, "expires_at": now + expires_in}
+    )
+
+
+@pytest.mark.unit
+class TestNaverTokenCache:
+    """Test single-flight token refresh across workers."""
+
+    @pytest.fixture
+    def fetch(self):
+        return AsyncMock(return_value=("fresh", 10800.0))
+
+    @pytest.mark.asyncio
+    async def test_fresh_token_is_reused(self, redis_mock, fetch):
+        """유효한 캐시 토큰은 재사용 (토큰 요청 없음)."""
+        redis_mock.get.return_value = cached_token()
+
+        cache = NaverTokenCache(redis_client=redis_mock)
+        token = await cache.get_token(fetch)
+
+        assert token.access_token == "cached"
+        fetch.assert_not_called()
+        redis_mock.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_token_is_fetched_under_lock(self, redis_mock, fetch):
+        """토큰이 없으면 락을 잡은 워커 하나만 갱신."""
+        redis_mock.get.return_value = None
+        redis_mock.set.return_value = True
+
+        cache = NaverTokenCache(redis_client=redis_mock, refresh_fraction=0.8)
+        token = await cache.get_token(fetch)
+
+        assert token.access_token == "fresh"
+        fetch.assert_called_once()
+        lock_call, store_call = redis_mock.set.call_args_list
+        assert lock_call.args[0] == "naver:oauth:token:lock"
+        assert lock_call.kwargs["nx"] is True
+        assert store_call.args[0] == "naver:oauth:token"
+        assert store_call.kwargs["px"] == 10800 * 1000
+        assert token.refresh_at - time.time() == pytest.approx(10800 * 0.8, abs=5)
+        redis_mock.eval.assert_called_once()  # lock released
+
+    @pytest.mark.asyncio
+    async def test_stale_token_used_while_other_worker_refreshes(self, redis_mock, fetch):
+        """다른 워커가 갱신 중이면 아직 유효한 토큰 사용."""
+        redis_mock.get.return_value = cached_token(refresh_in=-1, expires_in=60)
+        redis_mock.set.return_value = None  # lock held elsewhere
+
+        cache = NaverTokenCache(redis_client=redis_mock)
+        token = await cache.get_token(fetch)
+
+        assert token.access_token == "cached"
+        fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejected_token_waits_for_refresher(self, redis_mock, fetch):
+        """401 받은 토큰은 쓰지 않고 다른 워커의 갱신을 기다림."""
+        redis_mock.get.side_effect = [
+            cached_token("old"),
+            cached_token("old"),
+            cached_token("new"),
+        ]
+        redis_mock.set.return_value = None
+
+        cache = NaverTokenCache(redis_client=redis_mock, poll_interval=0.001)
+        token = await cache.get_token(fetch, rejected="old")
+
+        assert token.access_token == "new"
+        fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out(self, redis_mock, fetch):
+        """갱신이 끝나지 않으면 TimeoutError."""
+        redis_mock.get.return_value = None
+        redis_mock.set.return_value = None
+
+        cache = NaverTokenCache(redis_client=redis_mock, wait_timeout=0.01, poll_interval=0.001)
+
+        with pytest.raises(TimeoutError):
+            await cache.get_token(fetch)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_only_drops_matching_token(self, redis_mock):
+        """invalidate는 같은 토큰일 때만 삭제."""
+        redis_mock.get.return_value = cached_token("newer")
+
+        cache = NaverTokenCache(redis_client=redis_mock)
+        await cache.invalidate("older")
+
+        redis_mock.delete.assert_not_called()
@@ -0,0 +1 @@
+"""Validator tests."""
@@ -0,0 +1,139 @@
+"""Forbidden word validator unit tests."""
+
+import re
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.validators.forbidden_word_validator import (
+    ForbiddenWordAutomaton,
+    ForbiddenWordDictionary,
+    ForbiddenWordValidator,
+    get_automaton,
+)
+
+
+def regex_errors(words, text):
+    """Reference implementation (one re.search per word)."""
+    return [
+        f"Forbidden word detected: '{word}'"
+        for word in words
+        if re.search(re.escape(word), text, re.IGNORECASE)
+    ]
+
+
+@pytest.mark.unit
+class TestForbiddenWordAutomaton:
+    """Test Aho–Corasick matching."""
+
+    def test_reports_overlapping_matches_with_positions(self):
+        """겹치는 단어도 모두 위치와 함께 보고."""
+        automaton = ForbiddenWordAutomaton(["he", "she", "his", "hers"])
+
+        matches = automaton.find_all("ushers")
+
+        assert [(m.word, m.start, m.end) for m in matches] == [
+            ("she", 1, 4),
+            ("he", 2, 4),
+            ("hers", 2, 6),
+        ]
+
+    def test_case_insensitive(self):
+        """대소문자 구분 없이 매칭."""
+        automaton = ForbiddenWordAutomaton(["Best"])
+
+        matches = automaton.find_all("the BEST price")
+
+        assert [(m.word, m.start) for m in matches] == [("Best", 4)]
+
+    def test_automaton_is_shared_per_dictionary(self):
+        """같은 사전은 프로세스당 한 번만 빌드."""
+        assert get_automaton(("완치", "의약품")) is get_automaton(("완치", "의약품"))
+
+
+@pytest.mark.unit
+class TestForbiddenWordValidator:
+    """Test forbidden word validation."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "질병 완치 보장, 무조건 100% 효과",
+            "일반 면 티셔츠",
+            "COVID 치료제 아님",
+            "",
+        ],
+    )
+    def test_errors_match_regex_implementation(self, text):
+        """기존 정규식 구현과 동일한 오류 (사전 순서)."""
+        validator = ForbiddenWordValidator()
+
+        result = validator.validate(text)
+
+        assert result.errors == regex_errors(ForbiddenWordValidator.DEFAULT_FORBIDDEN_WORDS, text)
+        assert result.is_valid == (not result.errors)
+
+    def test_custom_words(self):
+        """사용자 지정 사전 사용."""
+        validator = ForbiddenWordValidator(["짝퉁"])
+
+        result = validator.validate_product("명품 짝퉁 가방", "완치")
+
+        assert result.errors == ["Forbidden word detected: '짝퉁'"]
+        assert result.matches[0].start == 3
+
+
+@pytest.mark.unit
+class TestForbiddenWordDictionary:
+    """Test hot reload from the database."""
+
+    def db(self, version, words):
+        db = SimpleNamespace()
+        db.execute = AsyncMock(
+            side_effect=[
+                SimpleNamespace(one=lambda: version),
+                SimpleNamespace(scalars=lambda: iter(words)),
+            ]
+        )
+        return db
+
+    @pytest.mark.asyncio
+    async def test_reload_replaces_words(self):
+        """DB 사전이 바뀌면 재시작 없이 교체."""
+        dictionary = ForbiddenWordDictionary(["완치"], reload_interval=0)
+        db = self.db((1, datetime.now(timezone.utc)), ["짝퉁"])
+
+        assert await dictionary.reload(db) is True
+        assert dictionary.automaton.words == ["짝퉁"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_dictionary_is_not_rebuilt(self):
+        """버전이 같으면 단어 목록을 다시 읽지 않음."""
+        version = (1, datetime.now(timezone.utc))
+        dictionary = ForbiddenWordDictionary(["완치"], reload_interval=0)
+        await dictionary.reload(self.db(version, ["짝퉁"]))
+
+        db = self.db(version, ["짝퉁"])
+        assert await dictionary.reload(db) is False
+        assert db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_reload_is_throttled(self):
+        """reload_interval 내에는 DB 조회 생략."""
+        dictionary = ForbiddenWordDictionary(["완치"], reload_interval=300)
+        await dictionary.reload(self.db((1, None), ["짝퉁"]))
+
+        db = self.db((2, None), ["가품"])
+        assert await dictionary.reload(db) is False
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_table_keeps_defaults(self):
+        """DB에 단어가 없으면 기본 사전 유지."""
+        dictionary = ForbiddenWordDictionary(["완치"], reload_interval=0)
+
+        await dictionary.reload(self.db((0, None), []))
+
+        assert dictionary.automaton.words == ["완치"]
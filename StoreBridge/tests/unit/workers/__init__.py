@@ -0,0 +1 @@
+"""Worker unit tests."""
@@ -0,0 +1,80 @@
+"""Worker runtime unit tests."""
+
+import asyncio
+
+import pytest
+
+from app.connectors.naver_client import NaverClient
+from app.services.image_pipeline import ImagePipeline
+from app.services.naver_dispatcher import NaverDispatchClient
+from app.workers import runtime as runtime_module
+from app.workers import tasks
+from app.workers.runtime import WorkerRuntime, get_runtime
+
+
+@pytest.fixture
+def worker_runtime():
+    """Fresh runtime, closed after the test."""
+    rt = WorkerRuntime()
+    yield rt
+    rt.loop.close()
+
+
+@pytest.mark.unit
+class TestWorkerRuntime:
+    """Test per-process worker runtime."""
+
+    def test_tasks_share_one_event_loop(self, worker_runtime):
+        """모든 태스크가 같은 이벤트 루프에서 실행."""
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = worker_runtime.run(current_loop())
+        second = worker_runtime.run(current_loop())
+
+        assert first is second is worker_runtime.loop
+
+    def test_naver_client_is_reused(self, worker_runtime):
+        """NaverClient는 프로세스당 하나."""
+        client = worker_runtime.naver_client()
+
+        assert isinstance(client, NaverClient)
+        assert worker_runtime.naver_client() is client
+        assert client.rate_limiter is worker_runtime.rate_limiter
+        assert client.token_cache is worker_runtime.token_cache
+
+    def test_dispatch_client_shares_redis(self, worker_runtime, monkeypatch):
+        """디스패처 모드에서는 공유 Redis 연결 사용."""
+        monkeypatch.setattr("app.config.settings.naver_dispatcher_enabled", True)
+
+        client = worker_runtime.naver_client()
+
+        assert isinstance(client, NaverDispatchClient)
+        assert client.redis is worker_runtime.redis
+
+    def test_image_downloads_share_one_http_client(self, worker_runtime, monkeypatch):
+        """이미지 다운로드는 런타임의 HTTP 클라이언트(연결 풀)를 재사용."""
+        monkeypatch.setattr("app.config.settings.image_pipeline_enabled", True)
+        monkeypatch.setattr(runtime_module, "_runtime", worker_runtime)
+        clients = []
+
+        async def process(self, urls):
+            clients.append(self.http_client)
+
+        monkeypatch.setattr(ImagePipeline, "process", process)
+
+        for _ in range(2):
+            worker_runtime.run(tasks._upload_images(None, []))
+
+        assert clients == [worker_runtime.image_http_client] * 2
+
+    def test_get_runtime_creates_once(self, monkeypatch):
+        """get_runtime은 최초 호출 시 한 번만 생성."""
+        monkeypatch.setattr(runtime_module, "_runtime", None)
+
+        rt = get_runtime()
+        try:
+            assert get_runtime() is rt
+        finally:
+            rt.loop.close()
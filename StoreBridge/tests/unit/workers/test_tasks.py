@@ -0,0 +1,501 @@
+"""Registration task unit tests."""
+
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.connectors.naver_client import NaverRateLimitError
+from app.models import Job, JobStatus, JobType, Product, ProductRegistration, State
+from app.services.category_resolver import ResolvedCategory
+from app.services.option_mapper import OptionMapper
+from app.workers import tasks
+
+
+class FakeSession:
+    """AsyncSession stand-in that serves selects and records bulk UPDATE rows."""
+
+    def __init__(self, products, registrations):
+        self.results = [products, registrations]
+        self.updates = []
+        self.added = []
+        self.commit = AsyncMock()
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def execute(self, stmt, params=None):
+        if params is not None:
+            self.updates.extend(params)
+            return None
+        return SimpleNamespace(scalars=lambda rows=self.results.pop(0): iter(rows))
+
+
+def make_product(name="면 티셔츠", price=10000):
+    product = Product(
+        id=uuid.uuid4(),
+        domeggook_item_id=str(uuid.uuid4()),
+        name=name,
+        price=price,
+        category="의류",
+        images=["https://example.com/1.jpg"],
+        options={"raw": []},
+        raw_data={"description": "편안한 면 티셔츠"},
+    )
+    registration = ProductRegistration(
+        id=uuid.uuid4(),
+        product_id=product.id,
+        state=State.PENDING,
+        seller_product_code=f"DG-{product.domeggook_item_id}",
+        retry_count=0,
+    )
+    return product, registration
+
+
+@pytest.fixture
+def job_events(monkeypatch):
+    """Capture job events instead of publishing them to Redis."""
+    events = SimpleNamespace(status=AsyncMock(), progress=AsyncMock())
+    monkeypatch.setattr(tasks, "_events", lambda: events)
+    return events
+
+
+@pytest.fixture
+def job_counters(monkeypatch):
+    """Capture job counter updates instead of sending them to Redis."""
+    counters = SimpleNamespace(
+        record=AsyncMock(return_value={}), increment=AsyncMock(return_value={})
+    )
+    monkeypatch.setattr(tasks, "_counters", lambda: counters)
+    return counters
+
+
+@pytest.fixture
+def job_quota(monkeypatch):
+    """Capture quota ledger calls instead of sending them to Redis."""
+    quota = SimpleNamespace(draw=AsyncMock(), release=AsyncMock())
+    monkeypatch.setattr(tasks, "_quota", lambda: quota)
+    return quota
+
+
+@pytest.fixture
+def batch_env(monkeypatch, job_events, job_counters, job_quota):
+    """Patch session, Naver client and re-enqueue for the batch task."""
+
+    def install(products, registrations, register_product, categories=None):
+        categories = categories or {}
+        db = FakeSession(products, registrations)
+
+        @asynccontextmanager
+        async def session():
+            yield db
+
+        naver = SimpleNamespace(register_product=AsyncMock(side_effect=register_product))
+        relay = AsyncMock(return_value=0)
+        monkeypatch.setattr("app.config.settings.image_pipeline_enabled", False)
+        monkeypatch.setattr(tasks.forbidden_words, "reload", AsyncMock(return_value=False))
+        monkeypatch.setattr(tasks, "_resolve_categories", AsyncMock(return_value=categories))
+        monkeypatch.setattr(tasks, "get_async_session", session)
+        monkeypatch.setattr(tasks, "_naver_client", lambda priority="normal": naver)
+        monkeypatch.setattr(tasks, "relay_outbox", relay)
+        return db, naver, relay
+
+    return install
+
+
+@pytest.mark.unit
+class TestRegisterProductsBatch:
+    """Test batched product registration."""
+
+    @pytest.mark.asyncio
+    async def test_registers_batch_with_bulk_updates(self, batch_env):
+        """두 번의 조회 후 상태 전이는 묶어서 bulk UPDATE로 기록."""
+        pairs = [make_product() for _ in range(3)]
+        db, naver, _ = batch_env(
+            [p for p, _ in pairs],
+            [r for _, r in pairs],
+            lambda data: {"success": True, "originProductNo": "N-1"},
+        )
+
+        result = await tasks._register_products_batch_async([str(p.id) for p, _ in pairs])
+
+        assert result["completed"] == 3
+        assert naver.register_product.await_count == 3
+        # Changes committed together collapse into one row per registration
+        assert {row["id"]: row["state"] for row in db.updates} == {
+            r.id: State.COMPLETED for _, r in pairs
+        }
+        assert len(db.updates) == 3
+        assert db.commit.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_naver_calls_draw_down_job_quota(self, batch_env, job_quota):
+        """등록 호출 수만큼 작업별 할당량 예약을 차감."""
+        job_id = uuid.uuid4()
+        pairs = [make_product() for _ in range(2)]
+        for _, registration in pairs:
+            registration.job_id = job_id
+        batch_env(
+            [p for p, _ in pairs],
+            [r for _, r in pairs],
+            lambda data: {"success": True, "originProductNo": "N-1"},
+        )
+
+        await tasks._register_products_batch_async([str(p.id) for p, _ in pairs])
+
+        job_quota.draw.assert_awaited_once_with("naver", {str(job_id): 2})
+
+    @pytest.mark.asyncio
+    async def test_invalid_products_go_to_manual_review(self, batch_env):
+        """검증 실패 상품은 등록하지 않고 수동 검토로."""
+        valid = make_product()
+        invalid = make_product(price=0)
+        db, naver, _ = batch_env(
+            [valid[0], invalid[0]],
+            [valid[1], invalid[1]],
+            lambda data: {"success": True, "originProductNo": "N-1"},
+        )
+
+        result = await tasks._register_products_batch_async([str(valid[0].id), str(invalid[0].id)])
+
+        assert result["manual_review"] == 1
+        assert naver.register_product.await_count == 1
+        review = [row for row in db.updates if row["state"] == State.MANUAL_REVIEW]
+        assert review[0]["id"] == invalid[1].id
+
+    @pytest.mark.asyncio
+    async def test_finished_registrations_are_published_per_job(self, batch_env, job_events):
+        """최종 상태에 도달한 등록만 작업별로 묶어 진행 이벤트로 발행."""
+        job_id = uuid.uuid4()
+        valid = make_product()
+        invalid = make_product(price=0)
+        for _, registration in (valid, invalid):
+            registration.job_id = job_id
+        batch_env(
+            [valid[0], invalid[0]],
+            [valid[1], invalid[1]],
+            lambda data: {"success": True, "originProductNo": "N-1"},
+        )
+
+        await tasks._register_products_batch_async([str(valid[0].id), str(invalid[0].id)])
+
+        assert [c.args + (c.kwargs,) for c in job_events.progress.await_args_list] == [
+            (
+                job_id,
+                {"success": 1, "failed": 1, "errors": {"MANUAL_REVIEW": 1}, "counters": None},
+            ),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_every_transition_is_counted(self, batch_env, job_counters):
+        """모든 상태 전이를 작업 카운터에 반영."""
+        job_id = uuid.uuid4()
+        product, registration = make_product()
+        registration.job_id = job_id
+        batch_env(
+            [product], [registration], lambda data: {"success": True, "originProductNo": "N-1"}
+        )
+
+        await tasks._register_products_batch_async([str(product.id)])
+
+        moves = [
+            (t.from_state, t.to_state)
+            for call in job_counters.record.await_args_list
+            for t in call.args[0]
+        ]
+        assert moves == [
+            (State.PENDING, State.UPLOADING),
+            (State.UPLOADING, State.REGISTERING),
+            (State.REGISTERING, State.COMPLETED),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failures_are_requeued_as_one_batch(self, batch_env):
+        """실패 상품은 상태 변경과 같은 트랜잭션에서 하나의 배치로 재시도 예약."""
+        pairs = [make_product() for _ in range(2)]
+
+        def fail(data):
+            raise RuntimeError("Rate limit exceeded")
+
+        db, _, relay = batch_env([p for p, _ in pairs], [r for _, r in pairs], fail)
+
+        result = await tasks._register_products_batch_async([str(p.id) for p, _ in pairs])
+
+        assert result["retrying"] == 2
+        [message] = db.added
+        assert message.task_name == tasks.register_products_batch_task.name
+        assert sorted(message.args[0]) == sorted(str(p.id) for p, _ in pairs)
+        assert message.countdown == 120
+        relay.assert_awaited_once()
+        assert {row["retry_count"] for row in db.updates if "retry_count" in row} == {1}
+
+    @pytest.mark.asyncio
+    async def test_throttled_products_retry_soon_without_using_retries(
+        self, batch_env, monkeypatch
+    ):
+        """429로 실패한 상품은 재시도 횟수 증가 없이 짧은 지연 후 재시도."""
+        monkeypatch.setattr("app.config.settings.registration_throttle_retry_delay", 5)
+        pairs = [make_product() for _ in range(2)]
+
+        def throttled(data):
+            raise NaverRateLimitError("Rate limit exceeded")
+
+        db, _, _ = batch_env([p for p, _ in pairs], [r for _, r in pairs], throttled)
+
+        result = await tasks._register_products_batch_async([str(p.id) for p, _ in pairs])
+
+        assert (result["throttled"], result["retrying"], result["failed"]) == (2, 0, 0)
+        [message] = db.added
+        assert message.countdown == 5
+        assert {row["retry_count"] for row in db.updates if "retry_count" in row} == {0}
+        assert {row["state"] for row in db.updates if "retry_count" in row} == {State.RETRYING}
+
+    @pytest.mark.asyncio
+    async def test_throttled_image_upload_does_not_use_a_retry(self, batch_env, monkeypatch):
+        """이미지 업로드 단계의 429도 재시도 횟수 증가 없이 재시도."""
+        product, registration = make_product()
+        db, naver, _ = batch_env([product], [registration], lambda data: {})
+        monkeypatch.setattr(
+            tasks, "_upload_images", AsyncMock(side_effect=NaverRateLimitError("throttled"))
+        )
+
+        result = await tasks._register_products_batch_async([str(product.id)])
+
+        assert (result["throttled"], result["failed"]) == (1, 0)
+        naver.register_product.assert_not_awaited()
+        assert {row["retry_count"] for row in db.updates if "retry_count" in row} == {0}
+
+    @pytest.mark.asyncio
+    async def test_already_registered_products_are_skipped(self, batch_env):
+        """이미 완료된 등록은 건너뜀 (메시지 재전달 대비)."""
+        product, registration = make_product()
+        registration.state = State.COMPLETED
+        db, naver, _ = batch_env([product], [registration], lambda data: {})
+
+        result = await tasks._register_products_batch_async([str(product.id)])
+
+        assert result["skipped"] == 1
+        naver.register_product.assert_not_awaited()
+        assert db.updates == []
+
+    @pytest.mark.asyncio
+    async def test_mapped_category_is_used(self, batch_env):
+        """매핑된 네이버 카테고리와 기본 속성으로 등록."""
+        product, registration = make_product()
+        category = ResolvedCategory(
+            naver_category_id="50000803",
+            required_attributes={"requiredAttributes": [{"name": "소재"}]},
+            default_attributes={"소재": "면"},
+        )
+        _, naver, _ = batch_env(
+            [product],
+            [registration],
+            lambda data: {"success": True, "originProductNo": "N-1"},
+            categories={"의류": category},
+        )
+
+        await tasks._register_products_batch_async([str(product.id)])
+
+        payload = naver.register_product.await_args.args[0]["originProduct"]
+        assert payload["categoryId"] == "50000803"
+        assert payload["attributes"] == {"소재": "면"}
+
+    @pytest.mark.asyncio
+    async def test_missing_required_attribute_goes_to_manual_review(self, batch_env):
+        """기본값 없는 필수 속성이 있으면 수동 검토."""
+        product, registration = make_product()
+        category = ResolvedCategory(
+            naver_category_id="50000803",
+            required_attributes={"requiredAttributes": [{"name": "제조일자"}]},
+        )
+        db, naver, _ = batch_env(
+            [product], [registration], lambda data: {}, categories={"의류": category}
+        )
+
+        result = await tasks._register_products_batch_async([str(product.id)])
+
+        assert result["manual_review"] == 1
+        naver.register_product.assert_not_awaited()
+        assert db.updates[0]["error_message"] == "Missing required attribute: '제조일자'"
+
+    @pytest.mark.asyncio
+    async def test_unmapped_category_uses_default(self, batch_env):
+        """매핑이 없으면 기본 카테고리 사용."""
+        product, registration = make_product()
+        _, naver, _ = batch_env(
+            [product], [registration], lambda data: {"success": True, "originProductNo": "N-1"}
+        )
+
+        await tasks._register_products_batch_async([str(product.id)])
+
+        payload = naver.register_product.await_args.args[0]["originProduct"]
+        assert payload["categoryId"] == "50000000"
+        assert "attributes" not in payload
+
+
+@pytest.mark.unit
+class TestSyncPayloadBuilder:
+    """Test sync updates sent as full products."""
+
+    @pytest.mark.asyncio
+    async def test_sync_update_carries_the_full_registration_payload(self, monkeypatch):
+        """동기화 업데이트는 등록과 같은 전체 상품 페이로드를 전송 (PUT 전체 교체)."""
+        monkeypatch.setattr("app.config.settings.image_pipeline_enabled", False)
+        monkeypatch.setattr(tasks, "_resolve_categories", AsyncMock(return_value={}))
+        product, registration = make_product(price=12000)
+        product.raw_data["stock_quantity"] = 7
+
+        build = tasks._sync_payload_builder(FakeSession([], []))
+        payload = (await build(product, registration))["originProduct"]
+
+        expected = tasks._build_naver_product(product, registration, OptionMapper())
+        assert payload.keys() == expected["originProduct"].keys()
+        assert payload["name"] == product.name
+        assert payload["salePrice"] == 12000
+        assert payload["stockQuantity"] == 7
+        assert payload["images"] == [{"url": "https://example.com/1.jpg"}]
+        assert payload["sellerProductCode"] == registration.seller_product_code
+        assert "categoryId" in payload and "detailContent" in payload
+
+
+@pytest.mark.unit
+class TestClaimJob:
+    """Test duplicate deliveries of job tasks."""
+
+    @pytest.mark.asyncio
+    async def test_redelivery_while_running_is_skipped(self, monkeypatch, job_events):
+        """실행 중인 작업의 재전달 메시지는 조건부 UPDATE에서 선점에 실패하고 건너뜀."""
+        started_at = datetime.now(timezone.utc)
+        job = Job(
+            id=uuid.uuid4(),
+            type=JobType.IMPORT,
+            status=JobStatus.RUNNING,
+            config={},
+            started_at=started_at,
+        )
+        statements = []
+
+        class JobSession:
+            commit = AsyncMock()
+            refresh = AsyncMock()
+
+            async def execute(self, stmt):
+                statements.append(stmt)
+                # The claim's UPDATE returns no row: the job is no longer PENDING
+                row = None if stmt.is_update else job
+                return SimpleNamespace(scalar_one_or_none=lambda: row)
+
+        @asynccontextmanager
+        async def session():
+            yield JobSession()
+
+        monkeypatch.setattr(tasks, "get_async_session", session)
+
+        result = await tasks._import_products_async(str(job.id))
+
+        assert result == {"job_id": str(job.id), "skipped": True}
+        claim = str(statements[1].compile(dialect=postgresql.dialect()))
+        assert "jobs.status = %(status_1)s" in claim
+        assert "RETURNING jobs.id" in claim
+        assert job.started_at == started_at
+        job_events.status.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestRecoverStaleRegistrations:
+    """Test recovery of registrations left mid-batch."""
+
+    def test_stale_threshold_outlasts_the_task_time_limit(self, monkeypatch):
+        """실행 중인 배치를 재시도하지 않도록 작업 시간 제한 + 여유 시간 이후에만 복구."""
+        monkeypatch.setattr("app.config.settings.celery_task_time_limit", 1800)
+        monkeypatch.setattr("app.config.settings.registration_stale_margin", 300)
+
+        assert tasks.settings.registration_stale_after == 2100
+
+    @pytest.mark.asyncio
+    async def test_stale_registrations_are_retried_at_job_priority(
+        self, monkeypatch, job_events, job_counters
+    ):
+        """중단된 UPLOADING/REGISTERING 등록을 작업 우선순위 큐로 재시도, 한도 초과 시 실패."""
+        job = SimpleNamespace(id=uuid.uuid4(), config={"priority": "urgent"})
+        (_, uploading), (_, exhausted) = make_product(), make_product()
+        uploading.state, uploading.job_id = State.UPLOADING, job.id
+        exhausted.state, exhausted.retry_count = State.REGISTERING, 2
+        db = FakeSession([uploading, exhausted], [job])
+
+        @asynccontextmanager
+        async def session():
+            yield db
+
+        monkeypatch.setattr(tasks, "get_async_session", session)
+        monkeypatch.setattr(tasks, "relay_outbox", AsyncMock(return_value=1))
+
+        assert await tasks._recover_stale_registrations_async() == {"retrying": 1, "failed": 1}
+        [message] = db.added
+        assert message.args == [[str(uploading.product_id)], "urgent"]
+        assert message.queue == "register.urgent"
+        assert {row["id"]: row["state"] for row in db.updates} == {
+            uploading.id: State.RETRYING,
+            exhausted.id: State.FAILED,
+        }
+
+
+@pytest.mark.unit
+class TestFlushJobCounters:
+    """Test flushing Redis job counters to the jobs table."""
+
+    @pytest.mark.asyncio
+    async def test_dirty_jobs_are_written_in_one_update(self, monkeypatch):
+        """변경된 작업만 한 번의 bulk UPDATE로 기록."""
+        job_id = str(uuid.uuid4())
+        counters = SimpleNamespace(
+            pop_dirty=AsyncMock(return_value=[job_id]),
+            get_many=AsyncMock(return_value=[{"COMPLETED": 4, "MANUAL_REVIEW": 1, "PENDING": 5}]),
+            mark_dirty=AsyncMock(),
+        )
+        db = FakeSession([], [])
+
+        @asynccontextmanager
+        async def session():
+            yield db
+
+        monkeypatch.setattr(tasks, "_counters", lambda: counters)
+        monkeypatch.setattr(tasks, "get_async_session", session)
+
+        assert await tasks._flush_job_counters_async() == {"flushed": 1}
+        assert db.updates == [{"id": uuid.UUID(job_id), "success_count": 4, "failed_count": 1}]
+        counters.mark_dirty.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self, monkeypatch):
+        """DB 기록 실패 시 다음 주기에 다시 기록."""
+        counters = SimpleNamespace(
+            pop_dirty=AsyncMock(return_value=["not-a-uuid"]),
+            get_many=AsyncMock(return_value=[{}]),
+            mark_dirty=AsyncMock(),
+        )
+        monkeypatch.setattr(tasks, "_counters", lambda: counters)
+
+        with pytest.raises(ValueError):
+            await tasks._flush_job_counters_async()
+        counters.mark_dirty.assert_awaited_once_with(["not-a-uuid"])
+
+
+@pytest.mark.unit
+class TestStageRegistrations:
+    """Test registration priority lanes."""
+
+    def test_batches_go_to_priority_queue(self, monkeypatch):
+        """작업 우선순위별 큐로 배치를 아웃박스에 적재."""
+        db = FakeSession([], [])
+        monkeypatch.setattr("app.config.settings.registration_batch_size", 2)
+
+        tasks._stage_registrations(db, [uuid.uuid4() for _ in range(3)], "urgent")
+
+        assert [message.queue for message in db.added] == ["register.urgent"] * 2
+        assert [message.args[1] for message in db.added] == ["urgent"] * 2
+        assert [len(message.args[0]) for message in db.added] == [2, 1]